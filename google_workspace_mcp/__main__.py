@@ -1,15 +1,26 @@
 """Entry point for running the Google Workspace MCP server as a module."""
 
 import asyncio
+
 from google_workspace_mcp.server_fastmcp import mcp
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when the optional dependency is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Entry point for console script."""
     # Import all tool modules to register their tools
     from google_workspace_mcp import tools  # noqa: F401
 
     # Run the FastMCP server
+    _install_uvloop()
     mcp.run()
 
 
@@ -1,14 +1,19 @@
 """OAuth 2.0 authentication handler for Google Workspace APIs."""
 
+import json
 import os
 import pickle
-from typing import Optional, List
+import tempfile
+import threading
+from typing import Any, Dict, Optional, List, Tuple
 from pathlib import Path
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 
 from ..utils.logger import setup_logger
 from ..utils.error_handler import AuthenticationError
@@ -27,10 +32,38 @@ SCOPES = [
 
 # Default config directory
 DEFAULT_CONFIG_DIR = Path.home() / '.config' / 'gw-mcp'
-TOKEN_FILE = 'token.pickle'
+TOKEN_FILE = 'token.json'
+LEGACY_TOKEN_FILE = 'token.pickle'
 CREDENTIALS_FILE = 'credentials.json'
 
 
+class ThreadLocalHttp:
+    """httplib2-compatible transport with one AuthorizedHttp per thread.
+
+    httplib2.Http is not thread-safe, so service objects whose requests are
+    executed from worker threads must not share a single connection.
+    """
+
+    def __init__(self, credentials: Credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    @property
+    def http(self) -> AuthorizedHttp:
+        """Get the calling thread's authorized transport."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def request(self, *args, **kwargs):
+        return self.http.request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+
 class OAuthHandler:
     """Handles OAuth 2.0 authentication for Google Workspace APIs."""
 
@@ -50,6 +83,7 @@ class OAuthHandler:
 
         self.scopes = scopes or SCOPES
         self.credentials: Optional[Credentials] = None
+        self._services: Dict[Tuple[str, str], Any] = {}
 
         logger.info(f"OAuth handler initialized with config dir: {self.config_dir}")
 
@@ -58,6 +92,11 @@ class OAuthHandler:
         """Get path to token file."""
         return self.config_dir / TOKEN_FILE
 
+    @property
+    def legacy_token_path(self) -> Path:
+        """Get path to the pickle token file used by older versions."""
+        return self.config_dir / LEGACY_TOKEN_FILE
+
     @property
     def credentials_path(self) -> Path:
         """Get path to credentials file."""
@@ -70,27 +109,51 @@ class OAuthHandler:
             Credentials object if found and valid, None otherwise
         """
         if not self.token_path.exists():
+            if self.legacy_token_path.exists():
+                return self._migrate_legacy_token()
             logger.debug("Token file not found")
             return None
 
         try:
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+            with open(self.token_path, 'r', encoding='utf-8') as token:
+                creds = Credentials.from_authorized_user_info(json.load(token))
                 logger.info("Loaded credentials from token file")
                 return creds
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
             return None
 
+    def _migrate_legacy_token(self) -> Optional[Credentials]:
+        """Convert a pickle token file to the JSON format."""
+        try:
+            with open(self.legacy_token_path, 'rb') as token:
+                creds = pickle.load(token)
+            self.save_credentials(creds)
+            self.legacy_token_path.unlink()
+            logger.info("Migrated pickle token file to JSON")
+            return creds
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy credentials: {e}")
+            return None
+
     def save_credentials(self, credentials: Credentials) -> None:
         """Save credentials to token file.
 
+        The file is written to a temporary sibling and renamed into place,
+        so concurrent readers never observe a partially written token.
+
         Args:
             credentials: Credentials to save
         """
         try:
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(credentials, token)
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix='.token-')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as token:
+                    token.write(credentials.to_json())
+                os.replace(tmp_path, self.token_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             logger.info("Saved credentials to token file")
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
@@ -125,6 +188,32 @@ class OAuthHandler:
                 original_error=e
             )
 
+    def authenticate_silently(self) -> bool:
+        """Authenticate from the stored token without starting the browser flow.
+
+        Expired credentials are refreshed when a refresh token is available.
+
+        Returns:
+            True if valid credentials are now loaded, False otherwise
+        """
+        if self.credentials is not None and self.credentials.valid:
+            return True
+
+        creds = self.load_credentials()
+        if creds is None:
+            return False
+        if not creds.valid:
+            if not (creds.expired and creds.refresh_token):
+                return False
+            try:
+                creds = self.refresh_credentials(creds)
+            except AuthenticationError:
+                return False
+
+        self._services.clear()
+        self.credentials = creds
+        return True
+
     def authenticate(self, force_reauth: bool = False) -> Credentials:
         """Perform OAuth authentication flow.
 
@@ -137,6 +226,9 @@ class OAuthHandler:
         Raises:
             AuthenticationError: If authentication fails
         """
+        # Built services hold the previous credentials
+        self._services.clear()
+
         # Load existing credentials
         if not force_reauth:
             creds = self.load_credentials()
@@ -185,6 +277,9 @@ class OAuthHandler:
     def get_service(self, service_name: str, version: str):
         """Get authenticated Google API service.
 
+        Services are built once per (name, version) and reused; the
+        credentials refresh themselves in place when the token expires.
+
         Args:
             service_name: Name of the service (e.g., 'drive', 'docs')
             version: API version (e.g., 'v3', 'v1')
@@ -195,13 +290,22 @@ class OAuthHandler:
         Raises:
             AuthenticationError: If not authenticated
         """
+        key = (service_name, version)
+        if key in self._services:
+            return self._services[key]
+
         if not self.credentials:
             logger.info("No credentials, starting authentication")
             self.authenticate()
 
         try:
-            service = build(service_name, version, credentials=self.credentials)
+            service = build(
+                service_name,
+                version,
+                http=ThreadLocalHttp(self.credentials)
+            )
             logger.info(f"Built {service_name} {version} service")
+            self._services[key] = service
             return service
         except Exception as e:
             logger.error(f"Failed to build service: {e}")
@@ -220,6 +324,7 @@ class OAuthHandler:
                 logger.error(f"Failed to delete credentials: {e}")
 
         self.credentials = None
+        self._services.clear()
 
 
 # Global OAuth handler instance
@@ -17,12 +17,90 @@ All tools follow MCP best practices with:
 - Actionable error messages
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool
+
+from .auth.oauth_handler import get_oauth_handler
+from .services.registry import get_service
+from .utils.executor import run_blocking
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Services whose API clients are built while the server starts
+WARM_SERVICES = ('gmail', 'sheets')
+
+
+def _warm_up() -> None:
+    """Load stored credentials and build API clients ahead of the first call.
+
+    Does nothing when no usable token is stored, so the interactive OAuth
+    flow still only starts from a tool call.
+    """
+    if not get_oauth_handler().authenticate_silently():
+        return
+    for name in WARM_SERVICES:
+        get_service(name).service
+    logger.info(f"Warmed up services: {', '.join(WARM_SERVICES)}")
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up API clients in the background while the server runs."""
+    async def _warm():
+        try:
+            await run_blocking(_warm_up)
+        except Exception as e:
+            logger.warning("Service warm-up failed: %s", e)
+
+    warm_task = asyncio.create_task(_warm())
+    try:
+        yield
+    finally:
+        warm_task.cancel()
+
+
+class GoogleWorkspaceMCP(FastMCP):
+    """FastMCP server that builds its tool list once.
+
+    The tool set is fixed after the tool modules are imported, so the
+    Tool objects (names, descriptions, JSON schemas) are built on the
+    first tools/list request and reused until a tool is added or removed.
+
+    Tools return preformatted text, so they are registered as unstructured
+    unless a tool asks otherwise. FastMCP would otherwise also send every
+    result as {"result": <text>} structured content, serializing and
+    transmitting each payload twice.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._tool_list: Optional[List[Tool]] = None
+        super().__init__(*args, **kwargs)
+
+    def add_tool(self, *args, **kwargs) -> None:
+        if kwargs.get('structured_output') is None:
+            kwargs['structured_output'] = False
+        self._tool_list = None
+        super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, name: str) -> None:
+        self._tool_list = None
+        super().remove_tool(name)
+
+    async def list_tools(self) -> List[Tool]:
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+
 
 # Initialize FastMCP server
-mcp = FastMCP("google_workspace_mcp")
+mcp = GoogleWorkspaceMCP("google_workspace_mcp", lifespan=_lifespan)
 
 # NOTE: Tool modules are imported in __main__.py to avoid circular imports
 # Each tool module imports this mcp instance and uses @mcp.tool() decorators
 
-__all__ = ['mcp']
+__all__ = ['mcp', 'GoogleWorkspaceMCP']
@@ -2,9 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 from ..auth.oauth_handler import get_oauth_handler
+from .registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling
 from ..utils.rate_limiter import rate_limited_call
+from ..utils.executor import execute
 from ..utils.cache import cached_call, cache_key
 
 logger = setup_logger(__name__)
@@ -27,7 +29,7 @@ class DocsService:
     async def create_document(self, title: str) -> Dict[str, Any]:
         """Create new Google Docs document."""
         async def _create():
-            doc = self.service.documents().create(body={'title': title}).execute()
+            doc = await execute(self.service.documents().create(body={'title': title}))
             logger.info(f"Created document: {doc['title']} ({doc['documentId']})")
             return doc
 
@@ -37,7 +39,7 @@ class DocsService:
     async def read_document(self, document_id: str) -> Dict[str, Any]:
         """Read Google Docs document content."""
         async def _read():
-            doc = self.service.documents().get(documentId=document_id).execute()
+            doc = await execute(self.service.documents().get(documentId=document_id))
 
             # Extract text content
             content = []
@@ -73,10 +75,10 @@ class DocsService:
                 }
             }]
 
-            result = self.service.documents().batchUpdate(
+            result = await execute(self.service.documents().batchUpdate(
                 documentId=document_id,
                 body={'requests': requests}
-            ).execute()
+            ))
 
             logger.info(f"Updated document: {document_id}")
             return result
@@ -86,6 +88,4 @@ class DocsService:
     @with_error_handling
     async def delete_document(self, document_id: str) -> bool:
         """Delete Google Docs document (via Drive API)."""
-        from .drive_service import DriveService
-        drive = DriveService()
-        return await drive.delete_file(document_id)
+        return await get_service('drive').delete_file(document_id)
@@ -1,18 +1,130 @@
 """Google Drive service implementation."""
 
+import asyncio
+import codecs
 import io
+from datetime import datetime
 from typing import Any, Dict, List, Optional
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import (
+    BatchHttpRequest,
+    MediaFileUpload,
+    MediaIoBaseDownload,
+    MediaIoBaseUpload
+)
 
 from ..auth.oauth_handler import get_oauth_handler
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling, ResourceNotFoundError
 from ..utils.rate_limiter import rate_limited_call
-from ..utils.cache import cached_call, cache_key
+from ..utils.executor import execute, run_blocking
+from ..utils.cache import cached_call, cache_key, get_cache
 
 logger = setup_logger(__name__)
 
 
+# Media is transferred in chunks of this size, one HTTP request each
+# (must be a multiple of 256 KiB for resumable uploads)
+MEDIA_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Files up to this size are sent in one multipart request; larger ones use
+# a resumable session (one extra round trip to open it)
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+
+# Drive accepts at most 100 calls per batch request
+DRIVE_BATCH_SIZE = 100
+DRIVE_BATCH_URI = 'https://www.googleapis.com/batch/drive/v3'
+
+# File metadata (and so the modifiedTime that keys cached content) is
+# trusted for this long before Drive is asked again
+METADATA_TTL = 60
+
+# Namespace of the rendered responses memoized by the Drive tools. It is
+# cleared whenever a file is created, changed or deleted through this
+# service, including deletes made on behalf of the other services.
+RESPONSE_CACHE = "drive_responses"
+
+
+class _TextSink:
+    """Write-only file object that decodes UTF-8 chunks as they arrive.
+
+    Only the decoded text is kept, so reading a file never holds the raw
+    bytes and the decoded string at the same time.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        self._parts: List[str] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(self._decoder.decode(data))
+        return len(data)
+
+    def getvalue(self) -> str:
+        self._parts.append(self._decoder.decode(b'', final=True))
+        return ''.join(self._parts)
+
+
+def _download_media(request, fh) -> None:
+    """Stream a media request into a file object (blocking)."""
+    downloader = MediaIoBaseDownload(fh, request, chunksize=MEDIA_CHUNK_SIZE)
+
+    done = False
+    while not done:
+        status, done = downloader.next_chunk()
+
+
+def _download_text(request) -> str:
+    """Stream a media request and decode it as UTF-8 (blocking)."""
+    sink = _TextSink()
+    _download_media(request, sink)
+    return sink.getvalue()
+
+
+def _download_to_path(request, local_path: str) -> int:
+    """Stream a media request to a local file (blocking).
+
+    Returns:
+        Number of bytes written
+    """
+    with open(local_path, 'wb') as fh:
+        _download_media(request, fh)
+        return fh.tell()
+
+
+def _build_query(
+    query: Optional[str],
+    folder_id: Optional[str],
+    file_type: Optional[str],
+    modified_after: Optional[datetime]
+) -> Optional[str]:
+    """Build a files.list query string from search filters."""
+    query_parts = []
+    if query:
+        query_parts.append(f"name contains '{query}'")
+    if folder_id:
+        query_parts.append(f"'{folder_id}' in parents")
+    if file_type:
+        query_parts.append(f"mimeType='{file_type}'")
+    if modified_after:
+        query_parts.append(f"modifiedTime > '{modified_after.isoformat()}'")
+
+    return " and ".join(query_parts) if query_parts else None
+
+
+def _upload_media(request) -> Dict[str, Any]:
+    """Send a resumable upload chunk by chunk (blocking).
+
+    Returns:
+        Metadata of the uploaded file
+    """
+    response = None
+    while response is None:
+        status, response = request.next_chunk()
+        if status:
+            logger.debug(f"Uploaded {int(status.progress() * 100)}%")
+    return response
+
+
 class DriveService:
     """Google Drive service wrapper."""
 
@@ -28,99 +140,212 @@ class DriveService:
             self._service = self.oauth.get_service('drive', 'v3')
         return self._service
 
+    async def _skip_to_offset(
+        self,
+        list_method,
+        items_key: str,
+        offset: int,
+        max_page_size: int,
+        **kwargs
+    ) -> Optional[str]:
+        """Page past the first `offset` items, requesting only IDs and page tokens.
+
+        Drive may return short pages before the last one, so the offset is
+        reduced by the number of items actually returned, not the page size.
+
+        Returns:
+            Page token positioned at `offset`, or None if the listing ends first
+        """
+        page_token = None
+        while offset > 0:
+            results = await execute(list_method(
+                pageSize=min(offset, max_page_size),
+                pageToken=page_token,
+                fields=f"nextPageToken,{items_key}(id)",
+                **kwargs
+            ))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return None
+            offset -= len(results.get(items_key, []))
+        return page_token
+
     @with_error_handling
     async def search_files(
         self,
         query: Optional[str] = None,
         folder_id: Optional[str] = None,
         file_type: Optional[str] = None,
-        max_results: int = 100
-    ) -> List[Dict[str, Any]]:
+        max_results: int = 100,
+        modified_after: Optional[datetime] = None,
+        page_token: Optional[str] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
         """Search for files in Drive.
 
         Args:
             query: Search query string
             folder_id: Limit search to specific folder
             file_type: Filter by MIME type
-            max_results: Maximum number of results
+            max_results: Maximum number of results in the page
+            modified_after: Only match files modified after this time
+            page_token: Page token from a previous search
+            offset: Number of results to skip when no page token is given
 
         Returns:
-            List of file metadata dictionaries
+            Dictionary with the page of files and the next page token
         """
-        # Build query
-        query_parts = []
-        if query:
-            query_parts.append(f"name contains '{query}'")
-        if folder_id:
-            query_parts.append(f"'{folder_id}' in parents")
-        if file_type:
-            query_parts.append(f"mimeType='{file_type}'")
-
-        q = " and ".join(query_parts) if query_parts else None
+        q = _build_query(query, folder_id, file_type, modified_after)
 
         async def _search():
-            results = self.service.files().list(
+            token = page_token
+            if offset and not token:
+                token = await self._skip_to_offset(self.service.files().list, 'files', offset, 1000, q=q)
+                if token is None:
+                    return {"files": [], "next_page_token": None}
+
+            results = await execute(self.service.files().list(
                 q=q,
                 pageSize=min(max_results, 1000),
-                fields="files(id, name, mimeType, modifiedTime, size, parents)"
-            ).execute()
+                pageToken=token,
+                fields="nextPageToken, files(id, name, mimeType, modifiedTime, parents)"
+            ))
 
             files = results.get('files', [])
             logger.info(f"Found {len(files)} files")
-            return files
+            return {
+                "files": files,
+                "next_page_token": results.get('nextPageToken')
+            }
 
-        cache_k = cache_key("search", query, folder_id, file_type, max_results)
+        cache_k = cache_key(
+            "search", query, folder_id, file_type, max_results, modified_after, page_token, offset
+        )
         return await rate_limited_call("drive", cached_call, "drive", cache_k, _search)
 
+    async def _forget_metadata(self, file_id: str) -> None:
+        """Drop cached metadata so the next read sees the file's current state."""
+        await get_cache("drive_metadata").delete(cache_key("metadata", file_id))
+        await self._forget_responses()
+
+    async def _forget_responses(self) -> None:
+        """Drop the tools' memoized responses after a change to Drive."""
+        await get_cache(RESPONSE_CACHE).clear()
+
+    @with_error_handling
+    async def count_files(
+        self,
+        query: Optional[str] = None,
+        folder_id: Optional[str] = None,
+        file_type: Optional[str] = None,
+        modified_after: Optional[datetime] = None
+    ) -> int:
+        """Count files matching search filters.
+
+        Drive has no count endpoint, so this pages through every match
+        requesting only file IDs. Only call it when a total is needed.
+
+        Returns:
+            Number of matching files
+        """
+        q = _build_query(query, folder_id, file_type, modified_after)
+
+        async def _count():
+            total = 0
+            page_token = None
+            while True:
+                results = await execute(self.service.files().list(
+                    q=q,
+                    pageSize=1000,
+                    pageToken=page_token,
+                    fields="nextPageToken, files(id)"
+                ))
+                total += len(results.get('files', []))
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    return total
+
+        cache_k = cache_key("count", query, folder_id, file_type, modified_after)
+        return await rate_limited_call("drive", cached_call, "drive", cache_k, _count)
+
     @with_error_handling
     async def read_file(
         self,
         file_id: str,
-        mime_type: Optional[str] = None
+        mime_type: Optional[str] = None,
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
         """Read file content from Drive.
 
+        The metadata is cached for METADATA_TTL seconds; the content is
+        cached under the file's modifiedTime, so an edit invalidates it once
+        the metadata is refreshed. With force_refresh and an export type,
+        the export runs concurrently with the metadata fetch; otherwise an
+        unchanged file is served from the content cache.
+
         Args:
             file_id: File ID
             mime_type: Export MIME type for Google Docs files
+            force_refresh: Fetch fresh metadata instead of the cached copy
 
         Returns:
             Dictionary with file metadata and content
         """
-        async def _read():
-            # Get file metadata
-            file_meta = self.service.files().get(
+        async def _get_metadata():
+            return await execute(self.service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, modifiedTime, size"
-            ).execute()
+            ))
 
-            # Get file content
-            if mime_type or 'google-apps' in file_meta['mimeType']:
+        async def _get_content(export_mime: Optional[str]):
+            if export_mime:
                 # Export Google Workspace file
-                export_mime = mime_type or 'text/plain'
-                content = self.service.files().export(
+                request = self.service.files().export_media(
                     fileId=file_id,
                     mimeType=export_mime
-                ).execute()
+                )
             else:
                 # Download binary file
                 request = self.service.files().get_media(fileId=file_id)
-                fh = io.BytesIO()
-                downloader = MediaIoBaseDownload(fh, request)
+            return await run_blocking(_download_text, request)
+
+        meta_k = cache_key("metadata", file_id)
+        meta_cache = get_cache("drive_metadata")
+        if force_refresh:
+            await meta_cache.delete(meta_k)
+
+        if force_refresh and mime_type:
+            # The export request does not depend on the metadata
+            file_meta, content = await asyncio.gather(
+                rate_limited_call("drive", _get_metadata),
+                rate_limited_call("drive", _get_content, mime_type)
+            )
+            result = {"metadata": file_meta, "content": content}
+            await meta_cache.set(meta_k, file_meta, ttl=METADATA_TTL)
+            await get_cache("drive").set(
+                cache_key("read", file_id, mime_type, file_meta.get('modifiedTime')), result
+            )
+            logger.info(f"Read file: {file_meta['name']}")
+            return result
 
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
+        file_meta = await rate_limited_call(
+            "drive", cached_call, "drive_metadata", meta_k, _get_metadata, ttl=METADATA_TTL
+        )
 
-                content = fh.getvalue()
+        async def _read():
+            # Get file content
+            if mime_type or 'google-apps' in file_meta['mimeType']:
+                content = await _get_content(mime_type or 'text/plain')
+            else:
+                content = await _get_content(None)
 
             logger.info(f"Read file: {file_meta['name']}")
             return {
                 "metadata": file_meta,
-                "content": content if isinstance(content, str) else content.decode('utf-8', errors='ignore')
+                "content": content
             }
 
-        cache_k = cache_key("read", file_id, mime_type)
+        cache_k = cache_key("read", file_id, mime_type, file_meta.get('modifiedTime'))
         return await rate_limited_call("drive", cached_call, "drive", cache_k, _read)
 
     @with_error_handling
@@ -147,18 +372,19 @@ class DriveService:
             if folder_id:
                 file_metadata['parents'] = [folder_id]
 
-            media = MediaFileUpload(
+            # Text content is capped at 1 MB, so a single multipart request suffices
+            media = MediaIoBaseUpload(
                 io.BytesIO(content.encode()),
-                mimetype=mime_type,
-                resumable=True
+                mimetype=mime_type
             )
 
-            file = self.service.files().create(
+            file = await execute(self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, name, mimeType, webViewLink'
-            ).execute()
+            ))
 
+            await self._forget_responses()
             logger.info(f"Created file: {file['name']} ({file['id']})")
             return file
 
@@ -192,12 +418,13 @@ class DriveService:
                 kwargs['body'] = file_metadata
 
             if content:
-                kwargs['media_body'] = MediaFileUpload(
+                kwargs['media_body'] = MediaIoBaseUpload(
                     io.BytesIO(content.encode()),
-                    resumable=True
+                    mimetype='text/plain'
                 )
 
-            file = self.service.files().update(**kwargs).execute()
+            file = await execute(self.service.files().update(**kwargs))
+            await self._forget_metadata(file_id)
             logger.info(f"Updated file: {file_id}")
             return file
 
@@ -214,12 +441,85 @@ class DriveService:
             True if deleted successfully
         """
         async def _delete():
-            self.service.files().delete(fileId=file_id).execute()
+            await execute(self.service.files().delete(fileId=file_id))
+            await self._forget_metadata(file_id)
             logger.info(f"Deleted file: {file_id}")
             return True
 
         return await rate_limited_call("drive", _delete)
 
+    def _batch_request(self, operation: Dict[str, Any]):
+        """Build the API request for one drive_batch operation."""
+        op = operation['op']
+        if op == 'delete':
+            return self.service.files().delete(fileId=operation['file_id'])
+
+        if op == 'update':
+            return self.service.files().update(
+                fileId=operation['file_id'],
+                body={'name': operation['name']},
+                fields='id, name, modifiedTime'
+            )
+
+        # create_metadata
+        file_metadata = {'name': operation['name']}
+        if operation.get('mime_type'):
+            file_metadata['mimeType'] = operation['mime_type']
+        if operation.get('folder_id'):
+            file_metadata['parents'] = [operation['folder_id']]
+        return self.service.files().create(
+            body=file_metadata,
+            fields='id, name, mimeType, webViewLink'
+        )
+
+    def _execute_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send operations through the Drive batch endpoint (blocking)."""
+        results: List[Dict[str, Any]] = [{} for _ in operations]
+
+        def _collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is None:
+                results[index] = {"success": True, "result": response or {}}
+            else:
+                results[index] = {"success": False, "error": str(exception)}
+
+        for start in range(0, len(operations), DRIVE_BATCH_SIZE):
+            batch = BatchHttpRequest(callback=_collect, batch_uri=DRIVE_BATCH_URI)
+            for index in range(start, min(start + DRIVE_BATCH_SIZE, len(operations))):
+                batch.add(self._batch_request(operations[index]), request_id=str(index))
+            batch.execute()
+
+        return [
+            {"index": index, "op": operation['op'], **result}
+            for index, (operation, result) in enumerate(zip(operations, results))
+        ]
+
+    @with_error_handling
+    async def batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run metadata operations through the Drive batch endpoint.
+
+        N operations cost ceil(N / DRIVE_BATCH_SIZE) round trips. Media
+        uploads and downloads cannot be batched.
+
+        Args:
+            operations: Operations with 'op' ('update', 'delete' or
+                'create_metadata') and its fields
+
+        Returns:
+            Per-operation results in input order
+        """
+        async def _batch():
+            results = await run_blocking(self._execute_batch, operations)
+            await self._forget_responses()
+            for operation, result in zip(operations, results):
+                if result['success'] and operation['op'] in ('update', 'delete'):
+                    await self._forget_metadata(operation['file_id'])
+            failed = sum(1 for result in results if not result['success'])
+            logger.info(f"Batch ran {len(results)} operations ({failed} failed)")
+            return results
+
+        return await rate_limited_call("drive", _batch)
+
     @with_error_handling
     async def upload_file(
         self,
@@ -229,6 +529,9 @@ class DriveService:
     ) -> Dict[str, Any]:
         """Upload local file to Drive.
 
+        Name, MIME type and size are taken from the local file. Small files
+        go up in a single request; larger ones are streamed in chunks.
+
         Args:
             local_path: Local file path
             name: Name for uploaded file (defaults to filename)
@@ -248,14 +551,25 @@ class DriveService:
             if folder_id:
                 file_metadata['parents'] = [folder_id]
 
-            media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
+            resumable = os.path.getsize(local_path) > SIMPLE_UPLOAD_LIMIT
+            media = MediaFileUpload(
+                local_path,
+                mimetype=mime_type,
+                chunksize=MEDIA_CHUNK_SIZE,
+                resumable=resumable
+            )
 
-            file = self.service.files().create(
+            request = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, name, mimeType, size, webViewLink'
-            ).execute()
+            )
+            if resumable:
+                file = await run_blocking(_upload_media, request)
+            else:
+                file = await execute(request)
 
+            await self._forget_responses()
             logger.info(f"Uploaded file: {file['name']} ({file['id']})")
             return file
 
@@ -280,63 +594,69 @@ class DriveService:
         """
         async def _download():
             # Get file metadata
-            file_meta = self.service.files().get(
+            file_meta = await execute(self.service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, size"
-            ).execute()
+            ))
 
-            # Download content
+            # Stream content straight to the local file
             if mime_type or 'google-apps' in file_meta['mimeType']:
                 export_mime = mime_type or 'application/pdf'
-                content = self.service.files().export(
+                request = self.service.files().export_media(
                     fileId=file_id,
                     mimeType=export_mime
-                ).execute()
+                )
             else:
                 request = self.service.files().get_media(fileId=file_id)
-                fh = io.BytesIO()
-                downloader = MediaIoBaseDownload(fh, request)
-
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
-
-                content = fh.getvalue()
 
-            # Write to local file
-            mode = 'w' if isinstance(content, str) else 'wb'
-            with open(local_path, mode) as f:
-                f.write(content)
+            size = await run_blocking(_download_to_path, request, local_path)
 
             logger.info(f"Downloaded file to: {local_path}")
             return {
                 "file_id": file_id,
                 "name": file_meta['name'],
                 "local_path": local_path,
-                "size": len(content)
+                "size": size
             }
 
         return await rate_limited_call("drive", _download)
 
     @with_error_handling
-    async def list_shared_drives(self, max_results: int = 100) -> List[Dict[str, Any]]:
+    async def list_shared_drives(
+        self,
+        max_results: int = 100,
+        page_token: Optional[str] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
         """List shared drives (Team Drives).
 
         Args:
-            max_results: Maximum number of results
+            max_results: Maximum number of results in the page
+            page_token: Page token from a previous listing
+            offset: Number of drives to skip when no page token is given
 
         Returns:
-            List of shared drive metadata
+            Dictionary with the page of shared drives and the next page token
         """
         async def _list():
-            results = self.service.drives().list(
+            token = page_token
+            if offset and not token:
+                token = await self._skip_to_offset(self.service.drives().list, 'drives', offset, 100)
+                if token is None:
+                    return {"drives": [], "next_page_token": None}
+
+            results = await execute(self.service.drives().list(
                 pageSize=min(max_results, 100),
-                fields="drives(id, name)"
-            ).execute()
+                pageToken=token,
+                fields="nextPageToken, drives(id, name)"
+            ))
 
             drives = results.get('drives', [])
             logger.info(f"Found {len(drives)} shared drives")
-            return drives
+            return {
+                "drives": drives,
+                "next_page_token": results.get('nextPageToken')
+            }
 
-        cache_k = cache_key("shared_drives", max_results)
+        cache_k = cache_key("shared_drives", max_results, page_token, offset)
         return await rate_limited_call("drive", cached_call, "drive", cache_k, _list)
@@ -2,13 +2,18 @@
 
 from typing import Any, Dict, List, Optional
 from ..auth.oauth_handler import get_oauth_handler
+from .registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling
 from ..utils.rate_limiter import rate_limited_call
-from ..utils.cache import cached_call, cache_key
+from ..utils.executor import execute
+from ..utils.cache import cached_call, cache_key, get_cache
 
 logger = setup_logger(__name__)
 
+# Responses keep arriving, so they get a shorter TTL than the form structure
+RESPONSES_TTL = 60
+
 
 class FormsService:
     """Google Forms service wrapper."""
@@ -24,8 +29,19 @@ class FormsService:
         return self._service
 
     @with_error_handling
-    async def create_form(self, title: str, document_title: Optional[str] = None) -> Dict[str, Any]:
-        """Create new Google Form."""
+    async def create_form(
+        self,
+        title: str,
+        document_title: Optional[str] = None,
+        requests: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Create new Google Form, then apply any initial batch update requests.
+
+        The Forms API only accepts the title on create, so items are added
+        with one batchUpdate issued straight after it. If that batchUpdate
+        fails, the form still exists: it is returned as created, with the
+        failure under 'requests_error', so the caller keeps its formId.
+        """
         async def _create():
             form = {
                 'info': {
@@ -33,8 +49,18 @@ class FormsService:
                     'documentTitle': document_title or title
                 }
             }
-            result = self.service.forms().create(body=form).execute()
+            result = await execute(self.service.forms().create(body=form))
             logger.info(f"Created form: {result['info']['title']} ({result['formId']})")
+            if requests:
+                try:
+                    await execute(self.service.forms().batchUpdate(
+                        formId=result['formId'],
+                        body={'requests': requests}
+                    ))
+                    logger.info(f"Applied {len(requests)} requests to form: {result['formId']}")
+                except Exception as e:
+                    logger.warning(f"Initial requests failed for form {result['formId']}: {e}")
+                    result['requests_error'] = str(e)
             return result
 
         return await rate_limited_call("forms", _create)
@@ -43,7 +69,7 @@ class FormsService:
     async def read_form(self, form_id: str) -> Dict[str, Any]:
         """Read Google Form structure."""
         async def _read():
-            form = self.service.forms().get(formId=form_id).execute()
+            form = await execute(self.service.forms().get(formId=form_id))
 
             items_info = []
             for item in form.get('items', []):
@@ -74,11 +100,12 @@ class FormsService:
         """Update form structure and questions."""
         async def _update():
             body = {'requests': requests}
-            result = self.service.forms().batchUpdate(
+            result = await execute(self.service.forms().batchUpdate(
                 formId=form_id,
                 body=body
-            ).execute()
+            ))
 
+            await self._forget_form(form_id)
             logger.info(f"Updated form: {form_id}")
             return result
 
@@ -87,15 +114,20 @@ class FormsService:
     @with_error_handling
     async def delete_form(self, form_id: str) -> bool:
         """Delete Google Form (via Drive API)."""
-        from .drive_service import DriveService
-        drive = DriveService()
-        return await drive.delete_file(form_id)
+        deleted = await get_service('drive').delete_file(form_id)
+        await self._forget_form(form_id)
+        await get_cache("forms").delete(cache_key("forms_responses", form_id))
+        return deleted
+
+    async def _forget_form(self, form_id: str) -> None:
+        """Drop the cached structure so the next read sees the form's current state."""
+        await get_cache("forms").delete(cache_key("forms_read", form_id))
 
     @with_error_handling
     async def get_responses(self, form_id: str) -> Dict[str, Any]:
         """Get form responses."""
         async def _get_responses():
-            responses = self.service.forms().responses().list(formId=form_id).execute()
+            responses = await execute(self.service.forms().responses().list(formId=form_id))
             response_list = responses.get('responses', [])
 
             logger.info(f"Retrieved {len(response_list)} responses from form: {form_id}")
@@ -106,4 +138,6 @@ class FormsService:
             }
 
         cache_k = cache_key("forms_responses", form_id)
-        return await rate_limited_call("forms", cached_call, "forms", cache_k, _get_responses, ttl=60)
+        return await rate_limited_call(
+            "forms", cached_call, "forms", cache_k, _get_responses, ttl=RESPONSES_TTL
+        )
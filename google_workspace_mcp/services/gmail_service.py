@@ -1,17 +1,83 @@
 """Gmail service implementation."""
 
+import asyncio
 import base64
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Any, Dict, List, Optional
+import re
+from email.message import EmailMessage
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
 from ..auth.oauth_handler import get_oauth_handler
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling
 from ..utils.rate_limiter import rate_limited_call
-from ..utils.cache import cached_call, cache_key
+from ..utils.executor import execute, run_blocking
+from ..utils.cache import cached_call, cache_key, get_cache
 
 logger = setup_logger(__name__)
 
+# Gmail accepts at most 100 calls per batch request. The discovery document
+# still points at the retired global batch endpoint, so use the API-specific one.
+GMAIL_BATCH_SIZE = 100
+GMAIL_BATCH_URI = 'https://gmail.googleapis.com/batch/gmail/v1'
+
+# messages.list returns at most 500 IDs per page
+GMAIL_LIST_PAGE_SIZE = 500
+
+# Batch parts rejected with these statuses are retried individually,
+# at most GMAIL_FETCH_CONCURRENCY at a time to respect per-user QPS.
+RETRYABLE_STATUSES = frozenset({429, 500, 503})
+GMAIL_FETCH_CONCURRENCY = 10
+
+METADATA_HEADERS = ['From', 'To', 'Subject', 'Date']
+
+# Labels change rarely, so they are cached longer than search results
+LABELS_TTL = 300
+
+# Label values that are already IDs: Gmail's system labels and user label
+# IDs (Label_123). Anything else, including all-caps user label names such
+# as 'TODO', is resolved by name.
+SYSTEM_LABEL_IDS = frozenset({
+    'INBOX', 'SENT', 'DRAFT', 'SPAM', 'TRASH', 'UNREAD', 'STARRED',
+    'IMPORTANT', 'CHAT', 'CATEGORY_PERSONAL', 'CATEGORY_SOCIAL',
+    'CATEGORY_PROMOTIONS', 'CATEGORY_UPDATES', 'CATEGORY_FORUMS'
+})
+USER_LABEL_ID_PATTERN = re.compile(r'^Label_\d+$')
+
+# Headers kept by read_message; compared lower-cased
+WANTED_HEADERS = frozenset({
+    'from', 'to', 'cc', 'bcc', 'reply-to', 'subject', 'date',
+    'message-id', 'in-reply-to', 'references'
+})
+
+# Partial-response masks: only request the fields the tools consume
+METADATA_FIELDS = 'id,threadId,labelIds,snippet,payload/headers'
+FULL_MESSAGE_FIELDS = 'id,threadId,labelIds,snippet,payload(mimeType,headers,body/data,parts)'
+
+
+def _iter_plain_text_parts(parts: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield decoded text/plain bodies, descending into nested multiparts."""
+    for part in parts:
+        if 'parts' in part:
+            yield from _iter_plain_text_parts(part['parts'])
+        elif part.get('mimeType') == 'text/plain' and 'data' in part.get('body', {}):
+            yield base64.urlsafe_b64decode(part['body']['data'])
+
+
+def _find_label_id(labels: List[Dict[str, Any]], name: str) -> Optional[str]:
+    """Return the ID of the label with the given name, if any."""
+    return next((label['id'] for label in labels if label['name'] == name), None)
+
+
+def _build_raw_message(body: str, headers: Dict[str, Optional[str]]) -> str:
+    """Build a base64url-encoded RFC 5322 text/plain message."""
+    message = EmailMessage()
+    for name, value in headers.items():
+        if value:
+            message[name] = value
+    message.set_content(body)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
 
 class GmailService:
     """Gmail service wrapper."""
@@ -19,6 +85,9 @@ class GmailService:
     def __init__(self):
         self.oauth = get_oauth_handler()
         self._service = None
+        # Label list fetched by the last refresh-on-miss; while it is still
+        # the cached list, further misses are not refreshed again
+        self._refreshed_labels: Optional[List[Dict[str, Any]]] = None
 
     @property
     def service(self):
@@ -26,66 +95,230 @@ class GmailService:
             self._service = self.oauth.get_service('gmail', 'v1')
         return self._service
 
+    async def _label_id(self, name: str) -> str:
+        """Resolve a label name to its ID from the cached label list.
+
+        An unknown name drops the cached list and lists labels again, so
+        labels created since the list was cached are found. Names still
+        unknown after that are not looked up again until the refreshed
+        list expires.
+        """
+        labels = await self.list_labels()
+        label_id = _find_label_id(labels, name)
+        if label_id is None and labels is not self._refreshed_labels:
+            await get_cache("gmail").delete(cache_key("gmail_labels"))
+            labels = self._refreshed_labels = await self.list_labels()
+            label_id = _find_label_id(labels, name)
+        return label_id or name
+
+    @staticmethod
+    def _is_label_id(label: str) -> bool:
+        """Check whether a label value is already an ID rather than a name."""
+        return label in SYSTEM_LABEL_IDS or bool(USER_LABEL_ID_PATTERN.match(label))
+
+    async def _resolve_label_ids(self, labels: Optional[List[str]]) -> Optional[List[str]]:
+        """Map label names to IDs, leaving values that already look like IDs."""
+        if not labels:
+            return labels
+        return [
+            label if self._is_label_id(label) else await self._label_id(label)
+            for label in labels
+        ]
+
+    def _metadata_request(self, message_id: str):
+        """Build a metadata-only messages.get request."""
+        return self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='metadata',
+            metadataHeaders=METADATA_HEADERS,
+            fields=METADATA_FIELDS
+        )
+
+    def _batch_get_metadata(
+        self,
+        message_ids: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Fetch message metadata through the Gmail batch endpoint.
+
+        IDs are grouped into chunks of GMAIL_BATCH_SIZE so N messages cost
+        ceil(N / GMAIL_BATCH_SIZE) round trips.
+
+        Returns:
+            Tuple of (metadata by message ID, IDs whose part should be retried)
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        retry: List[str] = []
+
+        def _collect(request_id, response, exception):
+            if exception is None:
+                results[request_id] = response
+            elif isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUSES:
+                retry.append(request_id)
+            else:
+                logger.warning(f"Skipping message {request_id}: {exception}")
+
+        for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+            batch = BatchHttpRequest(callback=_collect, batch_uri=GMAIL_BATCH_URI)
+            for message_id in message_ids[start:start + GMAIL_BATCH_SIZE]:
+                batch.add(self._metadata_request(message_id), request_id=message_id)
+            batch.execute()
+
+        return results, retry
+
+    async def _get_metadata_concurrently(
+        self,
+        message_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch message metadata with individual, concurrent requests."""
+        semaphore = asyncio.Semaphore(GMAIL_FETCH_CONCURRENCY)
+
+        async def _fetch(message_id):
+            async with semaphore:
+                return await execute(self._metadata_request(message_id))
+
+        fetched = await asyncio.gather(
+            *[_fetch(message_id) for message_id in message_ids],
+            return_exceptions=True
+        )
+
+        results = {}
+        for message_id, detail in zip(message_ids, fetched):
+            if isinstance(detail, Exception):
+                logger.warning(f"Skipping message {message_id}: {detail}")
+            else:
+                results[message_id] = detail
+        return results
+
+    async def _get_metadata(self, message_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch metadata for message IDs in batches, retrying throttled parts."""
+        details, retry = await run_blocking(self._batch_get_metadata, message_ids)
+        if retry:
+            details.update(await self._get_metadata_concurrently(retry))
+        return [details[mid] for mid in message_ids if mid in details]
+
+    async def _skip_to_offset(self, params: Dict[str, Any], offset: int) -> Optional[str]:
+        """Page past the first `offset` messages, requesting only IDs and page tokens.
+
+        Pages can come back short before the last one, so the offset is
+        reduced by the number of messages actually returned.
+
+        Returns:
+            Page token positioned at `offset`, or None if the listing ends first
+        """
+        page_token = None
+        while offset > 0:
+            results = await execute(self.service.users().messages().list(
+                maxResults=min(offset, GMAIL_LIST_PAGE_SIZE),
+                pageToken=page_token,
+                fields='nextPageToken,messages(id)',
+                **params
+            ))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return None
+            offset -= len(results.get('messages', []))
+        return page_token
+
     @with_error_handling
     async def search_messages(
         self,
         query: str = "",
         max_results: int = 100,
-        label_ids: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
-        """Search for messages in Gmail."""
+        label_ids: Optional[List[str]] = None,
+        page_token: Optional[str] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """Search for messages in Gmail.
+
+        Args:
+            query: Gmail search query
+            max_results: Maximum number of messages in the page
+            label_ids: Label IDs or names to filter by
+            page_token: Page token from a previous search
+            offset: Number of messages to skip when no page token is given
+
+        Returns:
+            Dictionary with the page of messages and the next page token
+        """
+        label_ids = await self._resolve_label_ids(label_ids)
+
         async def _search():
-            params = {
-                'userId': 'me',
-                'q': query,
-                'maxResults': min(max_results, 500)
-            }
+            base_params = {'userId': 'me', 'q': query}
             if label_ids:
-                params['labelIds'] = label_ids
-
-            results = self.service.users().messages().list(**params).execute()
-            messages = results.get('messages', [])
-
-            # Get full message details
-            detailed_messages = []
-            for msg in messages:
-                detail = self.service.users().messages().get(
-                    userId='me',
-                    id=msg['id'],
-                    format='metadata',
-                    metadataHeaders=['From', 'To', 'Subject', 'Date']
-                ).execute()
-                detailed_messages.append(detail)
+                base_params['labelIds'] = label_ids
+
+            token = page_token
+            if offset and not token:
+                token = await self._skip_to_offset(base_params, offset)
+                if token is None:
+                    return {"messages": [], "next_page_token": None}
+
+            # Page through the list; each page's metadata batch is fetched
+            # while the next page is being listed
+            fetches = []
+            remaining = max_results
+            try:
+                while remaining > 0:
+                    params = {
+                        **base_params,
+                        'maxResults': min(remaining, GMAIL_LIST_PAGE_SIZE)
+                    }
+                    if token:
+                        params['pageToken'] = token
+
+                    results = await execute(self.service.users().messages().list(**params))
+                    message_ids = [msg['id'] for msg in results.get('messages', [])]
+                    if message_ids:
+                        fetches.append(asyncio.create_task(self._get_metadata(message_ids)))
+
+                    remaining -= len(message_ids)
+                    token = results.get('nextPageToken')
+                    if not token or not message_ids:
+                        break
+
+                pages = await asyncio.gather(*fetches)
+            except BaseException:
+                for fetch in fetches:
+                    fetch.cancel()
+                raise
+
+            detailed_messages = [msg for page in pages for msg in page]
 
             logger.info(f"Found {len(detailed_messages)} messages")
-            return detailed_messages
+            return {
+                "messages": detailed_messages,
+                "next_page_token": token
+            }
 
-        cache_k = cache_key("gmail_search", query, max_results, label_ids)
+        cache_k = cache_key("gmail_search", query, max_results, label_ids, page_token, offset)
         return await rate_limited_call("gmail", cached_call, "gmail", cache_k, _search, ttl=60)
 
     @with_error_handling
     async def read_message(self, message_id: str) -> Dict[str, Any]:
         """Read full message content."""
         async def _read():
-            message = self.service.users().messages().get(
+            message = await execute(self.service.users().messages().get(
                 userId='me',
                 id=message_id,
-                format='full'
-            ).execute()
-
-            # Extract headers
-            headers = {}
-            for header in message['payload'].get('headers', []):
-                headers[header['name']] = header['value']
+                format='full',
+                fields=FULL_MESSAGE_FIELDS
+            ))
+
+            # Extract the headers callers use (names are case-insensitive)
+            headers = {
+                h['name']: h['value']
+                for h in message['payload'].get('headers', ())
+                if h['name'].lower() in WANTED_HEADERS
+            }
 
             # Extract body
-            body = ""
-            if 'parts' in message['payload']:
-                for part in message['payload']['parts']:
-                    if part['mimeType'] == 'text/plain' and 'data' in part['body']:
-                        body += base64.urlsafe_b64decode(part['body']['data']).decode()
-            elif 'body' in message['payload'] and 'data' in message['payload']['body']:
-                body = base64.urlsafe_b64decode(message['payload']['body']['data']).decode()
+            payload = message['payload']
+            if 'parts' in payload:
+                raw_body = b''.join(_iter_plain_text_parts(payload['parts']))
+            else:
+                raw_body = base64.urlsafe_b64decode(payload.get('body', {}).get('data', ''))
+            body = raw_body.decode('utf-8', errors='replace')
 
             logger.info(f"Read message: {message_id}")
             return {
@@ -111,22 +344,17 @@ class GmailService:
     ) -> Dict[str, Any]:
         """Send new email message."""
         async def _send():
-            message = MIMEMultipart()
-            message['To'] = to
-            message['Subject'] = subject
-            if cc:
-                message['Cc'] = cc
-            if bcc:
-                message['Bcc'] = bcc
-
-            message.attach(MIMEText(body, 'plain'))
-
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-            result = self.service.users().messages().send(
+            raw_message = await run_blocking(_build_raw_message, body, {
+                'To': to,
+                'Subject': subject,
+                'Cc': cc,
+                'Bcc': bcc
+            })
+
+            result = await execute(self.service.users().messages().send(
                 userId='me',
                 body={'raw': raw_message}
-            ).execute()
+            ))
 
             logger.info(f"Sent message: {result['id']}")
             return result
@@ -145,21 +373,20 @@ class GmailService:
             original = await self.read_message(message_id)
 
             # Create reply
-            reply = MIMEText(body)
-            reply['To'] = original['headers'].get('From', '')
-            reply['Subject'] = 'Re: ' + original['headers'].get('Subject', '')
-            reply['In-Reply-To'] = message_id
-            reply['References'] = message_id
-
-            raw_reply = base64.urlsafe_b64encode(reply.as_bytes()).decode()
-
-            result = self.service.users().messages().send(
+            raw_reply = await run_blocking(_build_raw_message, body, {
+                'To': original['headers'].get('From', ''),
+                'Subject': 'Re: ' + original['headers'].get('Subject', ''),
+                'In-Reply-To': message_id,
+                'References': message_id
+            })
+
+            result = await execute(self.service.users().messages().send(
                 userId='me',
                 body={
                     'raw': raw_reply,
                     'threadId': original['thread_id']
                 }
-            ).execute()
+            ))
 
             logger.info(f"Replied to message: {message_id}")
             return result
@@ -170,10 +397,10 @@ class GmailService:
     async def delete_message(self, message_id: str) -> bool:
         """Delete message (move to trash)."""
         async def _delete():
-            self.service.users().messages().trash(
+            await execute(self.service.users().messages().trash(
                 userId='me',
                 id=message_id
-            ).execute()
+            ))
 
             logger.info(f"Deleted message: {message_id}")
             return True
@@ -184,14 +411,16 @@ class GmailService:
     async def list_labels(self) -> List[Dict[str, Any]]:
         """List all Gmail labels."""
         async def _list():
-            results = self.service.users().labels().list(userId='me').execute()
+            results = await execute(self.service.users().labels().list(userId='me'))
             labels = results.get('labels', [])
 
             logger.info(f"Found {len(labels)} labels")
             return labels
 
         cache_k = cache_key("gmail_labels")
-        return await rate_limited_call("gmail", cached_call, "gmail", cache_k, _list, ttl=300)
+        return await rate_limited_call(
+            "gmail", cached_call, "gmail", cache_k, _list, ttl=LABELS_TTL
+        )
 
     @with_error_handling
     async def modify_labels(
@@ -200,7 +429,14 @@ class GmailService:
         add_labels: Optional[List[str]] = None,
         remove_labels: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """Modify message labels."""
+        """Modify message labels.
+
+        Labels may be given as IDs or names; names are resolved against the
+        cached label list without an extra API call.
+        """
+        add_labels = await self._resolve_label_ids(add_labels)
+        remove_labels = await self._resolve_label_ids(remove_labels)
+
         async def _modify():
             body = {}
             if add_labels:
@@ -208,12 +444,14 @@ class GmailService:
             if remove_labels:
                 body['removeLabelIds'] = remove_labels
 
-            result = self.service.users().messages().modify(
+            result = await execute(self.service.users().messages().modify(
                 userId='me',
                 id=message_id,
                 body=body
-            ).execute()
+            ))
 
+            # The cached copy of the message still lists the old labels
+            await get_cache("gmail").delete(cache_key("gmail_read", message_id))
             logger.info(f"Modified labels for message: {message_id}")
             return result
 
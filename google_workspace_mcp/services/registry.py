@@ -0,0 +1,34 @@
+"""Lazy registry of shared Google Workspace service wrappers."""
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# Service name -> (module, class); modules are imported on first use
+_SERVICE_CLASSES: Dict[str, Tuple[str, str]] = {
+    'drive': ('drive_service', 'DriveService'),
+    'docs': ('docs_service', 'DocsService'),
+    'sheets': ('sheets_service', 'SheetsService'),
+    'slides': ('slides_service', 'SlidesService'),
+    'forms': ('forms_service', 'FormsService'),
+    'gmail': ('gmail_service', 'GmailService'),
+}
+
+# Global service instances
+_services: Dict[str, Any] = {}
+
+
+def get_service(name: str) -> Any:
+    """Get the shared service wrapper, creating it on first use.
+
+    Args:
+        name: Service name (e.g., 'drive', 'gmail')
+
+    Returns:
+        Service wrapper instance
+    """
+    service = _services.get(name)
+    if service is None:
+        module_name, class_name = _SERVICE_CLASSES[name]
+        module = import_module(f'.{module_name}', __package__)
+        service = _services[name] = getattr(module, class_name)()
+    return service
@@ -2,9 +2,11 @@
 
 from typing import Any, Dict, List, Optional
 from ..auth.oauth_handler import get_oauth_handler
+from .registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling
 from ..utils.rate_limiter import rate_limited_call
+from ..utils.executor import execute
 from ..utils.cache import cached_call, cache_key
 
 logger = setup_logger(__name__)
@@ -16,6 +18,9 @@ class SheetsService:
     def __init__(self):
         self.oauth = get_oauth_handler()
         self._service = None
+        # Bumped on every write; part of the read cache keys, so reads
+        # cached before a write are never served after it
+        self._versions: Dict[str, int] = {}
 
     @property
     def service(self):
@@ -23,6 +28,14 @@ class SheetsService:
             self._service = self.oauth.get_service('sheets', 'v4')
         return self._service
 
+    def _read_key(self, kind: str, spreadsheet_id: str, *args) -> str:
+        """Build a read cache key tied to the spreadsheet's current version."""
+        return cache_key(kind, spreadsheet_id, self._versions.get(spreadsheet_id, 0), *args)
+
+    def _forget_reads(self, spreadsheet_id: str) -> None:
+        """Stop serving reads cached before a write to the spreadsheet."""
+        self._versions[spreadsheet_id] = self._versions.get(spreadsheet_id, 0) + 1
+
     @with_error_handling
     async def create_spreadsheet(self, title: str) -> Dict[str, Any]:
         """Create new Google Sheets spreadsheet."""
@@ -30,7 +43,7 @@ class SheetsService:
             spreadsheet = {
                 'properties': {'title': title}
             }
-            result = self.service.spreadsheets().create(body=spreadsheet).execute()
+            result = await execute(self.service.spreadsheets().create(body=spreadsheet))
             logger.info(f"Created spreadsheet: {result['properties']['title']} ({result['spreadsheetId']})")
             return result
 
@@ -44,10 +57,10 @@ class SheetsService:
     ) -> Dict[str, Any]:
         """Read data from spreadsheet range."""
         async def _read():
-            result = self.service.spreadsheets().values().get(
+            result = await execute(self.service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
 
             values = result.get('values', [])
             logger.info(f"Read {len(values)} rows from {range_name}")
@@ -57,7 +70,37 @@ class SheetsService:
                 "values": values
             }
 
-        cache_k = cache_key("sheets_read", spreadsheet_id, range_name)
+        cache_k = self._read_key("sheets_read", spreadsheet_id, range_name)
+        return await rate_limited_call("sheets", cached_call, "sheets", cache_k, _read)
+
+    @with_error_handling
+    async def read_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str]
+    ) -> Dict[str, Any]:
+        """Read several ranges in one values.batchGet request."""
+        async def _read():
+            result = await execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension='ROWS'
+            ))
+
+            value_ranges = [
+                {
+                    "range": value_range.get('range', range_name),
+                    "values": value_range.get('values', [])
+                }
+                for range_name, value_range in zip(ranges, result.get('valueRanges', []))
+            ]
+            logger.info(f"Read {len(value_ranges)} ranges from {spreadsheet_id}")
+            return {
+                "spreadsheet_id": spreadsheet_id,
+                "value_ranges": value_ranges
+            }
+
+        cache_k = self._read_key("sheets_read_ranges", spreadsheet_id, tuple(ranges))
         return await rate_limited_call("sheets", cached_call, "sheets", cache_k, _read)
 
     @with_error_handling
@@ -70,24 +113,71 @@ class SheetsService:
         """Update spreadsheet range with values."""
         async def _update():
             body = {'values': values}
-            result = self.service.spreadsheets().values().update(
+            result = await execute(self.service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption='RAW',
                 body=body
-            ).execute()
+            ))
 
+            self._forget_reads(spreadsheet_id)
             logger.info(f"Updated {result.get('updatedCells', 0)} cells in {range_name}")
             return result
 
         return await rate_limited_call("sheets", _update)
 
+    @with_error_handling
+    async def update_ranges(
+        self,
+        spreadsheet_id: str,
+        data: Dict[str, List[List[Any]]]
+    ) -> Dict[str, Any]:
+        """Update several ranges (values keyed by range) in one values.batchUpdate request."""
+        async def _update():
+            body = {
+                'valueInputOption': 'RAW',
+                'data': [
+                    {'range': range_name, 'values': values}
+                    for range_name, values in data.items()
+                ]
+            }
+            result = await execute(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body=body
+            ))
+
+            self._forget_reads(spreadsheet_id)
+            logger.info(f"Updated {result.get('totalUpdatedCells', 0)} cells in {len(data)} ranges")
+            return result
+
+        return await rate_limited_call("sheets", _update)
+
+    @with_error_handling
+    async def clear_range(
+        self,
+        spreadsheet_id: str,
+        range_name: str
+    ) -> Dict[str, Any]:
+        """Clear values from a range, keeping formatting."""
+        async def _clear():
+            result = await execute(self.service.spreadsheets().values().clear(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                body={}
+            ))
+
+            self._forget_reads(spreadsheet_id)
+            logger.info(f"Cleared range: {result.get('clearedRange', range_name)}")
+            return result
+
+        return await rate_limited_call("sheets", _clear)
+
     @with_error_handling
     async def delete_spreadsheet(self, spreadsheet_id: str) -> bool:
         """Delete Google Sheets spreadsheet (via Drive API)."""
-        from .drive_service import DriveService
-        drive = DriveService()
-        return await drive.delete_file(spreadsheet_id)
+        deleted = await get_service('drive').delete_file(spreadsheet_id)
+        self._forget_reads(spreadsheet_id)
+        return deleted
 
     @with_error_handling
     async def batch_update(
@@ -98,11 +188,12 @@ class SheetsService:
         """Perform batch update operations."""
         async def _batch():
             body = {'requests': requests}
-            result = self.service.spreadsheets().batchUpdate(
+            result = await execute(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=body
-            ).execute()
+            ))
 
+            self._forget_reads(spreadsheet_id)
             logger.info(f"Batch updated spreadsheet: {spreadsheet_id}")
             return result
 
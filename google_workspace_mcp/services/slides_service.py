@@ -1,14 +1,54 @@
 """Google Slides service implementation."""
 
 from typing import Any, Dict, List, Optional
+from googleapiclient.http import BatchHttpRequest
+
 from ..auth.oauth_handler import get_oauth_handler
+from .registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.error_handler import with_error_handling
 from ..utils.rate_limiter import rate_limited_call
-from ..utils.cache import cached_call, cache_key
+from ..utils.executor import execute, run_blocking
+from ..utils.cache import cached_call, cache_key, get_cache
 
 logger = setup_logger(__name__)
 
+# Presentations created per batch HTTP request (Google recommends at most
+# 100 calls per batch; the hard limit is 1000)
+SLIDES_BATCH_SIZE = 100
+SLIDES_BATCH_URI = 'https://slides.googleapis.com/batch'
+
+# Partial-response mask for read_presentation: slide IDs and shape text only,
+# skipping layouts, masters and styling, which dominate the full payload
+READ_FIELDS = (
+    'presentationId,title,'
+    'slides(objectId,pageElements(objectId,shape/text/textElements/textRun/content))'
+)
+
+
+def create_slide_request(insertion_index: Optional[int] = None) -> Dict[str, Any]:
+    """Build a createSlide request (appended at the end when no index is given)."""
+    create_slide: Dict[str, Any] = {}
+    if insertion_index is not None:
+        create_slide['insertionIndex'] = insertion_index
+    return {'createSlide': create_slide}
+
+
+def delete_slide_request(slide_id: str) -> Dict[str, Any]:
+    """Build a deleteObject request for a slide."""
+    return {'deleteObject': {'objectId': slide_id}}
+
+
+def _slide_text(elements: List[Dict[str, Any]]) -> str:
+    """Join the text runs of a slide's shapes."""
+    runs = []
+    for element in elements:
+        for text_element in element.get('shape', {}).get('text', {}).get('textElements', []):
+            content = text_element.get('textRun', {}).get('content')
+            if content:
+                runs.append(content)
+    return "".join(runs).strip()
+
 
 class SlidesService:
     """Google Slides service wrapper."""
@@ -30,25 +70,71 @@ class SlidesService:
             presentation = {
                 'title': title
             }
-            result = self.service.presentations().create(body=presentation).execute()
+            result = await execute(self.service.presentations().create(body=presentation))
             logger.info(f"Created presentation: {result['title']} ({result['presentationId']})")
             return result
 
         return await rate_limited_call("slides", _create)
 
+    def _execute_batch_create(self, titles: List[str]) -> List[Dict[str, Any]]:
+        """Create presentations through the Slides batch endpoint (blocking)."""
+        results: List[Dict[str, Any]] = [{} for _ in titles]
+
+        def _collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is None:
+                results[index] = {"success": True, "result": response or {}}
+            else:
+                results[index] = {"success": False, "error": str(exception)}
+
+        for start in range(0, len(titles), SLIDES_BATCH_SIZE):
+            batch = BatchHttpRequest(callback=_collect, batch_uri=SLIDES_BATCH_URI)
+            for index in range(start, min(start + SLIDES_BATCH_SIZE, len(titles))):
+                request = self.service.presentations().create(body={'title': titles[index]})
+                batch.add(request, request_id=str(index))
+            batch.execute()
+
+        return [
+            {"index": index, "title": title, **result}
+            for index, (title, result) in enumerate(zip(titles, results))
+        ]
+
+    @with_error_handling
+    async def batch_create(self, titles: List[str]) -> List[Dict[str, Any]]:
+        """Create several presentations through the Slides batch endpoint.
+
+        N presentations cost ceil(N / SLIDES_BATCH_SIZE) round trips.
+
+        Args:
+            titles: Presentation titles
+
+        Returns:
+            Per-presentation results in input order
+        """
+        async def _batch():
+            results = await run_blocking(self._execute_batch_create, titles)
+            failed = sum(1 for result in results if not result['success'])
+            logger.info(f"Batch created {len(results) - failed} presentations ({failed} failed)")
+            return results
+
+        return await rate_limited_call("slides", _batch)
+
     @with_error_handling
     async def read_presentation(self, presentation_id: str) -> Dict[str, Any]:
         """Read Google Slides presentation structure."""
         async def _read():
-            presentation = self.service.presentations().get(
-                presentationId=presentation_id
-            ).execute()
+            presentation = await execute(self.service.presentations().get(
+                presentationId=presentation_id,
+                fields=READ_FIELDS
+            ))
 
             slides_info = []
             for slide in presentation.get('slides', []):
+                elements = slide.get('pageElements', [])
                 slide_info = {
                     'slide_id': slide['objectId'],
-                    'page_elements': len(slide.get('pageElements', []))
+                    'page_elements': len(elements),
+                    'text': _slide_text(elements)
                 }
                 slides_info.append(slide_info)
 
@@ -70,22 +156,16 @@ class SlidesService:
         insertion_index: Optional[int] = None
     ) -> Dict[str, Any]:
         """Add new slide to presentation."""
-        async def _add():
-            requests = [{
-                'createSlide': {
-                    'insertionIndex': insertion_index
-                }
-            }]
-
-            result = self.service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests}
-            ).execute()
-
-            logger.info(f"Added slide to presentation: {presentation_id}")
-            return result
+        result = await self._batch_update(presentation_id, [create_slide_request(insertion_index)])
+        return {
+            "slide_id": result['replies'][0]['createSlide']['objectId'],
+            "slide_index": insertion_index
+        }
 
-        return await rate_limited_call("slides", _add)
+    @with_error_handling
+    async def delete_slide(self, presentation_id: str, slide_id: str) -> Dict[str, Any]:
+        """Delete a slide from presentation."""
+        return await self._batch_update(presentation_id, [delete_slide_request(slide_id)])
 
     @with_error_handling
     async def update_slide(
@@ -93,14 +173,23 @@ class SlidesService:
         presentation_id: str,
         requests: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Update slide content."""
+        """Apply batch update requests to a presentation in one API call."""
+        return await self._batch_update(presentation_id, requests)
+
+    async def _batch_update(
+        self,
+        presentation_id: str,
+        requests: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Send all requests in a single presentations.batchUpdate round trip."""
         async def _update():
-            result = self.service.presentations().batchUpdate(
+            result = await execute(self.service.presentations().batchUpdate(
                 presentationId=presentation_id,
                 body={'requests': requests}
-            ).execute()
+            ))
 
-            logger.info(f"Updated slides in presentation: {presentation_id}")
+            await get_cache("slides").delete(cache_key("slides_read", presentation_id))
+            logger.info(f"Applied {len(requests)} update(s) to presentation: {presentation_id}")
             return result
 
         return await rate_limited_call("slides", _update)
@@ -108,6 +197,4 @@ class SlidesService:
     @with_error_handling
     async def delete_presentation(self, presentation_id: str) -> bool:
         """Delete Google Slides presentation (via Drive API)."""
-        from .drive_service import DriveService
-        drive = DriveService()
-        return await drive.delete_file(presentation_id)
+        return await get_service('drive').delete_file(presentation_id)
@@ -1,22 +1,36 @@
 """MCP tools for Google Docs operations using FastMCP."""
 
-import json
 from typing import Optional
 from pydantic import Field
 
 from ..server_fastmcp import mcp
 from ..services.docs_service import DocsService
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.base_models import BaseMCPInput, DocumentIdInput
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    to_json,
+    truncation_notice,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-docs_service = DocsService()
+
+
+def _service() -> DocsService:
+    """Get the shared DocsService instance."""
+    return get_service('docs')
+
+
+_TRUNCATION_SUFFIX = truncation_notice(
+    "Document content",
+    "Consider breaking the document into smaller sections or use pagination."
+)
 
 
 # ============================================================================
@@ -32,19 +46,13 @@ class DocsCreateInput(BaseMCPInput):
         min_length=1,
         max_length=255
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class DocsReadInput(DocumentIdInput):
     """Input model for reading a Google Docs document."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class DocsUpdateInput(DocumentIdInput):
@@ -60,19 +68,13 @@ class DocsUpdateInput(DocumentIdInput):
         description="Position to insert text (1 = start of document, higher values = later positions)",
         ge=1
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class DocsDeleteInput(DocumentIdInput):
     """Input model for deleting a Google Docs document."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 # ============================================================================
@@ -114,7 +116,7 @@ async def docs_create(params: DocsCreateInput) -> str:
         - Create report: title='Monthly Sales Report'
     """
     try:
-        result = await docs_service.create_document(title=params.title)
+        result = await _service().create_document(title=params.title)
 
         document_id = result.get('documentId')
         return create_success_response(
@@ -128,7 +130,7 @@ async def docs_create(params: DocsCreateInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"docs_create error: {str(e)}")
+        logger.error("docs_create error: %s", e)
         return format_error(e, "creating document")
 
 
@@ -170,27 +172,30 @@ async def docs_read(params: DocsReadInput) -> str:
         - Images and tables are not included in text extraction
     """
     try:
-        result = await docs_service.read_document(document_id=params.document_id)
+        result = await _service().read_document(document_id=params.document_id)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            return to_json(result)
 
         # Markdown format
-        response = f"# Document: {result.get('title', 'Untitled')}\n\n"
-        response += f"**Document ID**: `{result.get('document_id')}`\n\n"
-        response += f"## Content\n\n{result.get('content', '')}"
-
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\n\n⚠️ **Content Truncated**: Document content exceeds character limit (25,000 chars)."
-            truncated += "\n\n**Tip**: Consider breaking the document into smaller sections or use pagination."
-            return truncated
-
-        return response
+        header = "\n\n".join([
+            f"# Document: {result.get('title', 'Untitled')}",
+            f"**Document ID**: `{result.get('document_id')}`",
+            "## Content",
+            ""
+        ])
+        content = result.get('content', '')
+
+        # Check character limit before building, so oversized content is
+        # sliced once instead of being copied into the response first
+        if len(header) + len(content) > CHARACTER_LIMIT:
+            budget = CHARACTER_LIMIT - TRUNCATION_RESERVE - len(header)
+            return "".join([header, content[:budget], _TRUNCATION_SUFFIX])
+
+        return header + content
 
     except Exception as e:
-        logger.error(f"docs_read error: {str(e)}")
+        logger.error("docs_read error: %s", e)
         return format_error(e, "reading document")
 
 
@@ -234,7 +239,7 @@ async def docs_update(params: DocsUpdateInput) -> str:
         - Existing content is shifted, not overwritten
     """
     try:
-        await docs_service.update_document(
+        await _service().update_document(
             document_id=params.document_id,
             text=params.text,
             index=params.index
@@ -251,7 +256,7 @@ async def docs_update(params: DocsUpdateInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"docs_update error: {str(e)}")
+        logger.error("docs_update error: %s", e)
         return format_error(e, "updating document")
 
 
@@ -293,7 +298,7 @@ async def docs_delete(params: DocsDeleteInput) -> str:
         - After 30 days, deletion is permanent
     """
     try:
-        await docs_service.delete_document(document_id=params.document_id)
+        await _service().delete_document(document_id=params.document_id)
 
         return create_success_response(
             f"Deleted document with ID: {params.document_id}",
@@ -305,5 +310,5 @@ async def docs_delete(params: DocsDeleteInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"docs_delete error: {str(e)}")
+        logger.error("docs_delete error: %s", e)
         return format_error(e, "deleting document")
@@ -1,31 +1,140 @@
 """MCP tools for Google Drive operations using FastMCP."""
 
-import json
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+import asyncio
+import atexit
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from ..server_fastmcp import mcp
-from ..services.drive_service import DriveService
+from ..services.drive_service import DriveService, RESPONSE_CACHE
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
-from ..utils.base_models import BaseMCPInput, BaseListInput, FileIdInput
+from ..utils.cache import cached_call, cache_key
+from ..utils.executor import run_blocking
+from ..utils.base_models import BaseMCPInput, BaseListInput, FileIdInput, FileIdStr
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_file_list,
-    format_pagination_metadata,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    truncate_response,
+    truncation_notice,
+    to_json,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-drive_service = DriveService()
+
+# Drive has no offset parameter; offsets are emulated by paging past the
+# skipped items, so only small offsets are accepted. Use page_token instead.
+MAX_OFFSET = 1000
+
+# Operations accepted by drive_batch; media transfers cannot be batched
+BATCH_OPERATIONS = ('update', 'delete', 'create_metadata')
+
+
+def _service() -> DriveService:
+    """Get the shared DriveService instance."""
+    return get_service('drive')
+
+
+_TRUNCATION_SUFFIX = truncation_notice(
+    "File content",
+    "Consider downloading the file instead."
+)
+
+# In JSON mode, file content above this many characters is written to a
+# local temp file and referenced by URL instead of being inlined
+INLINE_CONTENT_LIMIT = 256 * 1024
+
+# Spill files live in one per-process directory that is removed at exit.
+# The oldest files are pruned so the directory stays within these bounds
+# (a single file larger than the size cap is still written).
+SPILL_MAX_FILES = 20
+SPILL_MAX_BYTES = 64 * 1024 * 1024
+
+_spill_dir: Optional[Path] = None
+
+
+def _spill_directory() -> Path:
+    """Create the per-process spill directory on first use."""
+    global _spill_dir
+    if _spill_dir is None:
+        _spill_dir = Path(tempfile.mkdtemp(prefix='gw-mcp-'))
+        atexit.register(shutil.rmtree, _spill_dir, ignore_errors=True)
+    return _spill_dir
+
+
+def _prune_spill_files(directory: Path, incoming: int) -> None:
+    """Delete the oldest spill files until a new one of `incoming` bytes fits."""
+    files = sorted(directory.glob('*.txt'), key=lambda f: f.stat().st_mtime)
+    total = sum(f.stat().st_size for f in files)
+    while files and (len(files) >= SPILL_MAX_FILES or total + incoming > SPILL_MAX_BYTES):
+        oldest = files.pop(0)
+        total -= oldest.stat().st_size
+        oldest.unlink(missing_ok=True)
+
+
+def _spill_to_file(content: str) -> str:
+    """Write content to a spill file (blocking) and return its file:// URL.
+
+    Older spill files may be pruned, so URLs from earlier responses can
+    stop resolving.
+    """
+    data = content.encode('utf-8')
+    directory = _spill_directory()
+    _prune_spill_files(directory, len(data))
+    with tempfile.NamedTemporaryFile(
+        'wb', dir=directory, suffix='.txt', delete=False
+    ) as fh:
+        fh.write(data)
+    return Path(fh.name).as_uri()
+
+
+# Rendered listing responses are reused for identical params (e.g., an
+# agent retrying a search). DriveService drops them when it changes a file;
+# files created or edited through the Docs, Sheets, Slides or Forms APIs
+# can take up to RESPONSE_TTL to show. File reads are not memoized, since
+# their content can change without going through Drive.
+RESPONSE_TTL = 60
+
+
+async def _memoized(tool: str, params: BaseMCPInput, render) -> str:
+    """Render a read-only listing response, reusing it for identical params.
+
+    Errors raised by render are not cached.
+    """
+    key = cache_key(tool, params.model_dump_json())
+    return await cached_call(RESPONSE_CACHE, key, render, ttl=RESPONSE_TTL)
 
 
 # ============================================================================
 # Pydantic Input Models
 # ============================================================================
 
-class DriveSearchInput(BaseListInput):
+class DrivePageInput(BaseListInput):
+    """Base model for Drive listings paged with page tokens."""
+
+    page_token: Optional[str] = Field(
+        default=None,
+        description="Page token from a previous response's next_page_token to fetch the next page",
+        max_length=1000
+    )
+    offset: int = Field(
+        default=0,
+        description=f"Number of results to skip (max {MAX_OFFSET}); prefer page_token for paging",
+        ge=0,
+        le=MAX_OFFSET
+    )
+
+
+class DriveSearchInput(DrivePageInput):
     """Input model for searching files in Google Drive."""
 
     query: Optional[str] = Field(
@@ -33,34 +142,40 @@ class DriveSearchInput(BaseListInput):
         description="Search query for file name (e.g., 'budget report', 'Q1 analysis', '*.pdf')",
         max_length=500
     )
-    folder_id: Optional[str] = Field(
+    folder_id: Optional[FileIdStr] = Field(
         default=None,
-        description="Limit search to specific folder ID (e.g., '1A2B3C4D5E6F')",
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Limit search to specific folder ID (e.g., '1A2B3C4D5E6F')"
     )
     file_type: Optional[str] = Field(
         default=None,
         description="Filter by MIME type (e.g., 'application/pdf', 'image/jpeg', 'application/vnd.google-apps.document')"
     )
+    modified_after: Optional[datetime] = Field(
+        default=None,
+        description="Only return files modified after this ISO 8601 time (e.g., '2024-01-01T00:00:00Z')"
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Also count all matching files (slower: pages through every match)"
+    )
 
 
 class DriveReadFileInput(BaseMCPInput):
     """Input model for reading file content."""
 
-    file_id: str = Field(
+    file_id: FileIdStr = Field(
         ...,
-        description="Google Drive file ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Drive file ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
     mime_type: Optional[str] = Field(
         default=None,
         description="Export MIME type for Google Docs/Sheets/Slides (e.g., 'text/plain', 'application/pdf', 'text/html')"
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    force_refresh: bool = Field(
+        default=False,
+        description="Bypass cached metadata to pick up edits made in the last minute"
     )
+    response_format: ResponseFormatField
 
 
 class DriveCreateFileInput(BaseMCPInput):
@@ -81,24 +196,19 @@ class DriveCreateFileInput(BaseMCPInput):
         default="text/plain",
         description="MIME type (e.g., 'text/plain', 'text/markdown', 'text/html')"
     )
-    folder_id: Optional[str] = Field(
+    folder_id: Optional[FileIdStr] = Field(
         default=None,
-        description="Parent folder ID to create file in (optional)",
-        pattern=r'^[a-zA-Z0-9_-]+$'
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format for response"
+        description="Parent folder ID to create file in (optional)"
     )
+    response_format: ResponseFormatField
 
 
 class DriveUpdateFileInput(BaseMCPInput):
     """Input model for updating an existing file."""
 
-    file_id: str = Field(
+    file_id: FileIdStr = Field(
         ...,
-        description="Google Drive file ID to update",
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Drive file ID to update"
     )
     content: Optional[str] = Field(
         default=None,
@@ -110,10 +220,7 @@ class DriveUpdateFileInput(BaseMCPInput):
         description="New file name (if renaming)",
         max_length=255
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format for response"
-    )
+    response_format: ResponseFormatField
 
 
 class DriveDeleteFileInput(FileIdInput):
@@ -121,6 +228,67 @@ class DriveDeleteFileInput(FileIdInput):
     pass
 
 
+class DriveBatchOperation(BaseMCPInput):
+    """A single operation within a drive_batch request."""
+
+    op: str = Field(
+        ...,
+        description="Operation: 'update' (rename), 'delete', or 'create_metadata' (empty file or folder)"
+    )
+    file_id: Optional[FileIdStr] = Field(
+        default=None,
+        description="File ID for 'update' and 'delete'"
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description="New name for 'update', or name for 'create_metadata'",
+        min_length=1,
+        max_length=255
+    )
+    mime_type: Optional[str] = Field(
+        default=None,
+        description="MIME type for 'create_metadata' (e.g., 'application/vnd.google-apps.folder')"
+    )
+    folder_id: Optional[FileIdStr] = Field(
+        default=None,
+        description="Parent folder ID for 'create_metadata'"
+    )
+
+    @field_validator('op')
+    @classmethod
+    def validate_op(cls, v: str) -> str:
+        """Validate operation type."""
+        if v in ('upload', 'download'):
+            raise ValueError(
+                "Media uploads and downloads cannot be batched; "
+                "use drive_upload_file or drive_download_file"
+            )
+        if v not in BATCH_OPERATIONS:
+            raise ValueError(f"op must be one of: {', '.join(BATCH_OPERATIONS)}")
+        return v
+
+    @model_validator(mode='after')
+    def validate_fields(self) -> 'DriveBatchOperation':
+        """Validate the fields required by the operation."""
+        if self.op in ('update', 'delete') and not self.file_id:
+            raise ValueError(f"'{self.op}' requires file_id")
+        if self.op in ('update', 'create_metadata') and not self.name:
+            raise ValueError(f"'{self.op}' requires name")
+        return self
+
+
+class DriveBatchInput(BaseMCPInput):
+    """Input model for batching Drive metadata operations."""
+
+    operations: List[DriveBatchOperation] = Field(
+        ...,
+        description="Operations to run (e.g., [{'op': 'update', 'file_id': '1A2B', 'name': 'new.txt'}, {'op': 'delete', 'file_id': '3C4D'}])",
+        min_length=1,
+        max_length=1000
+    )
+    response_format: ResponseFormatField
+
+
 class DriveUploadFileInput(BaseMCPInput):
     """Input model for uploading a local file."""
 
@@ -134,24 +302,19 @@ class DriveUploadFileInput(BaseMCPInput):
         description="Name for uploaded file (optional, defaults to filename from path)",
         max_length=255
     )
-    folder_id: Optional[str] = Field(
+    folder_id: Optional[FileIdStr] = Field(
         default=None,
-        description="Parent folder ID to upload to (optional)",
-        pattern=r'^[a-zA-Z0-9_-]+$'
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format for response"
+        description="Parent folder ID to upload to (optional)"
     )
+    response_format: ResponseFormatField
 
 
 class DriveDownloadFileInput(BaseMCPInput):
     """Input model for downloading a file."""
 
-    file_id: str = Field(
+    file_id: FileIdStr = Field(
         ...,
-        description="Google Drive file ID to download",
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Drive file ID to download"
     )
     local_path: str = Field(
         ...,
@@ -164,7 +327,7 @@ class DriveDownloadFileInput(BaseMCPInput):
     )
 
 
-class DriveListSharedDrivesInput(BaseListInput):
+class DriveListSharedDrivesInput(DrivePageInput):
     """Input model for listing shared drives."""
     pass
 
@@ -201,8 +364,11 @@ async def drive_search_files(params: DriveSearchInput) -> str:
             - query: Optional search query for file name matching
             - folder_id: Optional folder ID to limit search scope
             - file_type: Optional MIME type filter
+            - modified_after: Optional lower bound on modification time
             - limit: Maximum results per page (1-1000, default 20)
-            - offset: Pagination offset (default 0)
+            - page_token: Optional token for the next page of results
+            - offset: Optional number of results to skip (max 1000)
+            - include_total: Also count all matches (default False)
             - response_format: Output format (markdown/json)
 
     Returns:
@@ -211,53 +377,70 @@ async def drive_search_files(params: DriveSearchInput) -> str:
     Examples:
         - Find PDFs: file_type='application/pdf'
         - Search in folder: folder_id='1A2B3C', query='report'
-        - Limit results: limit=10, offset=0
+        - Recent files: modified_after='2024-01-01T00:00:00Z'
+        - Next page: page_token='<next_page_token from previous response>'
     """
     try:
-        # Call drive service with validated parameters
-        result = await drive_service.search_files(
-            query=params.query,
-            folder_id=params.folder_id,
-            file_type=params.file_type,
-            max_results=params.limit
-        )
-
-        if not result:
-            return "No files found matching the search criteria."
-
-        # Apply offset for pagination
-        total_count = len(result)
-        paginated_result = result[params.offset:params.offset + params.limit]
-        has_more = (params.offset + params.limit) < total_count
-
-        # Format response
-        if params.response_format == ResponseFormat.JSON:
-            pagination = format_pagination_metadata(
-                total=total_count,
-                count=len(paginated_result),
-                offset=params.offset,
-                has_more=has_more,
-                next_offset=params.offset + params.limit if has_more else None
+        async def _render():
+            # Call drive service with validated parameters
+            search = _service().search_files(
+                query=params.query,
+                folder_id=params.folder_id,
+                file_type=params.file_type,
+                max_results=params.limit,
+                modified_after=params.modified_after,
+                page_token=params.page_token,
+                offset=params.offset
             )
-            response = {
-                "files": paginated_result,
-                "pagination": pagination
-            }
-            return json.dumps(response, indent=2)
-
-        # Markdown format
-        response_text = format_file_list(paginated_result, ResponseFormat.MARKDOWN)
-
-        # Add pagination info
-        if total_count > params.limit:
-            response_text += f"\n\n📄 **Pagination**: Showing {len(paginated_result)} of {total_count} results"
-            if has_more:
-                response_text += f" (use offset={params.offset + params.limit} for more)"
-
-        return response_text
+            total = None
+            if params.include_total:
+                result, total = await asyncio.gather(search, _service().count_files(
+                    query=params.query,
+                    folder_id=params.folder_id,
+                    file_type=params.file_type,
+                    modified_after=params.modified_after
+                ))
+            else:
+                result = await search
+
+            files = result['files']
+            next_page_token = result['next_page_token']
+
+            if not files:
+                return "No files found matching the search criteria."
+
+            # Format response
+            if params.response_format == ResponseFormat.JSON:
+                pagination = {
+                    "count": len(files),
+                    "has_more": next_page_token is not None,
+                    "next_page_token": next_page_token
+                }
+                if total is not None:
+                    pagination["total"] = total
+                return to_json({
+                    "files": files,
+                    "pagination": pagination
+                })
+
+            # Markdown format
+            response_text = format_file_list(files, ResponseFormat.MARKDOWN)
+
+            # Add pagination info
+            if total is not None:
+                response_text += f"\n\n📊 **Total matches**: {total}"
+            if next_page_token:
+                response_text += (
+                    f"\n\n📄 **Pagination**: More results available "
+                    f"(use page_token='{next_page_token}')"
+                )
+
+            return response_text
+
+        return await _memoized("drive_search_files", params, _render)
 
     except Exception as e:
-        logger.error(f"drive_search_files error: {str(e)}")
+        logger.error("drive_search_files error: %s", e)
         return format_error(e, "searching files")
 
 
@@ -286,10 +469,12 @@ async def drive_read_file(params: DriveReadFileInput) -> str:
         params (DriveReadFileInput): Validated parameters with:
             - file_id: Google Drive file ID
             - mime_type: Optional export MIME type for Google Workspace files
+            - force_refresh: Bypass cached metadata (default False)
             - response_format: Output format (markdown/json)
 
     Returns:
-        str: File content with metadata
+        str: File content with metadata. In JSON mode, content larger than
+        256 KB is saved to a local temp file and returned as content_url.
 
     Examples:
         - Read text file: file_id='1A2B3C'
@@ -297,40 +482,50 @@ async def drive_read_file(params: DriveReadFileInput) -> str:
         - Export Doc as text: file_id='1A2B3C', mime_type='text/plain'
     """
     try:
-        result = await drive_service.read_file(
+        result = await _service().read_file(
             file_id=params.file_id,
-            mime_type=params.mime_type
+            mime_type=params.mime_type,
+            force_refresh=params.force_refresh
         )
 
         metadata = result.get('metadata', {})
         content = result.get('content', '')
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps({
+            if len(content) > INLINE_CONTENT_LIMIT:
+                return to_json({
+                    "metadata": metadata,
+                    "content_url": await run_blocking(_spill_to_file, content),
+                    "content_length": len(content)
+                })
+            return to_json({
                 "metadata": metadata,
                 "content": content,
                 "content_length": len(content)
-            }, indent=2)
+            })
 
         # Markdown format
-        response = f"# File: {metadata.get('name', 'Unknown')}\n\n"
-        response += f"- **ID**: `{metadata.get('id', 'N/A')}`\n"
-        response += f"- **Type**: {metadata.get('mimeType', 'unknown')}\n"
-        response += f"- **Modified**: {metadata.get('modifiedTime', 'N/A')}\n"
+        lines = [
+            f"# File: {metadata.get('name', 'Unknown')}\n",
+            f"- **ID**: `{metadata.get('id', 'N/A')}`",
+            f"- **Type**: {metadata.get('mimeType', 'unknown')}",
+            f"- **Modified**: {metadata.get('modifiedTime', 'N/A')}"
+        ]
         if metadata.get('webViewLink'):
-            response += f"- **Link**: {metadata['webViewLink']}\n"
-        response += f"\n## Content\n\n{content}"
+            lines.append(f"- **Link**: {metadata['webViewLink']}")
+        lines.append("\n## Content\n\n")
+        header = "\n".join(lines)
 
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\n\n⚠️ **Content Truncated**: File content exceeds character limit. Consider downloading the file instead."
-            return truncated
+        # Check character limit before building, so oversized content is
+        # sliced once instead of being copied into the response first
+        if len(header) + len(content) > CHARACTER_LIMIT:
+            budget = CHARACTER_LIMIT - TRUNCATION_RESERVE - len(header)
+            return "".join([header, content[:budget], _TRUNCATION_SUFFIX])
 
-        return response
+        return header + content
 
     except Exception as e:
-        logger.error(f"drive_read_file error: {str(e)}")
+        logger.error("drive_read_file error: %s", e)
         return format_error(e, "reading file")
 
 
@@ -356,7 +551,7 @@ async def drive_create_file(params: DriveCreateFileInput) -> str:
         str: Success message with file ID and link
     """
     try:
-        result = await drive_service.create_file(
+        result = await _service().create_file(
             name=params.name,
             content=params.content,
             mime_type=params.mime_type,
@@ -374,7 +569,7 @@ async def drive_create_file(params: DriveCreateFileInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"drive_create_file error: {str(e)}")
+        logger.error("drive_create_file error: %s", e)
         return format_error(e, "creating file")
 
 
@@ -406,7 +601,7 @@ async def drive_update_file(params: DriveUpdateFileInput) -> str:
                 "validating input"
             )
 
-        result = await drive_service.update_file(
+        result = await _service().update_file(
             file_id=params.file_id,
             content=params.content,
             name=params.name
@@ -422,7 +617,7 @@ async def drive_update_file(params: DriveUpdateFileInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"drive_update_file error: {str(e)}")
+        logger.error("drive_update_file error: %s", e)
         return format_error(e, "updating file")
 
 
@@ -448,17 +643,83 @@ async def drive_delete_file(params: DriveDeleteFileInput) -> str:
         str: Success confirmation message
     """
     try:
-        await drive_service.delete_file(params.file_id)
+        await _service().delete_file(params.file_id)
         return create_success_response(
             f"Deleted file with ID: {params.file_id}",
             data={"note": "File moved to trash, can be restored within 30 days"}
         )
 
     except Exception as e:
-        logger.error(f"drive_delete_file error: {str(e)}")
+        logger.error("drive_delete_file error: %s", e)
         return format_error(e, "deleting file")
 
 
+@mcp.tool(
+    name="drive_batch",
+    annotations={
+        "readOnlyHint": False,
+        "destructiveHint": True,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def drive_batch(params: DriveBatchInput) -> str:
+    """Run many Drive metadata operations in batched requests.
+
+    Sends renames, deletions and metadata-only creations (e.g., folders)
+    through Drive's batch endpoint, up to 100 operations per HTTP request.
+    Each operation succeeds or fails independently.
+
+    Use this when you need to:
+    - Rename or delete many files at once
+    - Create several folders in one step
+
+    Args:
+        params (DriveBatchInput): Validated parameters with:
+            - operations: List of operations ('update', 'delete', 'create_metadata')
+            - response_format: Output format (markdown/json)
+
+    Returns:
+        str: Per-operation results
+
+    Examples:
+        - Rename: {'op': 'update', 'file_id': '1A2B3C', 'name': 'final.txt'}
+        - Delete: {'op': 'delete', 'file_id': '1A2B3C'}
+        - New folder: {'op': 'create_metadata', 'name': 'Reports', 'mime_type': 'application/vnd.google-apps.folder'}
+
+    Note:
+        - ⚠️ 'delete' operations are destructive
+        - File content cannot be uploaded or downloaded in a batch
+    """
+    try:
+        results = await _service().batch(
+            [operation.model_dump(exclude_none=True) for operation in params.operations]
+        )
+        failed = [result for result in results if not result['success']]
+
+        if params.response_format == ResponseFormat.JSON:
+            return to_json({
+                "results": results,
+                "succeeded": len(results) - len(failed),
+                "failed": len(failed)
+            })
+
+        # Markdown format
+        lines = [f"# Batch Results ({len(results) - len(failed)} succeeded, {len(failed)} failed)\n"]
+        for result in results:
+            if result['success']:
+                detail = result['result'].get('name') or params.operations[result['index']].file_id
+                lines.append(f"- ✅ {result['index']}: {result['op']} `{detail}`")
+            else:
+                lines.append(f"- ❌ {result['index']}: {result['op']} failed: {result['error']}")
+
+        return truncate_response("\n".join(lines))
+
+    except Exception as e:
+        logger.error("drive_batch error: %s", e)
+        return format_error(e, "running batch operations")
+
+
 @mcp.tool(
     name="drive_upload_file",
     annotations={
@@ -481,7 +742,7 @@ async def drive_upload_file(params: DriveUploadFileInput) -> str:
         str: Success message with uploaded file info
     """
     try:
-        result = await drive_service.upload_file(
+        result = await _service().upload_file(
             local_path=params.local_path,
             name=params.name,
             folder_id=params.folder_id
@@ -498,7 +759,7 @@ async def drive_upload_file(params: DriveUploadFileInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"drive_upload_file error: {str(e)}")
+        logger.error("drive_upload_file error: %s", e)
         return format_error(e, "uploading file")
 
 
@@ -524,7 +785,7 @@ async def drive_download_file(params: DriveDownloadFileInput) -> str:
         str: Success message with download info
     """
     try:
-        result = await drive_service.download_file(
+        result = await _service().download_file(
             file_id=params.file_id,
             local_path=params.local_path,
             mime_type=params.mime_type
@@ -538,7 +799,7 @@ async def drive_download_file(params: DriveDownloadFileInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"drive_download_file error: {str(e)}")
+        logger.error("drive_download_file error: %s", e)
         return format_error(e, "downloading file")
 
 
@@ -564,40 +825,42 @@ async def drive_list_shared_drives(params: DriveListSharedDrivesInput) -> str:
         str: List of shared drives with metadata
     """
     try:
-        result = await drive_service.list_shared_drives(max_results=params.limit)
-
-        if not result:
-            return "No shared drives found."
-
-        # Apply pagination
-        total_count = len(result)
-        paginated_result = result[params.offset:params.offset + params.limit]
-        has_more = (params.offset + params.limit) < total_count
-
-        if params.response_format == ResponseFormat.JSON:
-            pagination = format_pagination_metadata(
-                total=total_count,
-                count=len(paginated_result),
-                offset=params.offset,
-                has_more=has_more,
-                next_offset=params.offset + params.limit if has_more else None
+        async def _render():
+            result = await _service().list_shared_drives(
+                max_results=params.limit,
+                page_token=params.page_token,
+                offset=params.offset
             )
-            return json.dumps({
-                "shared_drives": paginated_result,
-                "pagination": pagination
-            }, indent=2)
 
-        # Markdown format
-        response = f"# Shared Drives ({total_count} found)\n\n"
-        for drive in paginated_result:
-            response += f"## {drive.get('name', 'Unnamed')}\n"
-            response += f"- **ID**: `{drive.get('id')}`\n\n"
+            drives = result['drives']
+            next_page_token = result['next_page_token']
+
+            if not drives:
+                return "No shared drives found."
+
+            if params.response_format == ResponseFormat.JSON:
+                return to_json({
+                    "shared_drives": drives,
+                    "pagination": {
+                        "count": len(drives),
+                        "has_more": next_page_token is not None,
+                        "next_page_token": next_page_token
+                    }
+                })
+
+            # Markdown format
+            parts = [f"# Shared Drives ({len(drives)} shown)\n\n"]
+            parts.extend(
+                f"## {drive.get('name', 'Unnamed')}\n- **ID**: `{drive.get('id')}`\n\n"
+                for drive in drives
+            )
+            if next_page_token:
+                parts.append(f"\n📄 Use page_token='{next_page_token}' to see more results.")
 
-        if has_more:
-            response += f"\n📄 Use offset={params.offset + params.limit} to see more results."
+            return "".join(parts)
 
-        return response
+        return await _memoized("drive_list_shared_drives", params, _render)
 
     except Exception as e:
-        logger.error(f"drive_list_shared_drives error: {str(e)}")
+        logger.error("drive_list_shared_drives error: %s", e)
         return format_error(e, "listing shared drives")
@@ -1,22 +1,38 @@
 """MCP tools for Google Forms operations using FastMCP."""
 
-import json
-from typing import Optional, List, Any, Dict
-from pydantic import Field, field_validator
+from typing import Any, Dict, List, Optional
+from pydantic import Field
 
 from ..server_fastmcp import mcp
 from ..services.forms_service import FormsService
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
 from ..utils.base_models import BaseMCPInput, FormIdInput
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    to_json,
+    truncation_notice,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-forms_service = FormsService()
+
+FORM_EDIT_URL = "https://docs.google.com/forms/d/%s/edit"
+FORM_VIEW_URL = "https://docs.google.com/forms/d/%s/viewform"
+
+_TRUNCATION_SUFFIX = truncation_notice(
+    "Form content",
+    "Consider reading specific sections or reducing form complexity."
+)
+
+
+def _service() -> FormsService:
+    """Get the shared FormsService instance."""
+    return get_service('forms')
 
 
 # ============================================================================
@@ -37,62 +53,61 @@ class FormsCreateInput(BaseMCPInput):
         description="Document title (optional, defaults to form title)",
         max_length=255
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    requests: Optional[List[dict]] = Field(
+        default=None,
+        description="Optional batch update requests (e.g., createItem) applied right after creation, in the same call"
     )
+    response_format: ResponseFormatField
 
 
 class FormsReadInput(FormIdInput):
     """Input model for reading a Google Form."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class FormsUpdateInput(FormIdInput):
     """Input model for updating a Google Form."""
 
-    requests: List[Dict[str, Any]] = Field(
+    requests: List[dict] = Field(
         ...,
         description="Array of batch update requests following Google Forms API format",
-        min_items=1
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+        min_length=1
     )
-
-    @field_validator('requests')
-    @classmethod
-    def validate_requests(cls, v: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Validate requests array."""
-        if not v:
-            raise ValueError("Requests array cannot be empty")
-        for idx, req in enumerate(v):
-            if not isinstance(req, dict):
-                raise ValueError(f"Request {idx} must be a dictionary/object")
-        return v
+    response_format: ResponseFormatField
 
 
 class FormsDeleteInput(FormIdInput):
     """Input model for deleting a Google Form."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class FormsGetResponsesInput(FormIdInput):
     """Input model for getting form responses."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
+
+
+def _trim_responses(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the leading responses that fit within the character budget."""
+    budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+    responses = result.get('responses', [])
+    used = 0
+    for kept, response in enumerate(responses):
+        # Measure at the nesting depth it has in the full response
+        used += len(to_json({"responses": [response]}))
+        if used > budget:
+            break
+    else:
+        return result
+
+    return {
+        **result,
+        "responses": responses[:kept],
+        "truncated": True,
+        "note": f"Showing {kept} of {len(responses)} responses (character limit reached)."
+    }
 
 
 # ============================================================================
@@ -124,36 +139,53 @@ async def forms_create(params: FormsCreateInput) -> str:
         params (FormsCreateInput): Validated parameters with:
             - title: Form title
             - document_title: Optional document title (defaults to form title)
+            - requests: Optional batch update requests to add items right away
             - response_format: Output format (markdown/json)
 
     Returns:
         str: Form ID and web URL for editing the created form
 
+    Note:
+        - requests are applied in a second API call after the form is created
+        - If they fail, the form is still created and kept: the response
+          reports its ID and URLs plus the error, so the requests can be
+          fixed and retried with forms_update
+
     Examples:
         - Create survey: title='Customer Satisfaction Survey 2025'
         - Create registration: title='Annual Conference Registration'
         - Create quiz: title='Python Programming Quiz - Chapter 1'
+        - Create with a question: title='Poll', requests=[{"createItem": {"item": {...}, "location": {"index": 0}}}]
     """
     try:
-        result = await forms_service.create_form(
+        result = await _service().create_form(
             title=params.title,
-            document_title=params.document_title
+            document_title=params.document_title,
+            requests=params.requests
         )
 
         form_id = result.get('formId')
+        data = {
+            "form_id": form_id,
+            "title": result['info']['title'],
+            "edit_url": FORM_EDIT_URL % form_id,
+            "response_url": FORM_VIEW_URL % form_id
+        }
+        message = f"Created form '{result['info']['title']}'"
+        if result.get('requests_error'):
+            message += ", but the initial requests failed (retry them with forms_update)"
+            data["requests_processed"] = 0
+            data["requests_error"] = result['requests_error']
+        elif params.requests:
+            data["requests_processed"] = len(params.requests)
         return create_success_response(
-            f"Created form '{result['info']['title']}'",
-            data={
-                "form_id": form_id,
-                "title": result['info']['title'],
-                "edit_url": f"https://docs.google.com/forms/d/{form_id}/edit",
-                "response_url": f"https://docs.google.com/forms/d/{form_id}/viewform"
-            },
+            message,
+            data=data,
             response_format=params.response_format
         )
 
     except Exception as e:
-        logger.error(f"forms_create error: {str(e)}")
+        logger.error("forms_create error: %s", e)
         return format_error(e, "creating form")
 
 
@@ -195,37 +227,41 @@ async def forms_read(params: FormsReadInput) -> str:
         - Large forms may be truncated if exceeding 25,000 characters
     """
     try:
-        result = await forms_service.read_form(form_id=params.form_id)
+        result = await _service().read_form(form_id=params.form_id)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            return to_json(result)
 
         # Markdown format
-        response = f"# Form: {result.get('title', 'Untitled')}\\n\\n"
-        response += f"**Form ID**: `{result.get('form_id')}`\\n"
-        response += f"**Total Items**: {result.get('item_count', 0)}\\n\\n"
-
-        # Add items
+        parts = [
+            f"# Form: {result.get('title', 'Untitled')}\n\n",
+            f"**Form ID**: `{result.get('form_id')}`\n",
+            f"**Total Items**: {result.get('item_count', 0)}\n\n",
+            "## Form Items\n\n"
+        ]
+
+        # Add items; stop once the character budget is spent
         items = result.get('items', [])
         if items:
-            response += "## Form Items\\n\\n"
+            budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+            used = sum(len(part) for part in parts)
             for i, item in enumerate(items, 1):
-                response += f"{i}. **{item.get('title', 'Untitled Item')}** "
-                response += f"(Type: {item.get('question_type', 'unknown')})\\n"
+                line = (
+                    f"{i}. **{item.get('title', 'Untitled Item')}** "
+                    f"(Type: {item.get('question_type', 'unknown')})\n"
+                )
+                if used + len(line) > budget:
+                    parts.append(_TRUNCATION_SUFFIX)
+                    break
+                parts.append(line)
+                used += len(line)
         else:
-            response += "## Form Items\\n\\n_No items found in form._\\n"
+            parts.append("_No items found in form._\n")
 
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\\n\\n⚠️ **Content Truncated**: Form content exceeds character limit (25,000 chars)."
-            truncated += "\\n\\n**Tip**: Consider reading specific sections or reducing form complexity."
-            return truncated
-
-        return response
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"forms_read error: {str(e)}")
+        logger.error("forms_read error: %s", e)
         return format_error(e, "reading form")
 
 
@@ -269,7 +305,7 @@ async def forms_update(params: FormsUpdateInput) -> str:
         - See Google Forms API documentation for request formats
     """
     try:
-        await forms_service.update_form(
+        await _service().update_form(
             form_id=params.form_id,
             requests=params.requests
         )
@@ -279,13 +315,13 @@ async def forms_update(params: FormsUpdateInput) -> str:
             data={
                 "form_id": params.form_id,
                 "requests_processed": len(params.requests),
-                "edit_url": f"https://docs.google.com/forms/d/{params.form_id}/edit"
+                "edit_url": FORM_EDIT_URL % params.form_id
             },
             response_format=params.response_format
         )
 
     except Exception as e:
-        logger.error(f"forms_update error: {str(e)}")
+        logger.error("forms_update error: %s", e)
         return format_error(e, "updating form")
 
 
@@ -329,7 +365,7 @@ async def forms_delete(params: FormsDeleteInput) -> str:
         - All form responses are affected
     """
     try:
-        await forms_service.delete_form(form_id=params.form_id)
+        await _service().delete_form(form_id=params.form_id)
 
         return create_success_response(
             f"Deleted form with ID: {params.form_id}",
@@ -341,7 +377,7 @@ async def forms_delete(params: FormsDeleteInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"forms_delete error: {str(e)}")
+        logger.error("forms_delete error: %s", e)
         return format_error(e, "deleting form")
 
 
@@ -385,31 +421,29 @@ async def forms_get_responses(params: FormsGetResponsesInput) -> str:
         - Cached for 60 seconds for performance
     """
     try:
-        result = await forms_service.get_responses(form_id=params.form_id)
+        result = await _service().get_responses(form_id=params.form_id)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            response = to_json(result)
+            if len(response) <= CHARACTER_LIMIT:
+                return response
+            return to_json(_trim_responses(result))
 
         # Markdown format
-        response = f"# Form Responses\\n\\n"
-        response += f"**Form ID**: `{result.get('form_id')}`\\n"
-        response += f"**Total Responses**: {result.get('response_count', 0)}\\n\\n"
+        parts = [
+            "# Form Responses\n\n",
+            f"**Form ID**: `{result.get('form_id')}`\n",
+            f"**Total Responses**: {result.get('response_count', 0)}\n\n",
+            "## Response Data\n\n"
+        ]
 
         if result.get('response_count', 0) > 0:
-            response += "## Response Data\\n\\n"
-            response += "_Response data retrieved successfully. Use JSON format for detailed analysis._\\n"
+            parts.append("_Response data retrieved successfully. Use JSON format for detailed analysis._\n")
         else:
-            response += "## Response Data\\n\\n_No responses submitted yet._\\n"
-
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\\n\\n⚠️ **Content Truncated**: Response data exceeds character limit (25,000 chars)."
-            truncated += "\\n\\n**Tip**: Use JSON format or process responses in batches."
-            return truncated
+            parts.append("_No responses submitted yet._\n")
 
-        return response
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"forms_get_responses error: {str(e)}")
+        logger.error("forms_get_responses error: %s", e)
         return format_error(e, "getting form responses")
@@ -1,22 +1,36 @@
 """MCP tools for Gmail operations using FastMCP."""
 
-import json
-from typing import Optional, List
-from pydantic import Field, field_validator, EmailStr
+from typing import Any, Dict, List, Optional
+from pydantic import Field
 
 from ..server_fastmcp import mcp
 from ..services.gmail_service import GmailService
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
-from ..utils.base_models import BaseMCPInput, MessageIdInput, BaseListInput
+from ..utils.base_models import BaseMCPInput, MessageIdInput, BaseListInput, EmailRecipientsStr
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    to_json,
+    truncation_notice,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-gmail_service = GmailService()
+
+_TRUNCATION_SUFFIX = truncation_notice("Email content")
+
+# Offsets are emulated by paging past the skipped messages, so only small
+# offsets are accepted. Use page_token instead.
+MAX_OFFSET = 1000
+
+
+def _service() -> GmailService:
+    """Get the shared GmailService instance."""
+    return get_service('gmail')
 
 
 # ============================================================================
@@ -35,25 +49,31 @@ class GmailSearchInput(BaseListInput):
         default=None,
         description="Filter by label IDs (e.g., ['INBOX', 'UNREAD', 'IMPORTANT'])"
     )
+    page_token: Optional[str] = Field(
+        default=None,
+        description="Page token from a previous response's next_page_token to fetch the next page",
+        max_length=1000
+    )
+    offset: int = Field(
+        default=0,
+        description=f"Number of results to skip (max {MAX_OFFSET}); prefer page_token for paging",
+        ge=0,
+        le=MAX_OFFSET
+    )
 
 
 class GmailReadInput(MessageIdInput):
     """Input model for reading a Gmail message."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class GmailSendInput(BaseMCPInput):
     """Input model for sending a new Gmail message."""
 
-    to: str = Field(
+    to: EmailRecipientsStr = Field(
         ...,
-        description="Recipient email address (e.g., 'user@example.com')",
-        min_length=3,
-        max_length=320  # RFC 5321 email length limit
+        description="Recipient email address(es), comma-separated (e.g., 'user@example.com', 'Jane Doe <jane@example.com>, bob@example.com')"
     )
     subject: str = Field(
         ...,
@@ -65,28 +85,15 @@ class GmailSendInput(BaseMCPInput):
         description="Email body content (plain text or HTML)",
         max_length=1000000  # 1MB limit
     )
-    cc: Optional[str] = Field(
+    cc: Optional[EmailRecipientsStr] = Field(
         default=None,
-        description="CC email address (optional)",
-        max_length=320
+        description="CC email address(es), comma-separated (optional)"
     )
-    bcc: Optional[str] = Field(
+    bcc: Optional[EmailRecipientsStr] = Field(
         default=None,
-        description="BCC email address (optional)",
-        max_length=320
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+        description="BCC email address(es), comma-separated (optional)"
     )
-
-    @field_validator('to', 'cc', 'bcc')
-    @classmethod
-    def validate_email(cls, v: Optional[str]) -> Optional[str]:
-        """Basic email format validation."""
-        if v and '@' not in v:
-            raise ValueError("Invalid email format - must contain '@'")
-        return v
+    response_format: ResponseFormatField
 
 
 class GmailReplyInput(MessageIdInput):
@@ -97,19 +104,13 @@ class GmailReplyInput(MessageIdInput):
         description="Reply body content",
         max_length=1000000
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class GmailListLabelsInput(BaseMCPInput):
     """Input model for listing Gmail labels."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class GmailModifyLabelsInput(MessageIdInput):
@@ -117,22 +118,25 @@ class GmailModifyLabelsInput(MessageIdInput):
 
     add_labels: Optional[List[str]] = Field(
         default=None,
-        description="Label IDs to add (e.g., ['STARRED', 'IMPORTANT'])"
+        description="Label IDs or names to add (e.g., ['STARRED', 'IMPORTANT'])"
     )
     remove_labels: Optional[List[str]] = Field(
         default=None,
-        description="Label IDs to remove (e.g., ['UNREAD', 'SPAM'])"
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+        description="Label IDs or names to remove (e.g., ['UNREAD', 'SPAM'])"
     )
+    response_format: ResponseFormatField
+
 
-    @field_validator('add_labels', 'remove_labels')
-    @classmethod
-    def validate_labels_not_empty(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Ensure at least one label operation is specified."""
-        return v
+def _fit_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the leading messages that fit within the character budget."""
+    budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+    used = 0
+    for kept, message in enumerate(messages):
+        # Measure at the nesting depth it has in the full response
+        used += len(to_json({"messages": [message]}))
+        if used > budget:
+            return messages[:kept]
+    return messages
 
 
 # ============================================================================
@@ -164,6 +168,8 @@ async def gmail_search_messages(params: GmailSearchInput) -> str:
             - query: Gmail search query (e.g., 'from:user@example.com')
             - label_ids: Optional filter by label IDs
             - limit: Maximum results (default 20)
+            - page_token: Token from a previous response to fetch the next page
+            - offset: Messages to skip (prefer page_token for paging)
             - response_format: Output format (markdown/json)
 
     Returns:
@@ -175,6 +181,7 @@ async def gmail_search_messages(params: GmailSearchInput) -> str:
         - Search by date: query='after:2025/10/01 before:2025/10/31'
         - Complex search: query='from:user@example.com subject:report is:unread'
         - Filter by labels: label_ids=['INBOX', 'IMPORTANT']
+        - Next page: page_token='<next_page_token from previous response>'
 
     Gmail Search Syntax:
         - from:sender@example.com - From specific sender
@@ -187,57 +194,75 @@ async def gmail_search_messages(params: GmailSearchInput) -> str:
         - before:2025/10/31 - Before specific date
     """
     try:
-        # Call Gmail service
-        kwargs = {
-            "query": params.query,
-            "max_results": params.limit
-        }
-        if params.label_ids:
-            kwargs["label_ids"] = params.label_ids
-
-        results = await gmail_service.search_messages(**kwargs)
+        result = await _service().search_messages(
+            query=params.query,
+            max_results=params.limit,
+            label_ids=params.label_ids or None,
+            page_token=params.page_token,
+            offset=params.offset
+        )
+        messages = result['messages']
+        next_page_token = result['next_page_token']
 
-        if not results:
+        if not messages:
             return "No messages found matching the search criteria."
 
-        # Apply pagination
-        total_count = len(results)
-        paginated_results = results[params.offset:params.offset + params.limit]
-        has_more = (params.offset + params.limit) < total_count
-
         if params.response_format == ResponseFormat.JSON:
+            shown = _fit_messages(messages)
             response = {
-                "messages": paginated_results[:20],  # Limit for readability
-                "total_count": total_count,
-                "showing": len(paginated_results)
+                "messages": shown,
+                "pagination": {
+                    "count": len(shown),
+                    "has_more": next_page_token is not None,
+                    "next_page_token": next_page_token
+                }
             }
-            return json.dumps(response, indent=2)
+            if len(shown) < len(messages):
+                response["truncated"] = True
+                response["note"] = (
+                    f"Showing {len(shown)} of {len(messages)} messages (character limit "
+                    f"reached). Use a smaller 'limit' to see the rest of this page."
+                )
+            return to_json(response)
 
         # Markdown format
-        response = f"# Gmail Search Results\n\n"
-        response += f"**Query**: `{params.query or 'all messages'}`\n"
-        response += f"**Found**: {total_count} messages\n"
-        response += f"**Showing**: {len(paginated_results)}\n\n"
-
-        # Show first 20 messages
-        for idx, msg in enumerate(paginated_results[:20], 1):
-            headers = {h['name']: h['value'] for h in msg['payload'].get('headers', [])}
-            response += f"## {idx}. {headers.get('Subject', '(No subject)')}\n"
-            response += f"- **From**: {headers.get('From', 'Unknown')}\n"
-            response += f"- **Date**: {headers.get('Date', 'Unknown')}\n"
-            response += f"- **ID**: `{msg['id']}`\n"
-            response += f"- **Snippet**: {msg.get('snippet', 'N/A')[:100]}...\n\n"
-
-        if total_count > 20:
-            response += f"\n💡 **Tip**: Showing first 20 of {total_count} results. Use more specific search query to narrow results.\n"
-
-        if has_more:
-            response += f"\n📄 **Pagination**: Use offset={params.offset + params.limit} for more results.\n"
-
-        return response
+        parts = [
+            "# Gmail Search Results\n\n",
+            f"**Query**: `{params.query or 'all messages'}`\n",
+            f"**Showing**: {len(messages)} messages\n\n"
+        ]
+
+        # Stop adding messages once the character budget is spent
+        budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+        used = sum(len(part) for part in parts)
+        for idx, msg in enumerate(messages, 1):
+            headers = {h['name']: h['value'] for h in msg['payload'].get('headers', ())}
+            entry = (
+                f"## {idx}. {headers.get('Subject', '(No subject)')}\n"
+                f"- **From**: {headers.get('From', 'Unknown')}\n"
+                f"- **Date**: {headers.get('Date', 'Unknown')}\n"
+                f"- **ID**: `{msg['id']}`\n"
+                f"- **Snippet**: {msg.get('snippet', 'N/A')[:100]}...\n\n"
+            )
+            if used + len(entry) > budget:
+                tip = f"Showing {idx - 1} of {len(messages)} messages. Use a smaller 'limit' to see the rest."
+                if next_page_token:
+                    tip += f" The next page starts at page_token='{next_page_token}'."
+                parts.append(truncation_notice("Search results", tip))
+                break
+            parts.append(entry)
+            used += len(entry)
+        else:
+            if next_page_token:
+                parts.append(
+                    f"\n📄 **Pagination**: More results available "
+                    f"(use page_token='{next_page_token}')\n"
+                )
+
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"gmail_search_messages error: {str(e)}")
+        logger.error("gmail_search_messages error: %s", e)
         return format_error(e, "searching messages")
 
 
@@ -278,35 +303,37 @@ async def gmail_read_message(params: GmailReadInput) -> str:
         - HTML emails are converted to plain text
     """
     try:
-        result = await gmail_service.read_message(message_id=params.message_id)
+        result = await _service().read_message(message_id=params.message_id)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            return to_json(result)
 
         # Markdown format
         headers = result.get('headers', {})
-        response = f"# Email: {headers.get('Subject', '(No subject)')}\n\n"
-        response += f"**Message ID**: `{result['message_id']}`\n"
-        response += f"**Thread ID**: `{result['thread_id']}`\n"
-        response += f"**From**: {headers.get('From', 'Unknown')}\n"
-        response += f"**To**: {headers.get('To', 'Unknown')}\n"
+        parts = [
+            f"# Email: {headers.get('Subject', '(No subject)')}\n\n",
+            f"**Message ID**: `{result['message_id']}`\n",
+            f"**Thread ID**: `{result['thread_id']}`\n",
+            f"**From**: {headers.get('From', 'Unknown')}\n",
+            f"**To**: {headers.get('To', 'Unknown')}\n"
+        ]
         if headers.get('Cc'):
-            response += f"**Cc**: {headers['Cc']}\n"
-        response += f"**Date**: {headers.get('Date', 'Unknown')}\n"
-        response += f"**Labels**: {', '.join(result.get('labels', []))}\n\n"
-
-        response += f"## Body\n\n{result.get('body', 'No content')}"
+            parts.append(f"**Cc**: {headers['Cc']}\n")
+        parts.append(f"**Date**: {headers.get('Date', 'Unknown')}\n")
+        parts.append(f"**Labels**: {', '.join(result.get('labels', []))}\n\n")
+        parts.append("## Body\n\n")
+        header = "".join(parts)
+        body = result.get('body', 'No content')
 
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\n\n⚠️ **Content Truncated**: Email content exceeds character limit (25,000 chars)."
-            return truncated
+        # Cut only the body, and only as far as needed
+        if len(header) + len(body) > CHARACTER_LIMIT:
+            budget = CHARACTER_LIMIT - TRUNCATION_RESERVE - len(header)
+            return "".join([header, body[:budget], _TRUNCATION_SUFFIX])
 
-        return response
+        return header + body
 
     except Exception as e:
-        logger.error(f"gmail_read_message error: {str(e)}")
+        logger.error("gmail_read_message error: %s", e)
         return format_error(e, "reading message")
 
 
@@ -353,7 +380,7 @@ async def gmail_send_message(params: GmailSendInput) -> str:
         - Gmail may apply sending limits
     """
     try:
-        result = await gmail_service.send_message(
+        result = await _service().send_message(
             to=params.to,
             subject=params.subject,
             body=params.body,
@@ -374,7 +401,7 @@ async def gmail_send_message(params: GmailSendInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"gmail_send_message error: {str(e)}")
+        logger.error("gmail_send_message error: %s", e)
         return format_error(e, "sending message")
 
 
@@ -416,7 +443,7 @@ async def gmail_reply_message(params: GmailReplyInput) -> str:
         - Subject is automatically prefixed with "Re:"
     """
     try:
-        result = await gmail_service.reply_message(
+        result = await _service().reply_message(
             message_id=params.message_id,
             body=params.body
         )
@@ -431,7 +458,7 @@ async def gmail_reply_message(params: GmailReplyInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"gmail_reply_message error: {str(e)}")
+        logger.error("gmail_reply_message error: %s", e)
         return format_error(e, "replying to message")
 
 
@@ -471,32 +498,35 @@ async def gmail_list_labels(params: GmailListLabelsInput) -> str:
         - System labels: INBOX, SENT, TRASH, SPAM, STARRED, etc.
     """
     try:
-        labels = await gmail_service.list_labels()
+        labels = await _service().list_labels()
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps({"labels": labels}, indent=2)
+            return to_json({"labels": labels})
 
         # Markdown format
-        response = f"# Gmail Labels ({len(labels)} total)\n\n"
+        parts = [f"# Gmail Labels ({len(labels)} total)\n\n"]
 
-        # Separate system and user labels
-        system_labels = [l for l in labels if l['id'].isupper() or l['id'].startswith('Label_')]
-        user_labels = [l for l in labels if l not in system_labels]
+        # Separate system and user labels in one pass
+        system_lines, user_lines = [], []
+        for label in labels:
+            line = f"- **{label['name']}** (ID: `{label['id']}`)\n"
+            if label.get('type') == 'system':
+                system_lines.append(line)
+            else:
+                user_lines.append(line)
 
-        if system_labels:
-            response += "## System Labels\n\n"
-            for label in system_labels:
-                response += f"- **{label['name']}** (ID: `{label['id']}`)\n"
+        if system_lines:
+            parts.append("## System Labels\n\n")
+            parts.extend(system_lines)
 
-        if user_labels:
-            response += "\n## User Labels\n\n"
-            for label in user_labels:
-                response += f"- **{label['name']}** (ID: `{label['id']}`)\n"
+        if user_lines:
+            parts.append("\n## User Labels\n\n")
+            parts.extend(user_lines)
 
-        return response
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"gmail_list_labels error: {str(e)}")
+        logger.error("gmail_list_labels error: %s", e)
         return format_error(e, "listing labels")
 
 
@@ -524,8 +554,8 @@ async def gmail_modify_labels(params: GmailModifyLabelsInput) -> str:
     Args:
         params (GmailModifyLabelsInput): Validated parameters with:
             - message_id: Message ID to modify
-            - add_labels: Optional list of label IDs to add
-            - remove_labels: Optional list of label IDs to remove
+            - add_labels: Optional list of label IDs or names to add
+            - remove_labels: Optional list of label IDs or names to remove
             - response_format: Output format (markdown/json)
 
     Returns:
@@ -540,7 +570,7 @@ async def gmail_modify_labels(params: GmailModifyLabelsInput) -> str:
     Common Label IDs:
         - INBOX, SENT, TRASH, SPAM, DRAFT
         - STARRED, IMPORTANT, UNREAD
-        - Custom label IDs from gmail_list_labels
+        - Custom label IDs from gmail_list_labels, or their names
 
     Note:
         - Label changes are immediate
@@ -554,7 +584,7 @@ async def gmail_modify_labels(params: GmailModifyLabelsInput) -> str:
                 "validating input"
             )
 
-        result = await gmail_service.modify_labels(
+        result = await _service().modify_labels(
             message_id=params.message_id,
             add_labels=params.add_labels,
             remove_labels=params.remove_labels
@@ -576,5 +606,5 @@ async def gmail_modify_labels(params: GmailModifyLabelsInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"gmail_modify_labels error: {str(e)}")
+        logger.error("gmail_modify_labels error: %s", e)
         return format_error(e, "modifying labels")
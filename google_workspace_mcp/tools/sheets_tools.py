@@ -1,22 +1,39 @@
 """MCP tools for Google Sheets operations using FastMCP."""
 
-import json
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Literal
 from pydantic import Field, field_validator
 
 from ..server_fastmcp import mcp
 from ..services.sheets_service import SheetsService
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
-from ..utils.base_models import BaseMCPInput, SpreadsheetIdInput
+from ..utils.base_models import A1RangeStr, BaseMCPInput, SpreadsheetIdInput
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    to_json,
+    to_json_line,
+    truncation_notice,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-sheets_service = SheetsService()
+
+_RANGES_TRUNCATION_SUFFIX = truncation_notice(
+    "Range data",
+    "Request fewer or smaller ranges."
+)
+
+# sheets_read can also emit JSON Lines: one compact JSON array per row
+SheetsReadFormat = Literal["markdown", "json", "jsonl"]
+
+
+def _service() -> SheetsService:
+    """Get the shared SheetsService instance."""
+    return get_service('sheets')
 
 
 # ============================================================================
@@ -32,66 +49,50 @@ class SheetsCreateInput(BaseMCPInput):
         min_length=1,
         max_length=255
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class SheetsReadInput(SpreadsheetIdInput):
     """Input model for reading data from a Google Sheets range."""
 
-    range_name: str = Field(
+    range_name: A1RangeStr = Field(
         ...,
-        description="Range in A1 notation (e.g., 'Sheet1!A1:D10', 'Data!B2:F100', 'Summary!A:Z')",
-        min_length=1,
-        max_length=500
+        description="Range in A1 notation (e.g., 'Sheet1!A1:D10', 'Data!B2:F100', 'Summary!A:Z')"
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    response_format: SheetsReadFormat = Field(
+        default="markdown",
+        description=(
+            "Output format: 'markdown' for human-readable, 'json' for machine-readable, "
+            "or 'jsonl' for one JSON array per row (cut at a row boundary when large)"
+        )
     )
 
-    @field_validator('range_name')
-    @classmethod
-    def validate_range_name(cls, v: str) -> str:
-        """Validate A1 notation format."""
-        if not v.strip():
-            raise ValueError("Range name cannot be empty")
-        # Basic validation - should contain sheet name and range
-        if '!' not in v:
-            raise ValueError("Range must include sheet name (e.g., 'Sheet1!A1:B10')")
-        return v.strip()
+
+class SheetsReadRangesInput(SpreadsheetIdInput):
+    """Input model for reading several ranges from one spreadsheet."""
+
+    ranges: List[A1RangeStr] = Field(
+        ...,
+        description="Ranges in A1 notation (e.g., ['Sheet1!A1:D10', 'Summary!A1:B5'])",
+        min_length=1,
+        max_length=100
+    )
+    response_format: ResponseFormatField
 
 
 class SheetsWriteInput(SpreadsheetIdInput):
     """Input model for writing data to a Google Sheets range."""
 
-    range_name: str = Field(
+    range_name: A1RangeStr = Field(
         ...,
-        description="Range in A1 notation to write to (e.g., 'Sheet1!A1', 'Data!B2:D5')",
-        min_length=1,
-        max_length=500
+        description="Range in A1 notation to write to (e.g., 'Sheet1!A1', 'Data!B2:D5')"
     )
     values: List[List[Any]] = Field(
         ...,
         description="2D array of values to write (e.g., [['Name', 'Age'], ['Alice', 30], ['Bob', 25]])",
         min_items=1
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
-
-    @field_validator('range_name')
-    @classmethod
-    def validate_range_name(cls, v: str) -> str:
-        """Validate A1 notation format."""
-        if not v.strip():
-            raise ValueError("Range name cannot be empty")
-        if '!' not in v:
-            raise ValueError("Range must include sheet name (e.g., 'Sheet1!A1')")
-        return v.strip()
+    response_format: ResponseFormatField
 
     @field_validator('values')
     @classmethod
@@ -109,26 +110,29 @@ class SheetsWriteInput(SpreadsheetIdInput):
 class SheetsClearInput(SpreadsheetIdInput):
     """Input model for clearing a Google Sheets range."""
 
-    range_name: str = Field(
+    range_name: A1RangeStr = Field(
         ...,
-        description="Range in A1 notation to clear (e.g., 'Sheet1!A1:D10', 'Data!A:Z')",
-        min_length=1,
-        max_length=500
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+        description="Range in A1 notation to clear (e.g., 'Sheet1!A1:D10', 'Data!A:Z')"
     )
+    response_format: ResponseFormatField
 
-    @field_validator('range_name')
-    @classmethod
-    def validate_range_name(cls, v: str) -> str:
-        """Validate A1 notation format."""
-        if not v.strip():
-            raise ValueError("Range name cannot be empty")
-        if '!' not in v:
-            raise ValueError("Range must include sheet name (e.g., 'Sheet1!A1:D10')")
-        return v.strip()
+
+def _format_rows_jsonl(range_name: str, values: List[List[Any]]) -> str:
+    """Render a range as JSON Lines, stopping at the last row that fits.
+
+    The first line describes the range; each following line is one row.
+    """
+    budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+    lines = [to_json_line({"range": range_name, "rows": len(values)})]
+    used = len(lines[0]) + 1
+    for shown, row in enumerate(values):
+        line = to_json_line(row)
+        if used + len(line) + 1 > budget:
+            lines.append(to_json_line({"truncated": True, "rows_returned": shown}))
+            break
+        lines.append(line)
+        used += len(line) + 1
+    return "\n".join(lines)
 
 
 # ============================================================================
@@ -169,7 +173,7 @@ async def sheets_create(params: SheetsCreateInput) -> str:
         - Create budget: title='Department Budget 2025'
     """
     try:
-        result = await sheets_service.create_spreadsheet(title=params.title)
+        result = await _service().create_spreadsheet(title=params.title)
 
         spreadsheet_id = result.get('spreadsheetId')
         return create_success_response(
@@ -183,7 +187,7 @@ async def sheets_create(params: SheetsCreateInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"sheets_create error: {str(e)}")
+        logger.error("sheets_create error: %s", e)
         return format_error(e, "creating spreadsheet")
 
 
@@ -211,7 +215,7 @@ async def sheets_read(params: SheetsReadInput) -> str:
         params (SheetsReadInput): Validated parameters with:
             - spreadsheet_id: Google Sheets spreadsheet ID
             - range_name: Range in A1 notation (e.g., 'Sheet1!A1:D10')
-            - response_format: Output format (markdown/json)
+            - response_format: Output format (markdown/json/jsonl)
 
     Returns:
         str: Cell values in the specified range
@@ -228,41 +232,116 @@ async def sheets_read(params: SheetsReadInput) -> str:
         - Large ranges may be truncated if exceeding 25,000 characters
     """
     try:
-        result = await sheets_service.read_range(
+        result = await _service().read_range(
             spreadsheet_id=params.spreadsheet_id,
             range_name=params.range_name
         )
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            return to_json(result)
+
+        if params.response_format == "jsonl":
+            return _format_rows_jsonl(result.get('range', params.range_name), result.get('values', []))
 
         # Markdown format
         values = result.get('values', [])
         if not values:
             return "No data found in the specified range."
 
-        response = f"# Range: {result.get('range', params.range_name)}\n\n"
-        response += f"**Rows**: {len(values)}\n"
-        response += f"**Columns**: {len(values[0]) if values else 0}\n\n"
-        response += "## Data\n\n"
+        parts = [
+            f"# Range: {result.get('range', params.range_name)}\n\n",
+            f"**Rows**: {len(values)}\n",
+            f"**Columns**: {len(values[0]) if values else 0}\n\n",
+            "## Data\n\n"
+        ]
 
-        # Format as table
+        # Format as table; stop once the character budget is spent
+        budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+        used = sum(len(part) for part in parts)
         for row in values:
-            row_str = " | ".join(str(cell) for cell in row)
-            response += f"| {row_str} |\n"
+            line = f"| {' | '.join(map(str, row))} |\n"
+            if used + len(line) > budget:
+                parts.append(truncation_notice(
+                    "Range data",
+                    f"Request smaller ranges or use pagination (read {len(values)} rows in chunks)."
+                ))
+                break
+            parts.append(line)
+            used += len(line)
+
+        return "".join(parts)
+
+    except Exception as e:
+        logger.error("sheets_read error: %s", e)
+        return format_error(e, "reading range")
+
 
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\n\n⚠️ **Content Truncated**: Range data exceeds character limit (25,000 chars)."
-            truncated += f"\n\n**Tip**: Request smaller ranges or use pagination (read {len(values)} rows in chunks)."
-            return truncated
+@mcp.tool(
+    name="sheets_read_ranges",
+    annotations={
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def sheets_read_ranges(params: SheetsReadRangesInput) -> str:
+    """Read several ranges from a Google Sheets spreadsheet in one request.
+
+    Fetches all ranges with a single values.batchGet call, so reading data
+    spread across sheets costs one round trip instead of one per range.
+
+    Use this when you need to:
+    - Read tables from several sheets of the same spreadsheet
+    - Combine header rows and data blocks that are not adjacent
+
+    Args:
+        params (SheetsReadRangesInput): Validated parameters with:
+            - spreadsheet_id: Google Sheets spreadsheet ID
+            - ranges: Ranges in A1 notation (up to 100)
+            - response_format: Output format (markdown/json)
 
-        return response
+    Returns:
+        str: Cell values for each range, in request order
+
+    Examples:
+        - Two sheets: ranges=['Sales!A1:D50', 'Costs!A1:D50']
+        - Headers and totals: ranges=['Data!A1:Z1', 'Data!A100:Z100']
+
+    Note:
+        - Large results may be truncated if exceeding 25,000 characters
+    """
+    try:
+        result = await _service().read_ranges(
+            spreadsheet_id=params.spreadsheet_id,
+            ranges=params.ranges
+        )
+
+        if params.response_format == ResponseFormat.JSON:
+            return to_json(result)
+
+        # Markdown format; stop once the character budget is spent
+        value_ranges = result.get('value_ranges', [])
+        budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+        parts = [f"# Ranges ({len(value_ranges)})\n\n"]
+        used = len(parts[0])
+        for value_range in value_ranges:
+            values = value_range['values']
+            lines = [f"## {value_range['range']}\n\n**Rows**: {len(values)}\n\n"]
+            lines.extend(f"| {' | '.join(map(str, row))} |\n" for row in values)
+            lines.append("\n")
+            size = sum(len(line) for line in lines)
+            if used + size > budget:
+                parts.append(_RANGES_TRUNCATION_SUFFIX)
+                break
+            parts.extend(lines)
+            used += size
+
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"sheets_read error: {str(e)}")
-        return format_error(e, "reading range")
+        logger.error("sheets_read_ranges error: %s", e)
+        return format_error(e, "reading ranges")
 
 
 @mcp.tool(
@@ -308,7 +387,7 @@ async def sheets_write(params: SheetsWriteInput) -> str:
         - Array dimensions should match the target range
     """
     try:
-        result = await sheets_service.update_range(
+        result = await _service().update_range(
             spreadsheet_id=params.spreadsheet_id,
             range_name=params.range_name,
             values=params.values
@@ -327,7 +406,7 @@ async def sheets_write(params: SheetsWriteInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"sheets_write error: {str(e)}")
+        logger.error("sheets_write error: %s", e)
         return format_error(e, "writing to range")
 
 
@@ -373,36 +452,21 @@ async def sheets_clear(params: SheetsClearInput) -> str:
         - Cannot be undone via API after execution
     """
     try:
-        # Note: sheets_service should have a clear_range method
-        # For now, we'll use update_range with empty values as a workaround
-        # The actual implementation depends on SheetsService having a clear method
-
-        # Try to call clear_range if it exists, otherwise use update with empty values
-        if hasattr(sheets_service, 'clear_range'):
-            await sheets_service.clear_range(
-                spreadsheet_id=params.spreadsheet_id,
-                range_name=params.range_name
-            )
-        else:
-            # Fallback: clear by updating with empty array
-            # This is a placeholder - the service should implement clear_range
-            logger.warning("SheetsService.clear_range not found, using empty update as fallback")
-            await sheets_service.update_range(
-                spreadsheet_id=params.spreadsheet_id,
-                range_name=params.range_name,
-                values=[[]]
-            )
+        result = await _service().clear_range(
+            spreadsheet_id=params.spreadsheet_id,
+            range_name=params.range_name
+        )
 
         return create_success_response(
             f"Cleared range '{params.range_name}'",
             data={
                 "spreadsheet_id": params.spreadsheet_id,
-                "cleared_range": params.range_name,
+                "cleared_range": result.get('clearedRange', params.range_name),
                 "note": "Cell formatting and properties preserved. Values cleared."
             },
             response_format=params.response_format
         )
 
     except Exception as e:
-        logger.error(f"sheets_clear error: {str(e)}")
+        logger.error("sheets_clear error: %s", e)
         return format_error(e, "clearing range")
@@ -1,22 +1,52 @@
 """MCP tools for Google Slides operations using FastMCP."""
 
-import json
-from typing import Optional
-from pydantic import Field
+from typing import List, Literal, Optional, Union
+from pydantic import Field, field_validator
+from typing_extensions import Annotated
 
 from ..server_fastmcp import mcp
-from ..services.slides_service import SlidesService
+from ..services.slides_service import (
+    SlidesService,
+    create_slide_request,
+    delete_slide_request
+)
+from ..services.registry import get_service
 from ..utils.logger import setup_logger
+from ..utils.cache import cached_call, cache_key, get_cache
 from ..utils.base_models import BaseMCPInput, PresentationIdInput
 from ..utils.response_formatter import (
     ResponseFormat,
+    ResponseFormatField,
     format_error,
     create_success_response,
-    CHARACTER_LIMIT
+    to_json,
+    truncate_response,
+    truncation_notice,
+    CHARACTER_LIMIT,
+    TRUNCATION_RESERVE
 )
 
 logger = setup_logger(__name__)
-slides_service = SlidesService()
+
+_TRUNCATION_SUFFIX = truncation_notice(
+    "Presentation content",
+    "Consider reading individual slides or reducing content length."
+)
+
+
+def _service() -> SlidesService:
+    """Get the shared SlidesService instance."""
+    return get_service('slides')
+
+
+# Rendered slides_read responses are reused for identical params until a
+# presentation is modified through us
+RESPONSE_TTL = 60
+
+
+async def _invalidate_responses() -> None:
+    """Drop rendered responses after a change to a presentation."""
+    await get_cache("slides_responses").clear()
 
 
 # ============================================================================
@@ -32,19 +62,34 @@ class SlidesCreateInput(BaseMCPInput):
         min_length=1,
         max_length=255
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    response_format: ResponseFormatField
+
+
+class SlidesBatchCreateInput(BaseMCPInput):
+    """Input model for creating several presentations at once."""
+
+    titles: List[str] = Field(
+        ...,
+        description="Presentation titles (e.g., ['Q1 Review', 'Q2 Review'])",
+        min_length=1,
+        max_length=1000
     )
+    response_format: ResponseFormatField
+
+    @field_validator('titles')
+    @classmethod
+    def validate_titles(cls, v: List[str]) -> List[str]:
+        """Validate each title is non-empty and within the length limit."""
+        for title in v:
+            if not title.strip() or len(title) > 255:
+                raise ValueError("Each title must be 1-255 characters")
+        return [title.strip() for title in v]
 
 
 class SlidesReadInput(PresentationIdInput):
     """Input model for reading a Google Slides presentation."""
 
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class SlidesAddSlideInput(PresentationIdInput):
@@ -55,10 +100,7 @@ class SlidesAddSlideInput(PresentationIdInput):
         description="Position to insert slide (0 = beginning, None = end)",
         ge=0
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class SlidesDeleteSlideInput(PresentationIdInput):
@@ -70,10 +112,45 @@ class SlidesDeleteSlideInput(PresentationIdInput):
         min_length=1,
         max_length=200
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    response_format: ResponseFormatField
+
+
+class InsertSlideOp(BaseMCPInput):
+    """Insert a blank slide."""
+
+    action: Literal["insert"]
+    slide_index: Optional[int] = Field(
+        default=None,
+        description="Position to insert slide (0 = beginning, None = end)",
+        ge=0
+    )
+
+
+class DeleteSlideOp(BaseMCPInput):
+    """Delete a slide by object ID."""
+
+    action: Literal["delete"]
+    slide_id: str = Field(
+        ...,
+        description="Slide object ID to delete (e.g., 'g123abc456def')",
+        min_length=1,
+        max_length=200
+    )
+
+
+SlideOperation = Annotated[Union[InsertSlideOp, DeleteSlideOp], Field(discriminator="action")]
+
+
+class SlidesBulkMutateInput(PresentationIdInput):
+    """Input model for inserting and deleting several slides at once."""
+
+    operations: List[SlideOperation] = Field(
+        ...,
+        description="Operations applied in order, e.g. [{'action': 'insert', 'slide_index': 0}, {'action': 'delete', 'slide_id': 'g123abc456def'}]",
+        min_length=1,
+        max_length=500
     )
+    response_format: ResponseFormatField
 
 
 # ============================================================================
@@ -114,7 +191,7 @@ async def slides_create(params: SlidesCreateInput) -> str:
         - Create sales pitch: title='Product Demo 2025'
     """
     try:
-        result = await slides_service.create_presentation(title=params.title)
+        result = await _service().create_presentation(title=params.title)
 
         presentation_id = result.get('presentationId')
         return create_success_response(
@@ -128,10 +205,71 @@ async def slides_create(params: SlidesCreateInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"slides_create error: {str(e)}")
+        logger.error("slides_create error: %s", e)
         return format_error(e, "creating presentation")
 
 
+@mcp.tool(
+    name="slides_batch_create",
+    annotations={
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def slides_batch_create(params: SlidesBatchCreateInput) -> str:
+    """Create several Google Slides presentations in batched requests.
+
+    Sends the creations through the Slides batch endpoint, up to 100
+    presentations per HTTP request. Each creation succeeds or fails
+    independently.
+
+    Use this when you need to:
+    - Create a set of presentations in one step
+    - Set up decks for several meetings or teams
+
+    Args:
+        params (SlidesBatchCreateInput): Validated parameters with:
+            - titles: Presentation titles
+            - response_format: Output format (markdown/json)
+
+    Returns:
+        str: Per-presentation IDs and URLs, or errors
+
+    Examples:
+        - Quarterly decks: titles=['Q1 Review', 'Q2 Review', 'Q3 Review', 'Q4 Review']
+    """
+    try:
+        results = await _service().batch_create(titles=params.titles)
+        failed = [result for result in results if not result['success']]
+
+        if params.response_format == ResponseFormat.JSON:
+            return to_json({
+                "results": results,
+                "succeeded": len(results) - len(failed),
+                "failed": len(failed)
+            })
+
+        # Markdown format
+        lines = [f"# Created Presentations ({len(results) - len(failed)} succeeded, {len(failed)} failed)\n"]
+        for result in results:
+            if result['success']:
+                presentation_id = result['result'].get('presentationId')
+                lines.append(
+                    f"- ✅ {result['title']}: `{presentation_id}` "
+                    f"https://docs.google.com/presentation/d/{presentation_id}"
+                )
+            else:
+                lines.append(f"- ❌ {result['title']} failed: {result['error']}")
+
+        return truncate_response("\n".join(lines))
+
+    except Exception as e:
+        logger.error("slides_batch_create error: %s", e)
+        return format_error(e, "creating presentations")
+
+
 @mcp.tool(
     name="slides_read",
     annotations={
@@ -171,34 +309,46 @@ async def slides_read(params: SlidesReadInput) -> str:
         - Large presentations may be truncated if exceeding 25,000 characters
     """
     try:
-        result = await slides_service.read_presentation(presentation_id=params.presentation_id)
-
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
-
-        # Markdown format
-        response = f"# Presentation: {result.get('title', 'Untitled')}\n\n"
-        response += f"**Presentation ID**: `{result.get('presentation_id')}`\n"
-        response += f"**Slides**: {result.get('slide_count', 0)}\n\n"
-
-        # Add content from each slide
-        content = result.get('content', '')
-        if content:
-            response += f"## Content\n\n{content}"
-        else:
-            response += "## Content\n\n_No text content found in slides._"
-
-        # Check character limit
-        if len(response) > CHARACTER_LIMIT:
-            truncated = response[:CHARACTER_LIMIT - 200]
-            truncated += "\n\n⚠️ **Content Truncated**: Presentation content exceeds character limit (25,000 chars)."
-            truncated += "\n\n**Tip**: Consider reading individual slides or reducing content length."
-            return truncated
-
-        return response
+        async def _render():
+            result = await _service().read_presentation(presentation_id=params.presentation_id)
+
+            if params.response_format == ResponseFormat.JSON:
+                return to_json(result)
+
+            # Markdown format
+            parts = [
+                f"# Presentation: {result.get('title', 'Untitled')}\n\n",
+                f"**Presentation ID**: `{result.get('presentation_id')}`\n",
+                f"**Slides**: {result.get('slide_count', 0)}\n\n",
+                "## Content\n\n"
+            ]
+
+            # Add content from each slide; stop once the character budget is spent
+            slides = [
+                (i, slide) for i, slide in enumerate(result.get('slides', []), 1)
+                if slide.get('text')
+            ]
+            if slides:
+                budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
+                used = sum(len(part) for part in parts)
+                for i, slide in slides:
+                    chunk = f"### Slide {i} (`{slide['slide_id']}`)\n\n{slide['text']}\n\n"
+                    if used + len(chunk) > budget:
+                        parts.append(chunk[:budget - used])
+                        parts.append(_TRUNCATION_SUFFIX)
+                        break
+                    parts.append(chunk)
+                    used += len(chunk)
+            else:
+                parts.append("_No text content found in slides._")
+
+            return "".join(parts)
+
+        key = cache_key("slides_read", params.presentation_id, params.response_format)
+        return await cached_call("slides_responses", key, _render, ttl=RESPONSE_TTL)
 
     except Exception as e:
-        logger.error(f"slides_read error: {str(e)}")
+        logger.error("slides_read error: %s", e)
         return format_error(e, "reading presentation")
 
 
@@ -242,23 +392,24 @@ async def slides_add_slide(params: SlidesAddSlideInput) -> str:
         - If index exceeds slide count, slide is added at end
     """
     try:
-        result = await slides_service.add_slide(
+        result = await _service().add_slide(
             presentation_id=params.presentation_id,
-            slide_index=params.slide_index
+            insertion_index=params.slide_index
         )
+        await _invalidate_responses()
 
         return create_success_response(
             f"Added slide to presentation",
             data={
                 "presentation_id": params.presentation_id,
                 "slide_id": result.get('slide_id'),
-                "slide_index": result.get('slide_index', 'end')
+                "slide_index": 'end' if params.slide_index is None else params.slide_index
             },
             response_format=params.response_format
         )
 
     except Exception as e:
-        logger.error(f"slides_add_slide error: {str(e)}")
+        logger.error("slides_add_slide error: %s", e)
         return format_error(e, "adding slide")
 
 
@@ -307,10 +458,11 @@ async def slides_delete_slide(params: SlidesDeleteSlideInput) -> str:
         - Consider the presentation structure before deletion
     """
     try:
-        await slides_service.delete_slide(
+        await _service().delete_slide(
             presentation_id=params.presentation_id,
             slide_id=params.slide_id
         )
+        await _invalidate_responses()
 
         return create_success_response(
             f"Deleted slide with ID: {params.slide_id}",
@@ -323,5 +475,77 @@ async def slides_delete_slide(params: SlidesDeleteSlideInput) -> str:
         )
 
     except Exception as e:
-        logger.error(f"slides_delete_slide error: {str(e)}")
+        logger.error("slides_delete_slide error: %s", e)
         return format_error(e, "deleting slide")
+
+
+@mcp.tool(
+    name="slides_bulk_mutate",
+    annotations={
+        "readOnlyHint": False,
+        "destructiveHint": True,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def slides_bulk_mutate(params: SlidesBulkMutateInput) -> str:
+    """Insert and delete several slides in a single API call.
+
+    Sends all operations to the Slides API as one batch update, so N changes
+    cost one round trip instead of N. The batch is atomic: if any operation
+    fails (e.g. an unknown slide ID), none of them are applied.
+
+    Use this when you need to:
+    - Add several slides at once
+    - Remove several slides at once
+    - Restructure a presentation in one step
+
+    Args:
+        params (SlidesBulkMutateInput): Validated parameters with:
+            - presentation_id: Google Slides presentation ID
+            - operations: Insert/delete operations, applied in order
+            - response_format: Output format (markdown/json)
+
+    Returns:
+        str: IDs of inserted slides and deleted slides
+
+    Examples:
+        - Add three slides at end: operations=[{"action": "insert"}, {"action": "insert"}, {"action": "insert"}]
+        - Replace first slide: operations=[{"action": "insert", "slide_index": 0}, {"action": "delete", "slide_id": "g123abc456def"}]
+
+    Note:
+        - Slide indexes refer to the presentation as modified by earlier operations
+        - Slide object IDs can be obtained from slides_read output
+    """
+    try:
+        requests = [
+            create_slide_request(op.slide_index) if op.action == "insert"
+            else delete_slide_request(op.slide_id)
+            for op in params.operations
+        ]
+        result = await _service().update_slide(
+            presentation_id=params.presentation_id,
+            requests=requests
+        )
+        await _invalidate_responses()
+
+        inserted = [
+            reply['createSlide']['objectId']
+            for reply in result.get('replies', [])
+            if 'createSlide' in reply
+        ]
+        deleted = [op.slide_id for op in params.operations if op.action == "delete"]
+
+        return create_success_response(
+            f"Applied {len(requests)} slide operations",
+            data={
+                "presentation_id": params.presentation_id,
+                "inserted_slide_ids": inserted,
+                "deleted_slide_ids": deleted
+            },
+            response_format=params.response_format
+        )
+
+    except Exception as e:
+        logger.error("slides_bulk_mutate error: %s", e)
+        return format_error(e, "applying slide operations")
@@ -1,8 +1,56 @@
 """Common Pydantic models for Google Workspace MCP tools."""
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import re
+from email.utils import getaddresses
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, StringConstraints
 from typing import Optional
-from .response_formatter import ResponseFormat
+from typing_extensions import Annotated
+from .response_formatter import ResponseFormatField
+
+
+# Google resource ID (Drive file, document, spreadsheet, presentation, form
+# or Gmail message). The pattern is compiled once, when the schema is built,
+# and matched by pydantic-core's linear-time Rust regex engine.
+FileIdStr = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=200, pattern=r'^[a-zA-Z0-9_-]+$')
+]
+
+# Sheets range in A1 notation with a sheet name: Sheet1!A1:D10, Data!A:Z,
+# Log!2:40 or 'Q1 Sales'!B2 (quotes escaped by doubling)
+A1RangeStr = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=1,
+        max_length=500,
+        pattern=r"^(?:'(?:[^']|'')+'|[^'!]+)!(?:[A-Za-z]{1,3}\d*|\d+)(?::(?:[A-Za-z]{1,3}\d*|\d+))?$"
+    )
+]
+
+_EMAIL_ADDRESS = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def _validate_recipients(value: str) -> str:
+    """Check every address in a recipient header value (local@domain.tld)."""
+    addresses = [
+        address for name, address in getaddresses([value]) if name or address
+    ]
+    if not addresses:
+        raise ValueError("At least one email address is required")
+    for address in addresses:
+        if not _EMAIL_ADDRESS.match(address):
+            raise ValueError(f"Invalid email address: '{address}'")
+    return value
+
+
+# Recipient header value: one or more comma-separated addresses, each
+# optionally with a display name (e.g., 'a@example.com, Name <b@example.org>')
+EmailRecipientsStr = Annotated[
+    str,
+    StringConstraints(min_length=3, max_length=10000),
+    AfterValidator(_validate_recipients)
+]
 
 
 class BaseMCPInput(BaseModel):
@@ -10,8 +58,9 @@ class BaseMCPInput(BaseModel):
 
     model_config = ConfigDict(
         str_strip_whitespace=True,  # Auto-strip whitespace from strings
-        validate_assignment=True,    # Validate on assignment
+        frozen=True,                 # Inputs are never mutated after validation
         extra='forbid',              # Forbid extra fields
+        validate_default=False,      # Trust declared defaults
         use_enum_values=True         # Use enum values instead of enum objects
     )
 
@@ -30,126 +79,58 @@ class BaseListInput(BaseMCPInput):
         description="Number of results to skip for pagination",
         ge=0
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
-    )
+    response_format: ResponseFormatField
 
 
 class FileIdInput(BaseMCPInput):
     """Base model for operations requiring a file ID."""
 
-    file_id: str = Field(
+    file_id: FileIdStr = Field(
         ...,
-        description="Google Drive/Docs/Sheets/Slides file ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        max_length=200,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Drive/Docs/Sheets/Slides file ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
 
-    @field_validator('file_id')
-    @classmethod
-    def validate_file_id(cls, v: str) -> str:
-        """Validate file ID format."""
-        if not v.strip():
-            raise ValueError("File ID cannot be empty")
-        return v.strip()
-
 
-class DocumentIdInput(FileIdInput):
+class DocumentIdInput(BaseMCPInput):
     """Base model for Google Docs operations."""
 
-    document_id: str = Field(
+    document_id: FileIdStr = Field(
         ...,
-        description="Google Docs document ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        max_length=200,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Docs document ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
 
-    @field_validator('document_id')
-    @classmethod
-    def validate_document_id(cls, v: str) -> str:
-        """Validate document ID format."""
-        if not v.strip():
-            raise ValueError("Document ID cannot be empty")
-        return v.strip()
-
 
 class SpreadsheetIdInput(BaseMCPInput):
     """Base model for Google Sheets operations."""
 
-    spreadsheet_id: str = Field(
+    spreadsheet_id: FileIdStr = Field(
         ...,
-        description="Google Sheets spreadsheet ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        max_length=200,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Sheets spreadsheet ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
 
-    @field_validator('spreadsheet_id')
-    @classmethod
-    def validate_spreadsheet_id(cls, v: str) -> str:
-        """Validate spreadsheet ID format."""
-        if not v.strip():
-            raise ValueError("Spreadsheet ID cannot be empty")
-        return v.strip()
-
 
 class PresentationIdInput(BaseMCPInput):
     """Base model for Google Slides operations."""
 
-    presentation_id: str = Field(
+    presentation_id: FileIdStr = Field(
         ...,
-        description="Google Slides presentation ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        max_length=200,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Slides presentation ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
 
-    @field_validator('presentation_id')
-    @classmethod
-    def validate_presentation_id(cls, v: str) -> str:
-        """Validate presentation ID format."""
-        if not v.strip():
-            raise ValueError("Presentation ID cannot be empty")
-        return v.strip()
-
 
 class MessageIdInput(BaseMCPInput):
     """Base model for Gmail message operations."""
 
-    message_id: str = Field(
+    message_id: FileIdStr = Field(
         ...,
-        description="Gmail message ID (e.g., '18a1b2c3d4e5f6g7')",
-        min_length=1,
-        max_length=200
+        description="Gmail message ID (e.g., '18a1b2c3d4e5f6g7')"
     )
 
-    @field_validator('message_id')
-    @classmethod
-    def validate_message_id(cls, v: str) -> str:
-        """Validate message ID format."""
-        if not v.strip():
-            raise ValueError("Message ID cannot be empty")
-        return v.strip()
-
 
 class FormIdInput(BaseMCPInput):
     """Base model for Google Forms operations."""
 
-    form_id: str = Field(
+    form_id: FileIdStr = Field(
         ...,
-        description="Google Forms form ID (e.g., '1A2B3C4D5E6F7G8H9I0J')",
-        min_length=1,
-        max_length=200,
-        pattern=r'^[a-zA-Z0-9_-]+$'
+        description="Google Forms form ID (e.g., '1A2B3C4D5E6F7G8H9I0J')"
     )
-
-    @field_validator('form_id')
-    @classmethod
-    def validate_form_id(cls, v: str) -> str:
-        """Validate form ID format."""
-        if not v.strip():
-            raise ValueError("Form ID cannot be empty")
-        return v.strip()
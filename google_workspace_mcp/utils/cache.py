@@ -1,16 +1,22 @@
 """Caching utilities for Google Workspace API responses."""
 
 import asyncio
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
-from cachetools import TTLCache
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class AsyncCache:
-    """Async-safe cache with TTL support."""
+    """Async-safe LRU cache with TTL support.
+
+    Entries are stored as (expiry, value) in an OrderedDict kept in
+    least-recently-used order. Expiry is checked lazily when an entry is
+    read, so there is no expiry bookkeeping on writes.
+    """
 
     def __init__(self, maxsize: int = 1000, ttl: int = 300):
         """Initialize cache.
@@ -19,7 +25,9 @@ class AsyncCache:
             maxsize: Maximum number of cached items
             ttl: Time-to-live in seconds
         """
-        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
         self._lock = asyncio.Lock()
         self._stats = {
             "hits": 0,
@@ -27,42 +35,50 @@ class AsyncCache:
             "evictions": 0
         }
 
-    async def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
 
+        Reads take no lock: the lookup never awaits, so it cannot interleave
+        with a mutation on the event loop.
+
         Args:
             key: Cache key
 
         Returns:
             Cached value or None if not found/expired
         """
-        async with self._lock:
-            try:
-                value = self._cache[key]
-                self._stats["hits"] += 1
-                logger.debug(f"Cache hit for key: {key}")
-                return value
-            except KeyError:
-                self._stats["misses"] += 1
-                logger.debug(f"Cache miss for key: {key}")
-                return None
-
-    async def set(self, key: str, value: Any) -> None:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._cache[key]
+            self._stats["misses"] += 1
+            logger.debug("Cache miss for key: %s", key)
+            return None
+        self._cache.move_to_end(key)
+        value = entry[1]
+        self._stats["hits"] += 1
+        logger.debug("Cache hit for key: %s", key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """Set value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Time-to-live in seconds for this entry (defaults to the cache TTL)
         """
         async with self._lock:
-            old_size = len(self._cache)
-            self._cache[key] = value
-            new_size = len(self._cache)
+            expires = time.monotonic() + (self._ttl if ttl is None else ttl)
+            self._cache[key] = (expires, value)
+            self._cache.move_to_end(key)
 
-            if new_size < old_size:
+            # Evict least recently used entries
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
                 self._stats["evictions"] += 1
 
-            logger.debug(f"Cached value for key: {key}")
+            logger.debug("Cached value for key: %s", key)
 
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
@@ -76,7 +92,7 @@ class AsyncCache:
         async with self._lock:
             try:
                 del self._cache[key]
-                logger.debug(f"Deleted cache key: {key}")
+                logger.debug("Deleted cache key: %s", key)
                 return True
             except KeyError:
                 return False
@@ -103,9 +119,18 @@ class AsyncCache:
         }
 
 
+# Keys longer than this (e.g. search queries, serialized params) are
+# shortened to a readable prefix plus a digest of the full key
+MAX_KEY_LENGTH = 200
+KEY_PREFIX_LENGTH = 64
+
+
 # Global cache instances per service
 _caches: Dict[str, AsyncCache] = {}
 
+# Fetches in progress, so concurrent misses on one key share a single call
+_inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
 
 def get_cache(service: str, **kwargs) -> AsyncCache:
     """Get or create cache for a service.
@@ -117,9 +142,10 @@ def get_cache(service: str, **kwargs) -> AsyncCache:
     Returns:
         AsyncCache instance
     """
-    if service not in _caches:
-        _caches[service] = AsyncCache(**kwargs)
-    return _caches[service]
+    cache = _caches.get(service)
+    if cache is not None:
+        return cache
+    return _caches.setdefault(service, AsyncCache(**kwargs))
 
 
 def cache_key(*args, **kwargs) -> str:
@@ -134,7 +160,11 @@ def cache_key(*args, **kwargs) -> str:
     """
     parts = [str(arg) for arg in args]
     parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    return ":".join(parts)
+    key = ":".join(parts)
+    if len(key) > MAX_KEY_LENGTH:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        key = f"{key[:KEY_PREFIX_LENGTH]}:{digest}"
+    return key
 
 
 async def cached_call(
@@ -147,6 +177,9 @@ async def cached_call(
 ) -> Any:
     """Execute function with caching.
 
+    Concurrent calls that miss on the same key wait for the first caller's
+    fetch instead of issuing their own.
+
     Args:
         service: Service name for cache selection
         key: Cache key
@@ -158,19 +191,30 @@ async def cached_call(
     Returns:
         Result of func execution (from cache or fresh)
     """
-    cache = get_cache(service, ttl=ttl) if ttl else get_cache(service)
+    cache = get_cache(service)
 
     # Check cache
-    cached_value = await cache.get(key)
+    cached_value = cache.get(key)
     if cached_value is not None:
         return cached_value
 
-    # Execute function
-    if asyncio.iscoroutinefunction(func):
-        result = await func(*args, **kwargs)
-    else:
-        result = func(*args, **kwargs)
-
-    # Cache result
-    await cache.set(key, result)
-    return result
+    # Join a fetch already in progress for this key
+    inflight_key = (service, key)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        async def _fetch():
+            # Execute function
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+
+            # Cache result
+            await cache.set(key, result, ttl=ttl)
+            return result
+
+        task = asyncio.ensure_future(_fetch())
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
+
+    return await asyncio.shield(task)
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, Optional
 from google.api_core import exceptions as google_exceptions
+from googleapiclient.errors import HttpError
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -57,48 +58,54 @@ class InvalidRequestError(GoogleWorkspaceError):
     pass
 
 
+# Google API exception class -> (custom error class, message, details).
+# Keys are the HTTP-status classes, so their gRPC subclasses (e.g.
+# Unauthenticated, InvalidArgument) are found by walking the MRO.
+_ERROR_MAP = {
+    google_exceptions.Unauthorized: (
+        AuthenticationError, "Authentication failed. Please check your credentials.", None
+    ),
+    google_exceptions.Forbidden: (
+        PermissionError, "Permission denied. Check your account permissions.", None
+    ),
+    google_exceptions.NotFound: (
+        ResourceNotFoundError, "Requested resource not found.", None
+    ),
+    google_exceptions.TooManyRequests: (
+        RateLimitError, "API rate limit exceeded. Please try again later.", {"retry_after": 60}
+    ),
+    google_exceptions.BadRequest: (
+        InvalidRequestError, "Invalid request parameters.", None
+    ),
+}
+
+
 def handle_google_api_error(error: Exception) -> GoogleWorkspaceError:
     """Convert Google API exceptions to custom exceptions.
 
     Args:
-        error: Original Google API exception
+        error: Original Google API exception (api_core error or
+            googleapiclient HttpError)
 
     Returns:
         Appropriate GoogleWorkspaceError subclass
     """
-    if isinstance(error, google_exceptions.Unauthenticated):
-        return AuthenticationError(
-            "Authentication failed. Please check your credentials.",
-            original_error=error
-        )
-
-    if isinstance(error, google_exceptions.PermissionDenied):
-        return PermissionError(
-            "Permission denied. Check your account permissions.",
-            original_error=error
-        )
-
-    if isinstance(error, google_exceptions.NotFound):
-        return ResourceNotFoundError(
-            "Requested resource not found.",
-            original_error=error
-        )
-
-    if isinstance(error, google_exceptions.ResourceExhausted):
-        return RateLimitError(
-            "API rate limit exceeded. Please try again later.",
-            details={"retry_after": 60},
-            original_error=error
-        )
-
-    if isinstance(error, google_exceptions.InvalidArgument):
-        return InvalidRequestError(
-            "Invalid request parameters.",
-            original_error=error
-        )
+    api_error = error
+    if isinstance(error, HttpError):
+        api_error = google_exceptions.from_http_status(error.resp.status, str(error))
+
+    for cls in type(api_error).__mro__:
+        mapped = _ERROR_MAP.get(cls)
+        if mapped is not None:
+            error_class, message, details = mapped
+            return error_class(
+                message,
+                details=dict(details) if details else None,
+                original_error=error
+            )
 
     # Generic error for unexpected exceptions
-    logger.error(f"Unhandled Google API error: {error}")
+    logger.error("Unhandled Google API error: %s", error)
     return GoogleWorkspaceError(
         "An unexpected error occurred.",
         details={"original_error": str(error)},
@@ -121,7 +128,7 @@ def with_error_handling(func):
         except GoogleWorkspaceError:
             # Re-raise custom errors as-is
             raise
-        except google_exceptions.GoogleAPICallError as e:
+        except (google_exceptions.GoogleAPICallError, HttpError) as e:
             # Convert Google API errors
             raise handle_google_api_error(e)
         except Exception as e:
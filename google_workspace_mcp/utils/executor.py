@@ -0,0 +1,49 @@
+"""Helpers for running blocking Google API client calls off the event loop."""
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# googleapiclient is synchronous, so every in-flight API call holds a worker
+# thread. The loop's default executor is capped at min(32, cpu + 4) threads,
+# which queues bursts of network-bound calls behind each other; use a
+# dedicated, larger pool instead.
+MAX_WORKERS = int(os.environ.get("GW_MCP_API_WORKERS", "64"))
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="google-api")
+
+
+async def execute(request) -> Any:
+    """Execute a googleapiclient request in a worker thread.
+
+    googleapiclient performs blocking HTTP I/O, so calling ``execute()``
+    directly would stall every other coroutine for the whole round trip.
+
+    Args:
+        request: HttpRequest or BatchHttpRequest to execute
+
+    Returns:
+        Result of ``request.execute()``
+    """
+    return await run_blocking(request.execute)
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable in a worker thread.
+
+    Args:
+        func: Function to execute
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func execution
+    """
+    loop = asyncio.get_running_loop()
+    # Propagate context variables like asyncio.to_thread does
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor, call)
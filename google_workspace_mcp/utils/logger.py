@@ -4,10 +4,23 @@ import logging
 import sys
 from typing import Optional
 
+PACKAGE_LOGGER = 'google_workspace_mcp'
+
+# Console handler, built once and shared - MUST use stderr for MCP stdio
+# servers. Writing to stdout corrupts JSON-RPC protocol messages
+_HANDLER = logging.StreamHandler(sys.stderr)
+_HANDLER.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """Setup logger with consistent formatting.
 
+    Loggers inside the package propagate to the package logger, which owns
+    the only handler, so each record is written once.
+
     Args:
         name: Logger name
         level: Logging level (defaults to INFO)
@@ -21,25 +34,19 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    if name == PACKAGE_LOGGER or name.startswith(PACKAGE_LOGGER + '.'):
+        owner = logging.getLogger(PACKAGE_LOGGER)
+        # The MCP framework configures the root logger too; stop there so
+        # records are not printed a second time
+        owner.propagate = False
+    else:
+        owner = logger
+
     # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-
-    # Console handler - MUST use stderr for MCP stdio servers
-    # Writing to stdout corrupts JSON-RPC protocol messages
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setLevel(level)
-
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
-
-    logger.addHandler(handler)
+    if _HANDLER not in owner.handlers:
+        owner.addHandler(_HANDLER)
     return logger
 
 
 # Default logger for the application
-default_logger = setup_logger('google_workspace_mcp')
+default_logger = setup_logger(PACKAGE_LOGGER)
@@ -10,7 +10,11 @@ logger = setup_logger(__name__)
 
 
 class RateLimiter:
-    """Rate limiter for API calls with sliding window algorithm."""
+    """Rate limiter for API calls with token bucket algorithm.
+
+    The bucket holds up to max_requests tokens and refills at
+    max_requests / time_window tokens per second.
+    """
 
     def __init__(
         self,
@@ -28,7 +32,11 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.burst_limit = burst_limit
-        self.requests: deque = deque()
+        self.rate = max_requests / time_window
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        # Timestamps from the last second, pruned at the head
+        self._burst_window: deque = deque()
         self.lock = asyncio.Lock()
 
     async def acquire(self, service: str = "default") -> bool:
@@ -41,52 +49,54 @@ class RateLimiter:
             True if request is allowed, False otherwise
         """
         async with self.lock:
-            now = time.time()
-
-            # Remove expired requests from window
-            while self.requests and self.requests[0] <= now - self.time_window:
-                self.requests.popleft()
-
-            # Check if limit exceeded
-            if len(self.requests) >= self.max_requests:
-                wait_time = self.requests[0] + self.time_window - now
-                logger.warning(
-                    f"Rate limit reached for {service}. "
-                    f"Waiting {wait_time:.2f}s"
-                )
-                await asyncio.sleep(wait_time)
-                return await self.acquire(service)
-
-            # Check burst limit
-            if len(self.requests) >= self.burst_limit:
-                recent_requests = [
-                    r for r in self.requests
-                    if r > now - 1.0  # Last second
-                ]
-                if len(recent_requests) >= self.burst_limit:
-                    await asyncio.sleep(0.1)  # Small delay
+            # Re-check both limits after every sleep so the recorded
+            # timestamp is the time the request is actually let through
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens < 1:
+                    wait_time = (1 - self.tokens) / self.rate
+                    logger.warning(
+                        "Rate limit reached for %s. Waiting %.2fs", service, wait_time
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                while self._burst_window and self._burst_window[0] <= now - 1.0:
+                    self._burst_window.popleft()
+                if len(self._burst_window) >= self.burst_limit:
+                    # Wait until the oldest request leaves the one-second window
+                    await asyncio.sleep(self._burst_window[0] + 1.0 - now)
+                    continue
+                break
 
             # Record request
-            self.requests.append(now)
+            self.tokens -= 1
+            self._burst_window.append(now)
             return True
 
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        self.tokens = min(
+            float(self.max_requests),
+            self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
     def get_stats(self) -> Dict[str, any]:
         """Get current rate limiter statistics.
 
         Returns:
             Dictionary with statistics
         """
-        now = time.time()
-        active_requests = [
-            r for r in self.requests
-            if r > now - self.time_window
-        ]
+        self._refill(time.monotonic())
+        active_requests = self.max_requests - self.tokens
 
         return {
-            "active_requests": len(active_requests),
+            "active_requests": round(active_requests),
             "max_requests": self.max_requests,
             "time_window": self.time_window,
-            "utilization": len(active_requests) / self.max_requests
+            "utilization": active_requests / self.max_requests
         }
 
 
@@ -104,9 +114,10 @@ def get_rate_limiter(service: str, **kwargs) -> RateLimiter:
     Returns:
         RateLimiter instance
     """
-    if service not in _rate_limiters:
-        _rate_limiters[service] = RateLimiter(**kwargs)
-    return _rate_limiters[service]
+    limiter = _rate_limiters.get(service)
+    if limiter is not None:
+        return limiter
+    return _rate_limiters.setdefault(service, RateLimiter(**kwargs))
 
 
 async def rate_limited_call(service: str, func, *args, **kwargs):
@@ -1,14 +1,30 @@
 """Response formatting utilities for Google Workspace MCP tools."""
 
 import json
+import os
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime
+from pydantic import Field
+from typing_extensions import Annotated
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 # Character limit for responses (MCP best practice)
 CHARACTER_LIMIT = 25000
 
+# Room kept free below CHARACTER_LIMIT for a truncation notice
+TRUNCATION_RESERVE = 200
+
+# Set GW_MCP_COMPACT_JSON=1 when responses are consumed by machines;
+# indentation roughly doubles the size of JSON output
+COMPACT_JSON = os.environ.get("GW_MCP_COMPACT_JSON", "").lower() in ("1", "true", "yes")
+JSON_INDENT: Optional[int] = None if COMPACT_JSON else 2
+
 
 class ResponseFormat(str, Enum):
     """Output format options for tool responses."""
@@ -16,6 +32,53 @@ class ResponseFormat(str, Enum):
     JSON = "json"
 
 
+# Literal counterpart of ResponseFormat for input models; validated as a
+# plain string membership check instead of an enum lookup.
+ResponseFormatType = Literal["markdown", "json"]
+
+# Shared response_format field for tool input models
+ResponseFormatField = Annotated[
+    ResponseFormatType,
+    Field(
+        default="markdown",
+        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    )
+]
+
+
+def to_json(data: Any) -> str:
+    """Serialize a tool response as JSON (indented unless COMPACT_JSON).
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Non-ASCII text is emitted as-is in both cases.
+
+    Args:
+        data: JSON-serializable response data
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        if COMPACT_JSON:
+            return orjson.dumps(data).decode()
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=JSON_INDENT, ensure_ascii=False)
+
+
+def to_json_line(data: Any) -> str:
+    """Serialize one compact JSON value (no newlines) for JSON Lines output.
+
+    Args:
+        data: JSON-serializable value
+
+    Returns:
+        Single-line JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
 def format_timestamp(timestamp: Optional[str]) -> str:
     """Convert ISO timestamp to human-readable format.
 
@@ -49,62 +112,42 @@ def format_file_list(files: List[Dict[str, Any]], response_format: ResponseForma
         return "No files found."
 
     if response_format == ResponseFormat.JSON:
-        return json.dumps({"files": files, "count": len(files)}, indent=2)
+        return to_json({"files": files, "count": len(files)})
 
-    # Markdown format
+    # Markdown format; stop adding files once the character budget is spent
+    budget = CHARACTER_LIMIT - TRUNCATION_RESERVE
     lines = [f"# Files ({len(files)} found)\n"]
-    for file in files:
+    used = len(lines[0]) + 1
+    for shown, file in enumerate(files):
         name = file.get('name', 'Unnamed')
         file_id = file.get('id', 'N/A')
         mime_type = file.get('mimeType', 'unknown')
         modified = format_timestamp(file.get('modifiedTime'))
         web_link = file.get('webViewLink', '')
 
-        lines.append(f"## {name}")
-        lines.append(f"- **ID**: `{file_id}`")
-        lines.append(f"- **Type**: {mime_type}")
-        lines.append(f"- **Modified**: {modified}")
+        entry = [
+            f"## {name}",
+            f"- **ID**: `{file_id}`",
+            f"- **Type**: {mime_type}",
+            f"- **Modified**: {modified}"
+        ]
         if web_link:
-            lines.append(f"- **Link**: {web_link}")
-        lines.append("")
+            entry.append(f"- **Link**: {web_link}")
+        entry.append("")
+
+        size = sum(len(line) + 1 for line in entry)
+        if used + size > budget:
+            lines.append(
+                f"⚠️ **Response Truncated**: Showing {shown} of {len(files)} files. "
+                f"Use a smaller 'limit' or add filters to see the rest."
+            )
+            break
+        lines.extend(entry)
+        used += size
 
     return "\n".join(lines)
 
 
-def format_pagination_metadata(
-    total: Optional[int],
-    count: int,
-    offset: int,
-    has_more: bool,
-    next_offset: Optional[int] = None
-) -> Dict[str, Any]:
-    """Create pagination metadata dictionary.
-
-    Args:
-        total: Total number of items available
-        count: Number of items in current response
-        offset: Current offset position
-        has_more: Whether more items are available
-        next_offset: Offset for next page if has_more is True
-
-    Returns:
-        Pagination metadata dictionary
-    """
-    metadata = {
-        "count": count,
-        "offset": offset,
-        "has_more": has_more
-    }
-
-    if total is not None:
-        metadata["total"] = total
-
-    if has_more and next_offset is not None:
-        metadata["next_offset"] = next_offset
-
-    return metadata
-
-
 def truncate_response(
     response_text: str,
     items: Optional[List[Any]] = None,
@@ -156,6 +199,27 @@ def truncate_response(
     return truncated + truncation_message
 
 
+def truncation_notice(subject: str, tip: Optional[str] = None) -> str:
+    """Build the notice appended to content cut at CHARACTER_LIMIT.
+
+    Tools build their notice once at import time and reuse it.
+
+    Args:
+        subject: What was truncated (e.g., 'Document content')
+        tip: Optional hint on how to get the rest
+
+    Returns:
+        Truncation notice text
+    """
+    notice = (
+        f"\n\n⚠️ **Content Truncated**: {subject} exceeds character limit "
+        f"({CHARACTER_LIMIT:,} chars)."
+    )
+    if tip:
+        notice += f"\n\n**Tip**: {tip}"
+    return notice
+
+
 def format_error(error: Exception, context: str = "") -> str:
     """Format error message for tool responses.
 
@@ -204,14 +268,16 @@ def create_success_response(
         response = {"success": True, "message": message}
         if data:
             response["data"] = data
-        return json.dumps(response, indent=2)
+        return to_json(response)
 
     # Markdown format
-    result = f"✅ **Success**: {message}"
+    parts = [f"✅ **Success**: {message}"]
 
     if data:
-        result += "\n\n**Details:**"
-        for key, value in data.items():
-            result += f"\n- **{key.replace('_', ' ').title()}**: {value}"
+        parts.append("\n\n**Details:**")
+        parts.extend(
+            f"\n- **{key.replace('_', ' ').title()}**: {value}"
+            for key, value in data.items()
+        )
 
-    return result
+    return "".join(parts)
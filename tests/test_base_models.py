@@ -0,0 +1,76 @@
+"""Tests for common input models."""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from google_workspace_mcp.utils.base_models import (
+    A1RangeStr,
+    BaseListInput,
+    DocumentIdInput,
+    EmailRecipientsStr,
+    FileIdInput,
+    MessageIdInput
+)
+
+
+class TestBaseModels:
+    """Test common input model configuration."""
+
+    def test_inputs_are_frozen(self):
+        """Test validated inputs cannot be mutated."""
+        params = BaseListInput(limit=5)
+        with pytest.raises(ValidationError):
+            params.limit = 10
+
+    def test_extra_fields_forbidden(self):
+        """Test unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            BaseListInput(unknown=True)
+
+    def test_file_id_format(self):
+        """Test file IDs are stripped and checked against the ID pattern."""
+        assert FileIdInput(file_id=" 1A2B_3c-4 ").file_id == "1A2B_3c-4"
+        for bad in ("", "a/b", "x" * 201):
+            with pytest.raises(ValidationError):
+                FileIdInput(file_id=bad)
+
+    def test_document_id_input_needs_only_document_id(self):
+        """Test Docs inputs take document_id alone."""
+        assert DocumentIdInput(document_id="1A2B").document_id == "1A2B"
+        with pytest.raises(ValidationError):
+            DocumentIdInput(document_id="1A2B", file_id="1A2B")
+
+    def test_message_id_format(self):
+        """Test message IDs share the ID constraints."""
+        assert MessageIdInput(message_id=" 18a1b2c3d4e5f6g7 ").message_id == "18a1b2c3d4e5f6g7"
+        with pytest.raises(ValidationError):
+            MessageIdInput(message_id="   ")
+
+    def test_email_address_format(self):
+        """Test email addresses need a local part, a domain and a dot."""
+        adapter = TypeAdapter(EmailRecipientsStr)
+        assert adapter.validate_python("user@example.com") == "user@example.com"
+        for bad in ("@", "user@localhost", "a b@example.com"):
+            with pytest.raises(ValidationError):
+                adapter.validate_python(bad)
+
+    def test_email_recipients_with_display_names_and_lists(self):
+        """Test display names and comma-separated lists are accepted."""
+        adapter = TypeAdapter(EmailRecipientsStr)
+        for good in (
+            "Jane Doe <jane@example.com>",
+            "a@example.com, b@example.org",
+            '"Doe, Jane" <jane@example.com>, Bob <bob@example.org>'
+        ):
+            assert adapter.validate_python(good) == good
+        for bad in ("a@example.com, user@localhost", "Jane <jane>"):
+            with pytest.raises(ValidationError):
+                adapter.validate_python(bad)
+
+    def test_a1_range_format(self):
+        """Test A1 ranges need a sheet name and a cell, column or row range."""
+        adapter = TypeAdapter(A1RangeStr)
+        for good in ("Sheet1!A1:D10", "Data!A:Z", "Log!2:40", "'Q1 Sales'!B2"):
+            assert adapter.validate_python(f" {good} ") == good
+        for bad in ("Sheet1", "Sheet1!", "Sheet1!A1:", "S!!A1"):
+            with pytest.raises(ValidationError):
+                adapter.validate_python(bad)
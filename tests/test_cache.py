@@ -0,0 +1,96 @@
+"""Tests for caching utilities."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from google_workspace_mcp.utils.cache import AsyncCache, cache_key, cached_call
+
+
+@pytest.mark.asyncio
+class TestCachedCall:
+    """Test cached_call behaviour."""
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test concurrent calls for one key run the function once."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(
+            *[cached_call("test_coalesce", "key", fetch) for _ in range(5)]
+        )
+
+        assert len(calls) == 1
+        assert all(result == {"value": 1} for result in results)
+
+    async def test_failed_fetch_is_not_cached(self):
+        """Test an exception reaches the caller and the next call retries."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await cached_call("test_retry", "key", fetch)
+
+        assert await cached_call("test_retry", "key", fetch) == "ok"
+        assert len(calls) == 2
+
+    async def test_get_is_synchronous(self):
+        """Test reads return the value directly and update the stats."""
+        cache = AsyncCache()
+        await cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Test a full cache evicts the entry read least recently."""
+        cache = AsyncCache(maxsize=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        cache.get("a")
+        await cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    async def test_expired_entry_is_a_miss(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = AsyncCache(ttl=10)
+        with patch("google_workspace_mcp.utils.cache.time.monotonic", return_value=100.0):
+            await cache.set("key", "value")
+        with patch("google_workspace_mcp.utils.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+        assert cache.get_stats()["size"] == 0
+
+    async def test_entry_ttl_overrides_cache_ttl(self):
+        """Test each entry keeps the TTL it was stored with."""
+        cache = AsyncCache(ttl=300)
+        with patch("google_workspace_mcp.utils.cache.time.monotonic", return_value=100.0):
+            await cache.set("short", 1, ttl=60)
+            await cache.set("default", 2)
+        with patch("google_workspace_mcp.utils.cache.time.monotonic", return_value=200.0):
+            assert cache.get("short") is None
+            assert cache.get("default") == 2
+
+    async def test_long_keys_are_shortened(self):
+        """Test long keys keep a readable prefix and stay distinct."""
+        short = cache_key("gmail_read", "18a1b2c3")
+        first = cache_key("gmail_search", "x" * 500)
+        second = cache_key("gmail_search", "x" * 499 + "y")
+
+        assert short == "gmail_read:18a1b2c3"
+        assert first.startswith("gmail_search:")
+        assert len(first) < 200
+        assert first != second
+        assert first == cache_key("gmail_search", "x" * 500)
@@ -0,0 +1,92 @@
+"""Tests for batched Drive operations."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from google_workspace_mcp.services.drive_service import DriveService, DRIVE_BATCH_SIZE
+from google_workspace_mcp.tools.drive_tools import DriveBatchInput, drive_batch
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers requests in reverse order."""
+
+    instances = []
+    failing = set()
+
+    def __init__(self, callback, batch_uri):
+        self.callback = callback
+        self.request_ids = []
+        FakeBatch.instances.append(self)
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in reversed(self.request_ids):
+            if request_id in FakeBatch.failing:
+                self.callback(request_id, None, Exception(f"failed {request_id}"))
+            else:
+                self.callback(request_id, {'id': f"file-{request_id}", 'name': f"name-{request_id}"}, None)
+
+
+@pytest.fixture
+def drive():
+    """DriveService backed by a mock API client and FakeBatch."""
+    FakeBatch.instances = []
+    FakeBatch.failing = set()
+    with patch('google_workspace_mcp.services.drive_service.get_oauth_handler'):
+        service = DriveService()
+    service._service = MagicMock()
+    with patch('google_workspace_mcp.services.drive_service.BatchHttpRequest', FakeBatch):
+        yield service
+
+
+@pytest.mark.asyncio
+class TestDriveBatch:
+    """Test per-operation results of drive_batch."""
+
+    async def test_results_keep_input_order_across_batches(self, drive):
+        """Test operations are split by DRIVE_BATCH_SIZE and mapped back by index."""
+        count = DRIVE_BATCH_SIZE * 2 + 5
+        operations = [{'op': 'delete', 'file_id': f"f{i}"} for i in range(count)]
+
+        results = await drive.batch(operations)
+
+        assert [len(batch.request_ids) for batch in FakeBatch.instances] == [
+            DRIVE_BATCH_SIZE, DRIVE_BATCH_SIZE, 5
+        ]
+        assert [result['index'] for result in results] == list(range(count))
+        assert all(result['result']['id'] == f"file-{i}" for i, result in enumerate(results))
+
+    async def test_mixed_success_and_failure(self, drive):
+        """Test failed callbacks are reported without affecting their neighbours."""
+        FakeBatch.failing = {'1'}
+        operations = [
+            {'op': 'update', 'file_id': 'a', 'name': 'renamed'},
+            {'op': 'delete', 'file_id': 'b'},
+            {'op': 'create_metadata', 'name': 'folder'}
+        ]
+
+        results = await drive.batch(operations)
+
+        assert [result['success'] for result in results] == [True, False, True]
+        assert [result['op'] for result in results] == ['update', 'delete', 'create_metadata']
+        assert results[1]['error'] == 'failed 1'
+
+    async def test_tool_reports_each_operation(self, drive):
+        """Test drive_batch summarizes successes and failures in input order."""
+        FakeBatch.failing = {'0'}
+        params = DriveBatchInput(
+            operations=[
+                {'op': 'delete', 'file_id': 'gone'},
+                {'op': 'update', 'file_id': 'kept', 'name': 'new'}
+            ],
+            response_format='json'
+        )
+
+        with patch('google_workspace_mcp.tools.drive_tools._service', return_value=drive):
+            response = json.loads(await drive_batch(params))
+
+        assert response['succeeded'] == 1
+        assert response['failed'] == 1
+        assert [result['success'] for result in response['results']] == [False, True]
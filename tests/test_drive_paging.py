@@ -0,0 +1,74 @@
+"""Tests for Drive listing pagination."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from google_workspace_mcp.services.drive_service import DriveService
+
+
+@pytest.fixture
+def drive():
+    """DriveService backed by a mock API client."""
+    with patch('google_workspace_mcp.services.drive_service.get_oauth_handler'):
+        service = DriveService()
+    service._service = MagicMock()
+    return service
+
+
+def _pages(method, *pages):
+    """Make successive calls to a list method return the given pages."""
+    method.return_value.execute.side_effect = list(pages)
+    return method
+
+
+@pytest.mark.asyncio
+class TestDrivePaging:
+    """Test page tokens and offset skipping."""
+
+    async def test_next_page_token_is_returned_with_the_page(self, drive):
+        """Test the API's nextPageToken is passed through to the caller."""
+        _pages(drive.service.files().list, {'files': [{'id': 'a'}], 'nextPageToken': 'next'})
+
+        result = await drive.search_files(query='token passthrough', max_results=1)
+
+        assert result == {'files': [{'id': 'a'}], 'next_page_token': 'next'}
+
+    async def test_offset_counts_items_returned_on_short_pages(self, drive):
+        """Test skipping subtracts the items Drive returned, not the page size."""
+        list_method = _pages(
+            drive.service.files().list,
+            {'files': [{'id': '1'}, {'id': '2'}], 'nextPageToken': 't1'},
+            {'files': [{'id': '3'}, {'id': '4'}, {'id': '5'}], 'nextPageToken': 't2'},
+            {'files': [{'id': '6'}], 'nextPageToken': None}
+        )
+
+        result = await drive.search_files(query='short pages', max_results=10, offset=5)
+
+        page_calls = [call.kwargs for call in list_method.call_args_list if call.kwargs]
+        assert [call['pageSize'] for call in page_calls] == [5, 3, 10]
+        assert [call['pageToken'] for call in page_calls] == [None, 't1', 't2']
+        assert page_calls[0]['fields'] == 'nextPageToken,files(id)'
+        assert result == {'files': [{'id': '6'}], 'next_page_token': None}
+
+    async def test_offset_past_the_end_returns_an_empty_page(self, drive):
+        """Test a listing that ends before the offset returns no files."""
+        list_method = _pages(drive.service.files().list, {'files': [{'id': '1'}]})
+
+        result = await drive.search_files(query='past the end', offset=50)
+
+        assert result == {'files': [], 'next_page_token': None}
+        assert list_method.return_value.execute.call_count == 1
+
+    async def test_shared_drive_offset_requests_only_ids(self, drive):
+        """Test shared drive skipping asks for drive IDs and page tokens only."""
+        list_method = _pages(
+            drive.service.drives().list,
+            {'drives': [{'id': 'd1'}], 'nextPageToken': 't1'},
+            {'drives': [{'id': 'd2', 'name': 'Team'}], 'nextPageToken': 't2'}
+        )
+
+        result = await drive.list_shared_drives(offset=1)
+
+        skip_call = next(call.kwargs for call in list_method.call_args_list if call.kwargs)
+        assert skip_call['fields'] == 'nextPageToken,drives(id)'
+        assert result['drives'] == [{'id': 'd2', 'name': 'Team'}]
+        assert result['next_page_token'] == 't2'
@@ -17,8 +17,8 @@ class TestDriveService:
         service = DriveService()
         results = await service.search_files(query="test")
 
-        assert len(results) == 1
-        assert results[0]['name'] == 'test.txt'
+        assert len(results['files']) == 1
+        assert results['files'][0]['name'] == 'test.txt'
         mock_drive_service.files().list.assert_called_once()
 
     @patch('src.services.drive_service.OAuthHandler')
@@ -81,8 +81,8 @@ class TestDriveService:
         service = DriveService()
         drives = await service.list_shared_drives()
 
-        assert len(drives) == 1
-        assert drives[0]['name'] == 'Shared Drive'
+        assert len(drives['drives']) == 1
+        assert drives['drives'][0]['name'] == 'Shared Drive'
         mock_drive_service.drives().list.assert_called_once()
 
     @patch('src.services.drive_service.OAuthHandler')
@@ -98,7 +98,7 @@ class TestDriveService:
             max_results=10
         )
 
-        assert len(results) == 1
+        assert len(results['files']) == 1
         call_args = mock_drive_service.files().list.call_args
         assert 'q' in call_args[1]
 
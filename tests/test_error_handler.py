@@ -0,0 +1,50 @@
+"""Tests for error handling utilities."""
+
+from unittest.mock import Mock
+from google.api_core import exceptions as google_exceptions
+from googleapiclient.errors import HttpError
+from google_workspace_mcp.utils.error_handler import (
+    AuthenticationError,
+    GoogleWorkspaceError,
+    InvalidRequestError,
+    RateLimitError,
+    ResourceNotFoundError,
+    handle_google_api_error
+)
+
+
+class TestHandleGoogleApiError:
+    """Test conversion of Google API errors."""
+
+    def test_grpc_subclasses_map_through_mro(self):
+        """Test api_core errors map via their HTTP status base class."""
+        assert isinstance(
+            handle_google_api_error(google_exceptions.Unauthenticated("x")),
+            AuthenticationError
+        )
+        assert isinstance(
+            handle_google_api_error(google_exceptions.InvalidArgument("x")),
+            InvalidRequestError
+        )
+
+    def test_http_errors_map_by_status(self):
+        """Test googleapiclient HttpErrors map by response status."""
+        error = HttpError(Mock(status=404, reason="Not Found"), b"{}")
+        converted = handle_google_api_error(error)
+
+        assert isinstance(converted, ResourceNotFoundError)
+        assert converted.original_error is error
+
+    def test_rate_limit_details_are_not_shared(self):
+        """Test each rate limit error gets its own details dict."""
+        first = handle_google_api_error(google_exceptions.TooManyRequests("x"))
+        first.details["retry_after"] = 0
+        second = handle_google_api_error(google_exceptions.ResourceExhausted("x"))
+
+        assert isinstance(second, RateLimitError)
+        assert second.details == {"retry_after": 60}
+
+    def test_unmapped_error_is_generic(self):
+        """Test unknown statuses fall back to the generic error."""
+        converted = handle_google_api_error(google_exceptions.InternalServerError("x"))
+        assert type(converted) is GoogleWorkspaceError
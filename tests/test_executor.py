@@ -0,0 +1,32 @@
+"""Tests for executor helpers."""
+
+import threading
+import pytest
+from unittest.mock import MagicMock
+from google_workspace_mcp.utils.executor import execute, run_blocking
+
+
+@pytest.mark.asyncio
+class TestExecutor:
+    """Test executor helpers."""
+
+    async def test_execute_runs_off_event_loop(self):
+        """Test request.execute() runs in a worker thread."""
+        caller = threading.get_ident()
+        request = MagicMock()
+        request.execute.side_effect = lambda: threading.get_ident()
+
+        worker = await execute(request)
+
+        assert worker != caller
+        request.execute.assert_called_once_with()
+
+    async def test_run_blocking_passes_arguments(self):
+        """Test arguments are forwarded to the blocking function."""
+        result = await run_blocking(lambda a, b=0: a + b, 1, b=2)
+        assert result == 3
+
+    async def test_calls_use_dedicated_pool(self):
+        """Test calls run on the Google API worker pool."""
+        name = await run_blocking(lambda: threading.current_thread().name)
+        assert name.startswith("google-api")
@@ -0,0 +1,56 @@
+"""Tests for Gmail label name resolution."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from google_workspace_mcp.services.gmail_service import GmailService
+from google_workspace_mcp.utils.cache import cache_key, get_cache
+
+
+@pytest.fixture
+async def gmail():
+    """GmailService backed by a mock API client, with no cached labels."""
+    await get_cache("gmail").delete(cache_key("gmail_labels"))
+    with patch('google_workspace_mcp.services.gmail_service.get_oauth_handler'):
+        service = GmailService()
+    service._service = MagicMock()
+    return service
+
+
+def _label_lists(service, *label_lists):
+    """Make successive labels.list calls return the given label lists."""
+    execute = service.service.users().labels().list().execute
+    execute.side_effect = [{'labels': labels} for labels in label_lists]
+    return execute
+
+
+@pytest.mark.asyncio
+class TestLabelResolution:
+    """Test label values are mapped to IDs."""
+
+    async def test_only_system_and_user_label_ids_pass_through(self, gmail):
+        """Test all-caps user label names are resolved by name."""
+        _label_lists(gmail, [{'name': 'TODO', 'id': 'Label_7'}])
+
+        resolved = await gmail._resolve_label_ids(['INBOX', 'Label_3', 'TODO'])
+
+        assert resolved == ['INBOX', 'Label_3', 'Label_7']
+
+    async def test_new_label_is_found_by_refreshing_the_list(self, gmail):
+        """Test a name missing from the cached list triggers one fresh listing."""
+        execute = _label_lists(
+            gmail,
+            [{'name': 'Work', 'id': 'Label_1'}],
+            [{'name': 'Work', 'id': 'Label_1'}, {'name': 'New', 'id': 'Label_2'}]
+        )
+
+        assert await gmail._label_id('Work') == 'Label_1'
+        assert await gmail._label_id('New') == 'Label_2'
+        assert execute.call_count == 2
+
+    async def test_unknown_name_refreshes_only_once(self, gmail):
+        """Test repeated misses reuse the refreshed list until it expires."""
+        execute = _label_lists(gmail, [], [])
+
+        assert await gmail._label_id('Typo') == 'Typo'
+        assert await gmail._label_id('Typo') == 'Typo'
+        assert execute.call_count == 2
@@ -0,0 +1,73 @@
+"""Tests for Gmail search pagination."""
+
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock, MagicMock, patch
+from google_workspace_mcp.services.gmail_service import GmailService
+from google_workspace_mcp.tools.gmail_tools import GmailSearchInput, MAX_OFFSET
+
+
+@pytest.fixture
+def gmail():
+    """GmailService backed by a mock API client."""
+    with patch('google_workspace_mcp.services.gmail_service.get_oauth_handler'):
+        service = GmailService()
+    service._service = MagicMock()
+    service._get_metadata = AsyncMock(side_effect=lambda ids: [{'id': mid} for mid in ids])
+    return service
+
+
+def _pages(service, *pages):
+    """Make successive messages.list calls return the given pages."""
+    list_method = service.service.users().messages().list
+    list_method.return_value.execute.side_effect = list(pages)
+    return list_method
+
+
+def _messages(*ids):
+    """Build ID-only message entries."""
+    return [{'id': mid} for mid in ids]
+
+
+@pytest.mark.asyncio
+class TestGmailPaging:
+    """Test page tokens and offset skipping."""
+
+    async def test_page_is_returned_with_next_page_token(self, gmail):
+        """Test the result carries the messages and the API's nextPageToken."""
+        _pages(gmail, {'messages': _messages('a', 'b'), 'nextPageToken': 'next'})
+
+        result = await gmail.search_messages(query='token shape', max_results=2)
+
+        assert result == {'messages': _messages('a', 'b'), 'next_page_token': 'next'}
+
+    async def test_offset_counts_messages_returned_on_short_pages(self, gmail):
+        """Test skipping subtracts the messages returned, not the page size."""
+        list_method = _pages(
+            gmail,
+            {'messages': _messages('1', '2'), 'nextPageToken': 't1'},
+            {'messages': _messages('3', '4'), 'nextPageToken': 't2'},
+            {'messages': _messages('5')}
+        )
+
+        result = await gmail.search_messages(query='short pages', max_results=5, offset=4)
+
+        calls = [call.kwargs for call in list_method.call_args_list if call.kwargs]
+        assert [call['maxResults'] for call in calls] == [4, 2, 5]
+        assert calls[0]['fields'] == 'nextPageToken,messages(id)'
+        assert calls[2]['pageToken'] == 't2'
+        assert result == {'messages': _messages('5'), 'next_page_token': None}
+
+    async def test_results_ending_before_offset_return_an_empty_page(self, gmail):
+        """Test a listing that runs out before the offset returns no messages."""
+        _pages(gmail, {'messages': _messages('1', '2')})
+
+        result = await gmail.search_messages(query='past the end', offset=10)
+
+        assert result == {'messages': [], 'next_page_token': None}
+        gmail._get_metadata.assert_not_called()
+
+    async def test_offset_is_capped(self):
+        """Test offsets above MAX_OFFSET are rejected."""
+        with pytest.raises(ValidationError):
+            GmailSearchInput(offset=MAX_OFFSET + 1)
@@ -17,8 +17,8 @@ class TestGmailService:
         service = GmailService()
         results = await service.search_messages(query="test")
 
-        assert len(results) == 1
-        assert results[0]['id'] == 'msg1'
+        assert len(results['messages']) == 1
+        assert results['messages'][0]['id'] == 'msg1'
         mock_gmail_service.users().messages().list.assert_called_once()
 
     @patch('src.services.gmail_service.OAuthHandler')
@@ -114,7 +114,7 @@ class TestGmailService:
             label_ids=['INBOX', 'UNREAD']
         )
 
-        assert len(results) == 1
+        assert len(results['messages']) == 1
         call_args = mock_gmail_service.users().messages().list.call_args
         assert 'q' in call_args[1]
         assert 'labelIds' in call_args[1]
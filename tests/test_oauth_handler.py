@@ -0,0 +1,97 @@
+"""Tests for OAuth handler."""
+
+import json
+import pickle
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from google.oauth2.credentials import Credentials
+from google_workspace_mcp.auth.oauth_handler import OAuthHandler
+
+
+class TestOAuthHandler:
+    """Test OAuth handler."""
+
+    @pytest.fixture
+    def handler(self, tmp_path, mock_credentials):
+        handler = OAuthHandler(config_dir=tmp_path)
+        handler.credentials = mock_credentials
+        return handler
+
+    @patch('google_workspace_mcp.auth.oauth_handler.build')
+    def test_get_service_is_cached(self, mock_build, handler):
+        """Test services are built once per name and version."""
+        first = handler.get_service('drive', 'v3')
+        second = handler.get_service('drive', 'v3')
+
+        assert first is second
+        assert mock_build.call_count == 1
+
+        handler.get_service('gmail', 'v1')
+        assert mock_build.call_count == 2
+
+    @patch('google_workspace_mcp.auth.oauth_handler.build')
+    def test_revoke_clears_services(self, mock_build, handler):
+        """Test revoking credentials drops built services."""
+        handler.get_service('drive', 'v3')
+        handler.revoke_credentials()
+
+        assert handler.credentials is None
+        assert handler._services == {}
+
+    def test_credentials_round_trip_json(self, tmp_path):
+        """Test credentials are stored as JSON and reloaded."""
+        handler = OAuthHandler(config_dir=tmp_path)
+        creds = Credentials(
+            token='token',
+            refresh_token='refresh',
+            token_uri='https://oauth2.googleapis.com/token',
+            client_id='client',
+            client_secret='secret',
+            expiry=datetime(2030, 1, 1)
+        )
+
+        handler.save_credentials(creds)
+        loaded = handler.load_credentials()
+
+        assert json.loads(handler.token_path.read_text())['token'] == 'token'
+        assert loaded.refresh_token == 'refresh'
+        assert loaded.expiry == datetime(2030, 1, 1)
+
+    def test_legacy_pickle_token_is_migrated(self, tmp_path):
+        """Test pickle tokens from older versions are converted to JSON."""
+        handler = OAuthHandler(config_dir=tmp_path)
+        creds = Credentials(token='token', refresh_token='refresh')
+        with open(handler.legacy_token_path, 'wb') as f:
+            pickle.dump(creds, f)
+
+        loaded = handler.load_credentials()
+
+        assert loaded.token == 'token'
+        assert handler.token_path.exists()
+        assert not handler.legacy_token_path.exists()
+
+    def test_authenticate_silently_without_token(self, tmp_path):
+        """Test silent authentication never starts the browser flow."""
+        handler = OAuthHandler(config_dir=tmp_path)
+
+        with patch('google_workspace_mcp.auth.oauth_handler.InstalledAppFlow') as flow:
+            assert handler.authenticate_silently() is False
+
+        flow.from_client_secrets_file.assert_not_called()
+        assert handler.credentials is None
+
+    def test_authenticate_silently_with_stored_token(self, tmp_path):
+        """Test silent authentication loads a valid stored token."""
+        handler = OAuthHandler(config_dir=tmp_path)
+        handler.save_credentials(Credentials(
+            token='token',
+            refresh_token='refresh',
+            token_uri='https://oauth2.googleapis.com/token',
+            client_id='client',
+            client_secret='secret',
+            expiry=datetime(2030, 1, 1)
+        ))
+
+        assert handler.authenticate_silently() is True
+        assert handler.credentials.token == 'token'
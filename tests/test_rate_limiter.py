@@ -0,0 +1,48 @@
+"""Tests for rate limiting utilities."""
+
+import asyncio
+import time
+import pytest
+from google_workspace_mcp.utils.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    """Test RateLimiter behaviour."""
+
+    async def test_waits_for_a_token_when_bucket_is_empty(self):
+        """Test an exhausted limiter waits for a refill instead of failing."""
+        limiter = RateLimiter(max_requests=10, time_window=1, burst_limit=100)
+        for _ in range(10):
+            await limiter.acquire()
+
+        start = time.monotonic()
+        assert await asyncio.wait_for(limiter.acquire(), timeout=1) is True
+
+        assert time.monotonic() - start >= 0.05
+
+    async def test_concurrent_acquires_respect_burst_limit(self):
+        """Test concurrent callers never exceed burst_limit per second."""
+        limiter = RateLimiter(max_requests=100, time_window=1, burst_limit=3)
+        granted = []
+
+        async def call():
+            await limiter.acquire()
+            granted.append(time.monotonic())
+
+        await asyncio.wait_for(asyncio.gather(*(call() for _ in range(7))), timeout=5)
+
+        granted.sort()
+        for i in range(len(granted) - limiter.burst_limit):
+            assert granted[i + limiter.burst_limit] - granted[i] >= 1.0 - 0.01
+
+    async def test_stats_report_used_tokens(self):
+        """Test statistics count tokens taken from the bucket."""
+        limiter = RateLimiter(max_requests=100, time_window=3600)
+        for _ in range(5):
+            await limiter.acquire()
+
+        stats = limiter.get_stats()
+
+        assert stats["active_requests"] == 5
+        assert stats["utilization"] == pytest.approx(0.05, abs=0.01)
@@ -0,0 +1,46 @@
+"""Tests for response formatting utilities."""
+
+import json
+
+from google_workspace_mcp.utils.response_formatter import (
+    CHARACTER_LIMIT,
+    ResponseFormat,
+    format_file_list,
+    to_json,
+    to_json_line,
+    truncation_notice
+)
+
+
+class TestResponseFormatter:
+    """Test response formatting helpers."""
+
+    def test_truncation_notice(self):
+        """Test truncation notice with and without a tip."""
+        notice = truncation_notice("Document content")
+        assert "Document content exceeds character limit (25,000 chars)." in notice
+        assert "**Tip**" not in notice
+
+        notice = truncation_notice("Document content", "Read less.")
+        assert notice.endswith("\n\n**Tip**: Read less.")
+
+    def test_to_json(self):
+        """Test JSON output is indented and keeps non-ASCII text."""
+        output = to_json({"title": "회의록", "ids": [1, 2]})
+        assert output.startswith('{\n  "title": "회의록"')
+        assert json.loads(output) == {"title": "회의록", "ids": [1, 2]}
+
+    def test_to_json_line(self):
+        """Test JSON Lines values are compact and single-line."""
+        output = to_json_line(["회의록", 1, None])
+        assert "\n" not in output
+        assert json.loads(output) == ["회의록", 1, None]
+
+    def test_format_file_list_stays_within_limit(self):
+        """Test large markdown file lists stop at the character limit."""
+        files = [{"id": f"id{i}", "name": "x" * 200, "mimeType": "text/plain"} for i in range(500)]
+
+        output = format_file_list(files, ResponseFormat.MARKDOWN)
+
+        assert len(output) <= CHARACTER_LIMIT
+        assert "of 500 files" in output
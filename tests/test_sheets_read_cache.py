@@ -0,0 +1,46 @@
+"""Tests for Sheets read caching across writes."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from google_workspace_mcp.services.sheets_service import SheetsService
+
+
+@pytest.fixture
+def sheets():
+    """SheetsService backed by a mock API client."""
+    with patch('google_workspace_mcp.services.sheets_service.get_oauth_handler'):
+        service = SheetsService()
+    service._service = MagicMock()
+    return service
+
+
+@pytest.mark.asyncio
+class TestSheetsReadCache:
+    """Test cached reads are not served after a write."""
+
+    async def test_read_after_update_ranges_sees_new_values(self, sheets):
+        """Test a batch update makes the next read fetch again."""
+        values = sheets.service.spreadsheets().values()
+        values.get().execute.side_effect = [{'values': [['old']]}, {'values': [['new']]}]
+
+        first = await sheets.read_range('sheet-update', 'A1')
+        assert (await sheets.read_range('sheet-update', 'A1')) == first
+        await sheets.update_ranges('sheet-update', {'A1': [['new']]})
+
+        assert (await sheets.read_range('sheet-update', 'A1'))['values'] == [['new']]
+        assert values.get().execute.call_count == 2
+
+    async def test_read_ranges_after_clear_sees_cleared_values(self, sheets):
+        """Test clearing a range makes the next batch read fetch again."""
+        values = sheets.service.spreadsheets().values()
+        values.batchGet().execute.side_effect = [
+            {'valueRanges': [{'range': 'A1', 'values': [['x']]}]},
+            {'valueRanges': [{'range': 'A1'}]}
+        ]
+
+        await sheets.read_ranges('sheet-clear', ['A1'])
+        await sheets.clear_range('sheet-clear', 'A1')
+        result = await sheets.read_ranges('sheet-clear', ['A1'])
+
+        assert result['value_ranges'][0]['values'] == []
+        assert values.batchGet().execute.call_count == 2
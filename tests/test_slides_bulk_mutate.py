@@ -0,0 +1,69 @@
+"""Tests for bulk slide insertion and deletion."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from google_workspace_mcp.services.slides_service import SlidesService
+from google_workspace_mcp.tools.slides_tools import SlidesBulkMutateInput, slides_bulk_mutate
+from google_workspace_mcp.utils.cache import get_cache
+
+
+@pytest.fixture
+def slides():
+    """SlidesService backed by a mock API client, used by the Slides tools."""
+    with patch('google_workspace_mcp.services.slides_service.get_oauth_handler'):
+        service = SlidesService()
+    service._service = MagicMock()
+    with patch('google_workspace_mcp.tools.slides_tools._service', return_value=service):
+        yield service
+
+
+@pytest.mark.asyncio
+class TestSlidesBulkMutate:
+    """Test slides_bulk_mutate."""
+
+    async def test_operations_are_sent_as_one_batch_update(self, slides):
+        """Test inserts and deletes become one batchUpdate and report new slide IDs."""
+        batch_update = slides.service.presentations().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            'replies': [
+                {'createSlide': {'objectId': 'new_1'}},
+                {},
+                {'createSlide': {'objectId': 'new_2'}}
+            ]
+        }
+        params = SlidesBulkMutateInput(
+            presentation_id='pres_bulk',
+            operations=[
+                {'action': 'insert', 'slide_index': 0},
+                {'action': 'delete', 'slide_id': 'old_1'},
+                {'action': 'insert'}
+            ],
+            response_format='json'
+        )
+
+        response = json.loads(await slides_bulk_mutate(params))
+
+        batch_update.assert_called_once_with(
+            presentationId='pres_bulk',
+            body={'requests': [
+                {'createSlide': {'insertionIndex': 0}},
+                {'deleteObject': {'objectId': 'old_1'}},
+                {'createSlide': {}}
+            ]}
+        )
+        assert response['data']['inserted_slide_ids'] == ['new_1', 'new_2']
+        assert response['data']['deleted_slide_ids'] == ['old_1']
+
+    async def test_rendered_responses_are_cleared(self, slides):
+        """Test the memoized slides_read responses are dropped after a change."""
+        slides.service.presentations().batchUpdate.return_value.execute.return_value = {'replies': [{}]}
+        responses = get_cache("slides_responses")
+        await responses.set("rendered", "stale")
+
+        await slides_bulk_mutate(SlidesBulkMutateInput(
+            presentation_id='pres_clear',
+            operations=[{'action': 'delete', 'slide_id': 'old_1'}]
+        ))
+
+        assert responses.get("rendered") is None
@@ -45,7 +45,7 @@ class TestSlidesService:
             insertion_index=1
         )
 
-        assert 'replies' in result
+        assert result['slide_id'] == 'new_slide'
         mock_slides_service.presentations().batchUpdate.assert_called_once()
 
     @patch('src.services.slides_service.OAuthHandler')